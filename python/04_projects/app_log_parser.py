@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Application Log Parser - Project Implementation
+
+Parses application logs in the two formats from the lessons:
+
+    [2023-12-25 10:30:45] ERROR: Database connection failed
+        (intermediate_exercises.exercise_6_parse_log_entry)
+    2023-12-25 10:30:45 [ERROR] Database connection failed
+        (complex_patterns.example_log_parsing_named_groups)
+
+The first character of a line picks the format, so each line is matched
+against one compiled pattern. When only some levels are wanted, the level
+token is located with str.find and checked before the full match; lines
+at other levels never reach the regex. Input is streamed line by line,
+and per-level and per-minute counters are kept as entries go by.
+
+Entries can also be assembled into multi-line records: a line matching
+RECORD_START at its first character opens a record, and the lines after
+it that do not (a Python or Java stack trace, say) are attached to it.
+Records are grouped incrementally, so a file being written can be
+followed, and a large file can be split into byte ranges parsed in a
+process pool; each range owns the records that start inside it.
+
+Usage:
+    python app_log_parser.py app.log
+    python app_log_parser.py app.log --level ERROR --level WARNING
+    python app_log_parser.py app.log --stats
+    python app_log_parser.py app.log --records --workers 4
+    python app_log_parser.py app.log --records --follow --level ERROR
+    python app_log_parser.py --benchmark
+"""
+
+import argparse
+import csv
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import patterns
+
+BRACKETED_PATTERN = r'\[(?P<timestamp>[^\]]+)\]\s+(?P<level>\w+):\s+(?P<message>.*)'
+PLAIN_PATTERN = (r'(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+'
+                 r'\[(?P<level>\w+)\]\s+(?P<message>.*)')
+
+BRACKETED = patterns.compile(BRACKETED_PATTERN)
+PLAIN = patterns.compile(PLAIN_PATTERN)
+
+# Start of a record in either format, matched at the first character of a raw line
+RECORD_START = patterns.compile(
+    r'\[[^\]]+\]\s+\w+:\s|\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s+\[\w+\]\s')
+
+# Bytes per range when parsing records in a process pool
+CHUNK_SIZE = 8 << 20
+
+
+def level_token(line):
+    """
+    Return the level of a line in either format without running a regex.
+
+    For any line the patterns match this is the matched level; for
+    other lines it may be anything, including ''.
+    """
+    if line.startswith('['):
+        close = line.find(']')
+        if close < 0:
+            return ''
+        colon = line.find(':', close)
+        return line[close + 1:colon].strip() if colon > 0 else ''
+    start = line.find('[')
+    end = line.find(']', start)
+    return line[start + 1:end] if start > 0 and end > 0 else ''
+
+
+def parse_line(line):
+    """
+    Parse one log line in either format.
+
+    Returns a dict with 'timestamp', 'level' and 'message', or None if
+    the line matches neither format.
+    """
+    match = (BRACKETED if line.startswith('[') else PLAIN).match(line)
+    return match.groupdict() if match else None
+
+
+class LogStats:
+    """
+    Counters over parsed entries.
+
+    One counter is kept per (minute, level) as entries arrive; the
+    per-level and per-minute views are summed from it on demand. Minutes
+    are the first 16 characters of the timestamp ('YYYY-MM-DD HH:MM') and
+    levels are upper-cased in the views.
+    """
+
+    def __init__(self):
+        self.counts = Counter()  # (minute, level as written) -> entries
+
+    def add(self, entry):
+        self.counts[entry['timestamp'][:16], entry['level']] += 1
+
+    def update(self, entries):
+        for entry in entries:
+            self.add(entry)
+        return self
+
+    @property
+    def entries(self):
+        return sum(self.counts.values())
+
+    @property
+    def levels(self):
+        """Counter of entries per level."""
+        levels = Counter()
+        for (_, level), count in self.counts.items():
+            levels[level.upper()] += count
+        return levels
+
+    def by_minute(self):
+        """Return {minute: Counter of entries per level}, in time order."""
+        minutes = defaultdict(Counter)
+        for (minute, level), count in sorted(self.counts.items()):
+            minutes[minute][level.upper()] += count
+        return dict(minutes)
+
+    def busiest(self, n=10):
+        """Return [(minute, total, {level: count})] for the n busiest minutes."""
+        minutes = self.by_minute()
+        totals = Counter({minute: sum(levels.values()) for minute, levels in minutes.items()})
+        return [(minute, total, dict(minutes[minute])) for minute, total in totals.most_common(n)]
+
+    def to_dict(self):
+        return {
+            'entries': self.entries,
+            'levels': dict(self.levels),
+            'minutes': {minute: dict(levels) for minute, levels in self.by_minute().items()}
+        }
+
+
+class AppLogParser:
+    """
+    Streaming parser with a level filter and running counters.
+
+    Args:
+        levels: only yield entries at these levels (case-insensitive;
+            None = all levels)
+    """
+
+    def __init__(self, levels=None):
+        self.levels = {level.upper() for level in levels} if levels else None
+        self.stats = LogStats()
+        self.lines = 0       # non-blank lines read
+        self.filtered = 0    # rejected by the level token alone
+        self.unparsed = 0    # at a wanted level (or unfiltered) but malformed
+
+    def parse(self, lines):
+        """
+        Yield entry dicts (with 'line_number') from an iterable of lines.
+
+        Entries are added to self.stats as they are yielded.
+        """
+        levels = self.levels
+        counts = self.stats.counts
+        for line_number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            self.lines += 1
+            if levels is not None and level_token(line).upper() not in levels:
+                self.filtered += 1
+                continue
+            match = (BRACKETED if line[0] == '[' else PLAIN).match(line)
+            if match is None:
+                self.unparsed += 1
+                continue
+            entry = match.groupdict()
+            entry['line_number'] = line_number
+            counts[entry['timestamp'][:16], entry['level']] += 1
+            yield entry
+
+    def parse_file(self, filename):
+        """Yield entries from a file, read line by line."""
+        with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+            yield from self.parse(f)
+
+    def parse_records(self, lines, first_line=1):
+        """
+        Yield one entry per record from an iterable of lines.
+
+        The lines following a record's first line that do not match
+        RECORD_START are kept, with their indentation, in
+        entry['continuation']. Continuation lines of records dropped by
+        the level filter are dropped with them; non-blank lines before the
+        first record are counted as unparsed. A None in lines (see
+        follow()) marks a pause in the input: the record in progress is
+        yielded at once instead of when the next record starts.
+        """
+        levels = self.levels
+        counts = self.stats.counts
+        entry = None
+        attached = False  # whether continuation lines have a record to go to
+        line_number = first_line - 1
+        for line in lines:
+            if line is None:
+                if entry is not None:
+                    yield entry
+                entry = None
+                attached = False
+                continue
+            line_number += 1
+            if not RECORD_START.match(line):
+                if line.strip():
+                    self.lines += 1
+                    if entry is not None:
+                        entry['continuation'].append(line.rstrip('\r\n'))
+                    elif not attached:
+                        self.unparsed += 1
+                continue
+
+            self.lines += 1
+            if entry is not None:
+                yield entry
+            entry = None
+            attached = True
+            line = line.strip()
+            if levels is not None and level_token(line).upper() not in levels:
+                self.filtered += 1
+                continue
+            match = (BRACKETED if line[0] == '[' else PLAIN).match(line)
+            if match is None:
+                self.unparsed += 1
+                continue
+            entry = match.groupdict()
+            entry['line_number'] = line_number
+            entry['continuation'] = []
+            counts[entry['timestamp'][:16], entry['level']] += 1
+        if entry is not None:
+            yield entry
+
+    def parse_file_records(self, filename, workers=None, chunk_size=CHUNK_SIZE):
+        """
+        Yield records from a file in file order.
+
+        With workers set, the file is cut into byte ranges of chunk_size
+        parsed in a process pool, at most two ranges per worker in
+        flight. Counters and line numbers are merged as results arrive.
+        Either way lines end at '\n' only; a bare '\r' stays inside its
+        line.
+        """
+        if not workers:
+            # Lines end at '\n' only, as in the byte ranges of _parse_range
+            with open(filename, 'r', encoding='utf-8', errors='ignore', newline='\n') as f:
+                yield from self.parse_records(f)
+            return
+
+        size = os.path.getsize(filename)
+        before = 0  # lines starting before the range being merged
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for start in range(0, size, chunk_size):
+                pending.append(pool.submit(_parse_range, filename, start,
+                                           start + chunk_size, self.levels))
+                if len(pending) >= workers * 2:
+                    before = yield from self._merge(pending.popleft().result(), before)
+            while pending:
+                before = yield from self._merge(pending.popleft().result(), before)
+
+    def _merge(self, result, before):
+        """Add one range's counters, yield its entries; returns the new line offset."""
+        entries, owned, part = result
+        self.lines += part.lines
+        self.filtered += part.filtered
+        self.unparsed += part.unparsed
+        self.stats.counts.update(part.stats.counts)
+        for entry in entries:
+            entry['line_number'] += before
+            yield entry
+        return before + owned
+
+
+def _parse_range(filename, start, end, levels):
+    """
+    Parse the records that start in bytes [start, end) of filename.
+
+    Lines are owned by the range their first byte falls in. Leading lines
+    that continue a record from an earlier range are skipped, and lines
+    past end are read until the next record start to complete the last
+    record. Returns (entries with line numbers counted from the range's
+    first line, number of lines owned, parser with the range's counters).
+    """
+    parser = AppLogParser(levels)
+    with open(filename, 'rb') as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # the line holding byte start - 1 belongs to the previous range
+        position = f.tell()
+        lines = []
+        while position < end:
+            raw = f.readline()
+            if not raw:
+                break
+            position += len(raw)
+            lines.append(raw.decode('utf-8', 'ignore'))
+        owned = len(lines)
+
+        skip = 0
+        if start:
+            while skip < owned and not RECORD_START.match(lines[skip]):
+                skip += 1
+        if skip == owned:
+            return [], owned, parser
+        for raw in f:
+            line = raw.decode('utf-8', 'ignore')
+            if RECORD_START.match(line):
+                break
+            lines.append(line)
+
+    entries = list(parser.parse_records(lines[skip:], first_line=skip + 1))
+    return entries, owned, parser
+
+
+def follow(filename, interval=0.5, idle=2.0, from_start=False):
+    """
+    Yield lines as they are appended to a file, like tail -f.
+
+    Runs until the caller stops iterating. Only complete lines are
+    yielded. After idle seconds without new lines a single None is
+    yielded, which makes parse_records() emit the record in progress.
+    """
+    with open(filename, 'r', encoding='utf-8', errors='ignore', newline='\n') as f:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        partial = ''
+        quiet = 0.0
+        flushed = True
+        while True:
+            line = f.readline()
+            if line:
+                partial += line
+                if partial.endswith('\n'):
+                    yield partial
+                    partial = ''
+                    quiet = 0.0
+                    flushed = False
+                continue
+            if not flushed and quiet >= idle:
+                yield None
+                flushed = True
+            time.sleep(interval)
+            quiet += interval
+
+
+def save_to_csv(entries, output_file):
+    """Write entries (or records) to a CSV file; returns the number written."""
+    count = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['line_number', 'timestamp', 'level', 'message',
+                                               'continuation'])
+        writer.writeheader()
+        for entry in entries:
+            writer.writerow({**entry, 'continuation': '\n'.join(entry.get('continuation', ()))})
+            count += 1
+    return count
+
+
+def print_stats(parser, top=10):
+    stats = parser.stats
+    print(f"Lines: {parser.lines}  entries: {stats.entries}  "
+          f"filtered by level: {parser.filtered}  unparsed: {parser.unparsed}")
+    print("\nLevels:")
+    for level, count in stats.levels.most_common():
+        print(f"  {level:<10} {count:>10}")
+    print("\nBusiest minutes:")
+    for minute, total, levels in stats.busiest(top):
+        breakdown = ', '.join(f"{level} {count}" for level, count in
+                              sorted(levels.items(), key=lambda item: -item[1]))
+        print(f"  {minute}  {total:>8}  ({breakdown})")
+
+
+def synthetic_log(count, seed=0):
+    """Seeded log lines in both formats, mostly INFO with some ERROR."""
+    rng = random.Random(seed)
+    levels = ['INFO'] * 14 + ['DEBUG'] * 3 + ['WARNING'] * 2 + ['ERROR']
+    messages = ["Request handled in 12ms", "Cache miss for user:42",
+                "Database connection failed: timeout after 30s", "Retrying job [id=7]"]
+    lines = []
+    for i in range(count):
+        timestamp = f"2024-01-15 10:{i // 6000 % 60:02d}:{i // 100 % 60:02d}"
+        level = rng.choice(levels)
+        message = rng.choice(messages)
+        if i % 2:
+            lines.append(f"[{timestamp}] {level}: {message}\n")
+        else:
+            lines.append(f"{timestamp} [{level}] {message}\n")
+    return lines
+
+
+def _lesson_parse(lines, levels, stats):
+    """The lesson approach: try each pattern with re.match, then filter and count."""
+    entries = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        match = re.match(BRACKETED_PATTERN, line) or re.match(PLAIN_PATTERN, line)
+        if match and (levels is None or match.group('level').upper() in levels):
+            entry = {
+                'timestamp': match.group('timestamp'),
+                'level': match.group('level'),
+                'message': match.group('message'),
+                'line_number': line_number
+            }
+            stats.add(entry)
+            entries.append(entry)
+    return entries
+
+
+def benchmark(count=200000, levels=('ERROR',)):
+    """
+    Time the parser against the lesson approach on synthetic lines.
+
+    Runs once unfiltered and once filtered to levels; both sides build
+    the same entry dicts and counters. Returns a list of result dicts
+    with lines per second and whether both gave the same results.
+    """
+    lines = synthetic_log(count)
+    results = []
+    for wanted in (None, {level.upper() for level in levels}):
+        lesson_stats = LogStats()
+        start = time.perf_counter()
+        expected = _lesson_parse(lines, wanted, lesson_stats)
+        lesson_time = time.perf_counter() - start
+        parser = AppLogParser(wanted)
+        start = time.perf_counter()
+        found = list(parser.parse(lines))
+        parser_time = time.perf_counter() - start
+        results.append({
+            'levels': ','.join(sorted(wanted)) if wanted else 'all',
+            'entries': len(found),
+            'same_entries': found == expected and parser.stats.counts == lesson_stats.counts,
+            'lesson_lines_s': count / lesson_time,
+            'parser_lines_s': count / parser_time
+        })
+    return results
+
+
+def main():
+    """Print, filter or summarize an application log."""
+    parser = argparse.ArgumentParser(description="Parse application logs.")
+    parser.add_argument('file', nargs='?', help="log file")
+    parser.add_argument('--level', action='append', help="only entries at this level (repeatable)")
+    parser.add_argument('--stats', action='store_true', help="print counters instead of entries")
+    parser.add_argument('--output', help="write entries to this CSV file")
+    parser.add_argument('--records', action='store_true',
+                        help="attach continuation lines (stack traces) to their entry")
+    parser.add_argument('--follow', action='store_true',
+                        help="keep reading records as the file grows (implies --records)")
+    parser.add_argument('--workers', type=int, help="parse records in this many processes")
+    parser.add_argument('--benchmark', action='store_true', help="compare with the lesson patterns")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(f"{'Levels':<8} {'Entries':>8} {'Lesson lines/s':>15} {'Parser lines/s':>15} {'Speedup':>8}")
+        print("-" * 58)
+        for r in benchmark(levels=args.level or ('ERROR',)):
+            note = '' if r['same_entries'] else '  (MISMATCH)'
+            print(f"{r['levels']:<8} {r['entries']:>8} {r['lesson_lines_s']:>15,.0f} "
+                  f"{r['parser_lines_s']:>15,.0f} {r['parser_lines_s'] / r['lesson_lines_s']:>7.1f}x{note}")
+        return
+    if not args.file:
+        parser.error("a log file is required unless --benchmark is given")
+    if args.workers and (args.follow or not args.records):
+        parser.error("--workers needs --records and cannot be used with --follow")
+
+    log = AppLogParser(args.level)
+    try:
+        if args.follow:
+            entries = log.parse_records(follow(args.file))
+        elif args.records:
+            entries = log.parse_file_records(args.file, args.workers)
+        else:
+            entries = log.parse_file(args.file)
+        if args.output:
+            count = save_to_csv(entries, args.output)
+            print(f"✓ Saved {count} entries to {args.output}")
+        elif args.stats:
+            for _ in entries:
+                pass
+        else:
+            for entry in entries:
+                print(f"{entry['line_number']}: {entry['timestamp']} "
+                      f"[{entry['level']}] {entry['message']}")
+                for line in entry.get('continuation', ()):
+                    print(f"    {line}")
+            print()
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print()
+    print_stats(log)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Balanced Matcher - Project Implementation
+
+Finds balanced tag pairs and nested parentheses at any depth in one pass
+with a stack, replacing the lesson regexes
+
+    <(\\w+)>.*?</\\1>                 (backreferences.example_html_tags)
+    \\(([^()]+|\\([^()]*\\))*\\)         (complex_patterns.example_nested_parentheses)
+
+The first pairs a tag with the first later close tag of the same name, so
+<b><b>x</b></b> yields <b><b>x</b>, and an unclosed tag makes it scan
+to the end of the line from every opening. The second only handles two
+levels and backtracks exponentially on an unclosed parenthesis.
+
+Here a regex only finds the delimiters (in C); a stack pairs them. Each
+pair is reported as it closes, with its span and depth (0 = outermost).
+Unmatched closers are ignored; openers left unclosed when an enclosing
+tag closes, or at the end of input, are dropped. Input can be streamed in
+chunks and spans are offsets into the whole stream.
+
+Usage:
+    python balanced_matcher.py page.html --tags
+    python balanced_matcher.py source.txt --parens
+    python balanced_matcher.py --benchmark
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import patterns
+
+TAG_PATTERN = patterns.compile(r'<(/?)(\w+)(?:\s[^<>]*)?>')
+
+# A '<' with no '>' within this many characters does not start a tag
+MAX_TAG_LENGTH = 1024
+
+REGEX_TAG_PATTERN = r'<(\w+)>.*?</\1>'
+REGEX_PAREN_PATTERN = r'\(([^()]+|\([^()]*\))*\)'
+
+
+def _chunks(source):
+    """Yield str chunks from a string or an iterable of strings (e.g. a file)."""
+    if isinstance(source, str):
+        yield source
+    else:
+        yield from source
+
+
+def iter_balanced_tags(source):
+    """
+    Yield (start, end, name, depth) for each balanced tag pair.
+
+    Opening tags may carry attributes; self-closing tags (<br />) are
+    skipped. Pairs come out in closing order, innermost first.
+    """
+    stack = []  # (name, start) of open tags
+    base = 0
+    buffer = ''
+    for chunk in _chunks(source):
+        buffer += chunk
+        # Hold back a trailing '<' that may start a tag split across chunks
+        cut = buffer.rfind('<')
+        if cut < 0 or buffer.find('>', cut) >= 0 or len(buffer) - cut > MAX_TAG_LENGTH:
+            cut = len(buffer)
+        yield from _pair_tags(buffer, cut, base, stack)
+        buffer = buffer[cut:]
+        base += cut
+    yield from _pair_tags(buffer, len(buffer), base, stack)
+
+
+def _pair_tags(text, endpos, base, stack):
+    for match in TAG_PATTERN.finditer(text, 0, endpos):
+        closing, name = match.groups()
+        if not closing:
+            if not match.group().endswith('/>'):
+                stack.append((name, base + match.start()))
+            continue
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i][0] == name:
+                start = stack[i][1]
+                del stack[i:]
+                yield start, base + match.end(), name, i
+                break
+
+
+def iter_balanced_parens(source, pair='()'):
+    """
+    Yield (start, end, depth) for each balanced pair of delimiters.
+
+    pair is the opening and closing character, e.g. '[]' or '{}'. Pairs
+    come out in closing order, innermost first.
+    """
+    opener, closer = pair
+    delimiters = patterns.compile(f'[{re.escape(opener)}{re.escape(closer)}]')
+    stack = []  # start offsets of open delimiters
+    base = 0
+    for chunk in _chunks(source):
+        for match in delimiters.finditer(chunk):
+            position = base + match.start()
+            if match.group() == opener:
+                stack.append(position)
+            elif stack:
+                start = stack.pop()
+                yield start, position + 1, len(stack)
+        base += len(chunk)
+
+
+def find_balanced_tags(text):
+    """Return [(start, end, name, depth)] sorted by start."""
+    return sorted(iter_balanced_tags(text))
+
+
+def find_balanced_parens(text, pair='()'):
+    """Return [(start, end, depth)] sorted by start."""
+    return sorted(iter_balanced_parens(text, pair))
+
+
+def _regex_count(pattern, text):
+    """Count re.finditer matches (run in a worker under a deadline)."""
+    return sum(1 for _ in re.finditer(pattern, text))
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+# (name, regex, matcher, input) with inputs built from depth and copies
+BENCHMARKS = [
+    ('parens nested', REGEX_PAREN_PATTERN, 'parens',
+     lambda depth, copies: ('(' * depth + 'x' + ')' * depth + ' ') * copies),
+    ('parens unclosed', REGEX_PAREN_PATTERN, 'parens',
+     lambda depth, copies: '(' + 'x' * depth),
+    ('tags nested', REGEX_TAG_PATTERN, 'tags',
+     lambda depth, copies: ('<div>' * depth + 'x' + '</div>' * depth + ' ') * copies),
+    ('tags unclosed', REGEX_TAG_PATTERN, 'tags',
+     lambda depth, copies: '<b>x' * (depth * copies)),
+]
+
+
+def benchmark(depth=50, copies=200, timeout=5.0):
+    """
+    Time the regexes and the stack matcher on synthetic nested inputs.
+
+    Regex runs happen in a worker killed after timeout seconds. Returns a
+    list of dicts; 'regex_ms' is None when the regex timed out.
+    """
+    from safe_match import MatchTimeout, call_with_timeout, guard
+
+    results = []
+    try:
+        for name, pattern, kind, build in BENCHMARKS:
+            text = build(depth, copies)
+            try:
+                (regex_matches, regex_ms) = call_with_timeout(
+                    _timed, (_regex_count, pattern, text), timeout)
+            except MatchTimeout:
+                regex_matches = regex_ms = None
+            finder = find_balanced_tags if kind == 'tags' else find_balanced_parens
+            spans, matcher_ms = _timed(finder, text)
+            results.append({
+                'name': name,
+                'length': len(text),
+                'regex_matches': regex_matches,
+                'regex_ms': regex_ms,
+                'pairs': len(spans),
+                'max_depth': max((s[-1] for s in spans), default=-1) + 1,
+                'matcher_ms': matcher_ms
+            })
+    finally:
+        guard.close()
+    return results
+
+
+def print_benchmark(results, timeout):
+    print(f"{'Input':<17} {'Chars':>8} {'Regex ms':>10} {'Matches':>8} "
+          f"{'Stack ms':>9} {'Pairs':>7} {'Depth':>6}")
+    print("-" * 71)
+    for r in results:
+        regex_ms = f"{r['regex_ms']:.1f}" if r['regex_ms'] is not None else f">{timeout:g}s"
+        matches = r['regex_matches'] if r['regex_matches'] is not None else '-'
+        print(f"{r['name']:<17} {r['length']:>8} {regex_ms:>10} {matches:>8} "
+              f"{r['matcher_ms']:>9.1f} {r['pairs']:>7} {r['max_depth']:>6}")
+
+
+def main():
+    """Print balanced pairs in a file, or run the benchmark."""
+    parser = argparse.ArgumentParser(description="Match balanced tags and parentheses.")
+    parser.add_argument('file', nargs='?', help="file to scan")
+    parser.add_argument('--tags', action='store_true', help="report tag pairs (default)")
+    parser.add_argument('--parens', action='store_true', help="report parenthesis pairs")
+    parser.add_argument('--benchmark', action='store_true', help="compare with the lesson regexes")
+    parser.add_argument('--depth', type=int, default=50, help="benchmark nesting depth")
+    parser.add_argument('--copies', type=int, default=200, help="benchmark repetitions")
+    parser.add_argument('--timeout', type=float, default=5.0, help="seconds allowed per regex run")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print_benchmark(benchmark(args.depth, args.copies, args.timeout), args.timeout)
+        return
+    if not args.file:
+        parser.error("a file is required unless --benchmark is given")
+
+    try:
+        with open(args.file, 'r', encoding='utf-8', errors='ignore') as f:
+            if args.parens:
+                for start, end, depth in iter_balanced_parens(f):
+                    print(f"{start}-{end} depth {depth}")
+            else:
+                for start, end, name, depth in iter_balanced_tags(f):
+                    print(f"{start}-{end} <{name}> depth {depth}")
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Complexity Profiler - Project Implementation
+
+Measures how a pattern's run time grows with input size. Inputs come
+from a generator called with the target size; the size doubles each step
+until a single run exceeds the time budget (or the size cap). A straight
+line is fitted to log(time) against log(size): an exponent near 1 means
+linear time, near 2 quadratic. Patterns whose exponent exceeds the limit,
+or that have to be killed, are flagged as super-linear.
+
+The built-in scenarios check the claims in the greedy/lazy and
+backreference lessons, for example that a negated class ([^<]+) stays
+linear where a lazy quantifier (.*?) goes quadratic when the closing
+delimiter never comes.
+
+Usage:
+    python complexity_profiler.py                   # built-in scenarios
+    python complexity_profiler.py '<(\\w+)>.*?</\\1>' --unit '<b>x'
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+
+from redos_analyzer import growth_exponent
+from safe_match import MatchTimeout, call_with_timeout, guard
+
+LINEAR = 'linear'
+SUPER_LINEAR = 'super-linear'
+
+# Default exponent above which growth counts as super-linear
+MAX_EXPONENT = 1.5
+
+
+class Repeat:
+    """
+    Input generator: prefix + unit repeated to the target size + suffix.
+
+    Args:
+        unit: repeated text
+        prefix: text before the repetitions
+        suffix: text after the repetitions
+    """
+
+    def __init__(self, unit, prefix='', suffix=''):
+        self.unit = unit
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def __call__(self, size):
+        count = max(1, (size - len(self.prefix) - len(self.suffix)) // len(self.unit))
+        return self.prefix + self.unit * count + self.suffix
+
+    def __repr__(self):
+        text = repr(self.unit) + '*n'
+        if self.prefix:
+            text = f"{self.prefix!r} + {text}"
+        if self.suffix:
+            text = f"{text} + {self.suffix!r}"
+        return text
+
+
+class RandomText:
+    """
+    Input generator: seeded random characters, or words when given.
+
+    Args:
+        alphabet: characters to draw from
+        words: if set, draw space-separated words from this list instead
+        seed: random seed, so every size is reproducible
+    """
+
+    def __init__(self, alphabet=string.ascii_lowercase, words=None, seed=0):
+        self.alphabet = alphabet
+        self.words = words
+        self.seed = seed
+
+    def __call__(self, size):
+        rng = random.Random(self.seed)
+        if self.words is None:
+            return ''.join(rng.choices(self.alphabet, k=size))
+        parts = []
+        length = 0
+        while length < size:
+            word = rng.choice(self.words)
+            parts.append(word)
+            length += len(word) + 1
+        return ' '.join(parts)
+
+    def __repr__(self):
+        if self.words is not None:
+            return f"random words from {len(self.words)}"
+        return f"random chars from {self.alphabet!r}"
+
+
+def _time_op(pattern, flags, op, text):
+    """Best-of-3 (or single, if slow) time of one operation over text."""
+    compiled = re.compile(pattern, flags)
+    if op == 'finditer':
+        def func():
+            for _ in compiled.finditer(text):
+                pass
+    else:
+        method = getattr(compiled, op)
+
+        def func():
+            method(text)
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if elapsed > 0.01:
+            break
+    return best
+
+
+def profile(pattern, generator, op='findall', flags=0, start=1024, max_size=1 << 20,
+            budget=0.25, max_exponent=MAX_EXPONENT):
+    """
+    Time op over generated inputs of doubling size.
+
+    Stops after the first size whose run takes longer than budget
+    seconds, or at max_size. Each run happens in a worker process that
+    is killed after 10 x budget; a killed run is recorded with a time of
+    None and makes the result super-linear.
+
+    Returns a dict with 'pattern', 'op', 'input', 'samples' (list of
+    (size, seconds)), 'exponent' and 'verdict'.
+    """
+    samples = []
+    size = start
+    while size <= max_size:
+        text = generator(size)
+        try:
+            elapsed = call_with_timeout(_time_op, (pattern, flags, op, text), budget * 10)
+        except MatchTimeout:
+            samples.append((len(text), None))
+            break
+        samples.append((len(text), elapsed))
+        if elapsed > budget:
+            break
+        size *= 2
+
+    exponent = growth_exponent(samples)
+    killed = samples[-1][1] is None
+    return {
+        'pattern': pattern,
+        'op': op,
+        'input': repr(generator),
+        'samples': samples,
+        'exponent': exponent,
+        'verdict': SUPER_LINEAR if killed or exponent > max_exponent else LINEAR
+    }
+
+
+# (name, pattern, input generator, expected verdict) from the lessons
+SCENARIOS = [
+    ('greedy_lazy.lazy_matching: closed divs',
+     r'<div>.*?</div>', Repeat('<div>content</div>'), LINEAR),
+    ('greedy_lazy.better_alternative: closed divs',
+     r'<div>[^<]+</div>', Repeat('<div>content</div>'), LINEAR),
+    ('greedy_lazy.lazy_matching: unclosed divs',
+     r'<div>.*?</div>', Repeat('<div>x'), SUPER_LINEAR),
+    ('greedy_lazy.better_alternative: unclosed divs',
+     r'<div>[^<]+</div>', Repeat('<div>x'), LINEAR),
+    ('greedy_lazy.match_until_character: lazy, no comma',
+     r'.*?,', Repeat('name=value '), SUPER_LINEAR),
+    ('greedy_lazy.match_until_character: negated, no comma',
+     r'[^,]+', Repeat('name=value '), LINEAR),
+    ('backreferences.repeated_words: prose',
+     r'\b(\w+)\s+\1\b', RandomText(words=['the', 'cat', 'sat', 'on', 'mat', 'a']), LINEAR),
+    ('backreferences.html_tags: closed tags',
+     r'<(\w+)>.*?</\1>', Repeat('<b>bold</b> '), LINEAR),
+    ('backreferences.html_tags: unclosed tags',
+     r'<(\w+)>.*?</\1>', Repeat('<b>x'), SUPER_LINEAR),
+    ('backreferences.named_group_backreference: unclosed tags',
+     r'<(?P<tag>\w+)>.*?</(?P=tag)>', Repeat('<b>x'), SUPER_LINEAR),
+    ('backreferences.repeated_sequences: random text',
+     r'(.{2,})\1+', RandomText(), SUPER_LINEAR),
+    ('backreferences.palindromic_words: prose',
+     r'\b([a-zA-Z])[a-zA-Z]*\1\b', RandomText(words=['level', 'radar', 'hello', 'test']), LINEAR),
+]
+
+
+def print_profile(name, result, expected=None):
+    """Print one profile; returns False if it contradicts expected (default linear)."""
+    ok = result['verdict'] == (expected or LINEAR)
+    mark = "✓" if ok else "✗"
+    size, seconds = result['samples'][-1]
+    took = "killed" if seconds is None else f"{seconds * 1000:.1f} ms"
+    print(f"{mark} {name}")
+    print(f"    {result['pattern']}  ({result['op']} on {result['input']})")
+    print(f"    exponent {result['exponent']:.2f} -> {result['verdict']}"
+          f"{'' if ok or expected is None else f' (expected {expected})'}; n={size} took {took}")
+    return ok
+
+
+def main():
+    """Profile a pattern, or check the built-in lesson scenarios."""
+    parser = argparse.ArgumentParser(description="Measure how regex run time grows with input size.")
+    parser.add_argument('pattern', nargs='?', help="pattern to profile (default: built-in scenarios)")
+    parser.add_argument('--unit', help="repeat this text to build inputs")
+    parser.add_argument('--prefix', default='', help="text before the repeated unit")
+    parser.add_argument('--suffix', default='', help="text after the repeated unit")
+    parser.add_argument('--op', default='findall',
+                        choices=['match', 'search', 'fullmatch', 'findall', 'finditer'],
+                        help="operation to time (default findall)")
+    parser.add_argument('--budget', type=float, default=0.25,
+                        help="stop doubling once one run takes this many seconds")
+    parser.add_argument('--max-size', type=int, default=1 << 20, help="largest input size")
+    parser.add_argument('--max-exponent', type=float, default=MAX_EXPONENT,
+                        help=f"exponent above which growth is super-linear (default {MAX_EXPONENT})")
+    args = parser.parse_args()
+
+    try:
+        if args.pattern:
+            try:
+                re.compile(args.pattern)
+            except re.error as e:
+                print(f"Error: invalid pattern: {e}")
+                sys.exit(1)
+            generator = Repeat(args.unit, args.prefix, args.suffix) if args.unit else RandomText()
+            result = profile(args.pattern, generator, args.op, budget=args.budget,
+                             max_size=args.max_size, max_exponent=args.max_exponent)
+            print_profile(args.pattern, result)
+            for size, seconds in result['samples']:
+                took = "killed" if seconds is None else f"{seconds * 1000:10.3f} ms"
+                print(f"    {size:>9} {took}")
+            sys.exit(1 if result['verdict'] == SUPER_LINEAR else 0)
+
+        failed = 0
+        for name, pattern, generator, expected in SCENARIOS:
+            result = profile(pattern, generator, budget=args.budget, max_size=args.max_size,
+                             max_exponent=args.max_exponent)
+            if not print_profile(name, result, expected):
+                failed += 1
+        print(f"\n{len(SCENARIOS) - failed}/{len(SCENARIOS)} scenarios behaved as the lessons claim")
+        sys.exit(1 if failed else 0)
+    finally:
+        guard.close()
+
+
+if __name__ == "__main__":
+    main()
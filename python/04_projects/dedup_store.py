@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Dedup Store - Project Implementation
+
+Tracks which scraped entities (URLs, phone numbers, emails) have already
+been seen across many documents while keeping memory use bounded.
+
+A Bloom filter answers most "never seen" checks in memory. Exact keys are
+kept in a small in-memory set and spilled to a sorted sqlite table once the
+memory budget is exceeded, so false positives from the filter are resolved
+against disk instead of growing an unbounded Python set.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        # Standard sizing: m = -n ln(p) / (ln 2)^2, k = m/n ln 2
+        size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.size = max(size, 8)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        """Yield bit positions for key using double hashing."""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key):
+        """Add key to the filter."""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        """Return True if key may have been added (False is certain)."""
+        for pos in self._positions(key):
+            if not self.bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class DedupStore:
+    """
+    Bounded-memory set of seen keys with on-disk spill.
+
+    A store opened on an existing path resumes from it: the spilled keys
+    are counted and loaded into the Bloom filter, and close() flushes
+    keys still held in memory so they are seen on the next open.
+
+    Args:
+        path: sqlite file for spilled keys (temporary file if None)
+        memory_budget: max exact keys held in memory before spilling
+        capacity: expected number of unique keys (sizes the Bloom filter)
+        error_rate: target Bloom filter false-positive rate
+    """
+
+    def __init__(self, path=None, memory_budget=100000, capacity=10000000,
+                 error_rate=0.001):
+        self.memory_budget = memory_budget
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.pending = set()
+        self.count = 0
+        self.spilled = 0
+
+        self._temp = path is None
+        if self._temp:
+            fd, path = tempfile.mkstemp(suffix='.sqlite', prefix='dedup_')
+            os.close(fd)
+        self.path = path
+        self._db = None
+        if not self._temp and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        """Resume from keys spilled to an existing database."""
+        for (key,) in self._connect().execute('SELECT key FROM seen'):
+            self.bloom.add(key)
+            self.spilled += 1
+        self.count = self.spilled
+
+    def _connect(self):
+        """Open the spill database on first use."""
+        if self._db is None:
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID'
+            )
+        return self._db
+
+    def _on_disk(self, key):
+        """Check whether key was spilled to disk."""
+        if not self.spilled:
+            return False
+        row = self._connect().execute(
+            'SELECT 1 FROM seen WHERE key = ?', (key,)
+        ).fetchone()
+        return row is not None
+
+    def flush(self):
+        """Spill in-memory keys to disk."""
+        if not self.pending:
+            return
+        db = self._connect()
+        with db:
+            db.executemany(
+                'INSERT OR IGNORE INTO seen (key) VALUES (?)',
+                ((key,) for key in sorted(self.pending))
+            )
+        self.spilled += len(self.pending)
+        self.pending.clear()
+
+    def add(self, key):
+        """
+        Record key as seen.
+
+        Returns True if the key is new, False if it was seen before.
+        """
+        if key in self.bloom:
+            # Possibly seen - confirm against the exact stores
+            if key in self.pending or self._on_disk(key):
+                return False
+        else:
+            self.bloom.add(key)
+
+        self.pending.add(key)
+        self.count += 1
+        if len(self.pending) >= self.memory_budget:
+            self.flush()
+        return True
+
+    def __contains__(self, key):
+        if key not in self.bloom:
+            return False
+        return key in self.pending or self._on_disk(key)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        """Close the spill database, removing it if temporary."""
+        if not self._temp:
+            self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._temp and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """Count unique lines across files with bounded memory."""
+    if len(sys.argv) < 2:
+        print("Usage: python dedup_store.py <file> [file ...]")
+        sys.exit(1)
+
+    total = 0
+    with DedupStore() as store:
+        for filename in sys.argv[1:]:
+            try:
+                with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            total += 1
+                            store.add(line)
+            except FileNotFoundError:
+                print(f"Error: File '{filename}' not found.")
+
+        print(f"Lines: {total}")
+        print(f"Unique: {len(store)}")
+        print(f"Spilled to disk: {store.spilled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Domain Snapshot - Project Implementation
+
+Offline lookup of domains known to accept mail (for example, domains with
+MX records taken from a zone snapshot).
+
+The snapshot is a plain text file of lowercase domains, one per line, in
+byte-sorted order. It is memory-mapped and searched with binary search, so
+opening a snapshot of millions of domains is instant and only the pages
+touched by lookups are read from disk.
+"""
+
+import mmap
+import os
+import sys
+
+
+def build_snapshot(input_file, output_file):
+    """
+    Build a sorted snapshot file from a list of domains.
+
+    Lines may be in any order and case; blanks and '#' comments are skipped.
+    Returns the number of domains written.
+    """
+    domains = set()
+    with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip().lower().rstrip('.')
+            if line and not line.startswith('#'):
+                domains.add(line.encode('utf-8'))
+
+    with open(output_file, 'wb') as f:
+        for domain in sorted(domains):
+            f.write(domain + b'\n')
+    return len(domains)
+
+
+class DomainSnapshot:
+    """Memory-mapped, sorted domain list with binary-search lookups."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = b''
+
+    def __contains__(self, domain):
+        key = domain.lower().rstrip('.').encode('utf-8')
+        data = self.data
+        lo, hi = 0, len(data)
+
+        # lo always sits at the start of a line; lines in [lo, hi) are sorted
+        while lo < hi:
+            mid = (lo + hi) // 2
+            newline = data.rfind(b'\n', lo, mid)
+            start = lo if newline == -1 else newline + 1
+            end = data.find(b'\n', start)
+            if end == -1:
+                end = len(data)
+            line = data[start:end]
+            if line == key:
+                return True
+            if line < key:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """Build a snapshot or look up domains in one."""
+    if len(sys.argv) < 4 or sys.argv[1] not in ('build', 'lookup'):
+        print("Usage: python domain_snapshot.py build <domains.txt> <snapshot.txt>")
+        print("       python domain_snapshot.py lookup <snapshot.txt> <domain> [domain ...]")
+        sys.exit(1)
+
+    try:
+        if sys.argv[1] == 'build':
+            count = build_snapshot(sys.argv[2], sys.argv[3])
+            print(f"✓ Wrote {count} domains to {sys.argv[3]}")
+        else:
+            with DomainSnapshot(sys.argv[2]) as snapshot:
+                for domain in sys.argv[3:]:
+                    status = "✓ found" if domain in snapshot else "✗ not found"
+                    print(f"{status}: {domain}")
+    except FileNotFoundError as e:
+        print(f"Error: File '{e.filename}' not found.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Domain Suggester - Project Implementation
+
+Suggests corrections for mistyped email domains ('gmial.com' -> 'gmail.com')
+using a symmetric-delete index over a list of known-good domains.
+
+Every domain is indexed under all strings obtained by deleting up to
+max_distance characters. A lookup generates the same deletes for the query,
+so candidates are found with a handful of dict lookups instead of comparing
+against every known domain, and only those candidates are verified with an
+exact edit distance.
+
+Saved indexes store the delete keys as sorted CRC32 hashes in a flat
+array, so loading is a single read and lookups are binary searches.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+
+
+INDEX_MAGIC = b'DIDX1\n'
+
+# Frequently mistyped mail providers, used when no domain list is loaded
+COMMON_DOMAINS = [
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.co.uk', 'yahoo.co.in',
+    'ymail.com', 'hotmail.com', 'hotmail.co.uk', 'outlook.com', 'live.com',
+    'msn.com', 'icloud.com', 'me.com', 'mac.com', 'aol.com', 'protonmail.com',
+    'proton.me', 'gmx.com', 'gmx.de', 'mail.com', 'zoho.com', 'yandex.com',
+    'yandex.ru', 'mail.ru', 'comcast.net', 'verizon.net', 'att.net',
+    'sbcglobal.net', 'web.de', 'fastmail.com', 'qq.com', '163.com',
+]
+
+
+def edit_distance(a, b, limit):
+    """
+    Optimal string alignment distance (adjacent transpositions cost 1).
+
+    Returns limit + 1 as soon as the distance is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(word, distance):
+    """Return word and every string made by deleting up to distance chars."""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class DomainIndex:
+    """
+    Symmetric-delete index of known-good domains.
+
+    Args:
+        domains: iterable of domain names
+        max_distance: largest edit distance for a suggestion
+    """
+
+    def __init__(self, domains=(), max_distance=2):
+        self.max_distance = max_distance
+        self.domains = []
+        self.known = set()
+        self.index = {}
+        self.packed = None
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain):
+        """Add a known-good domain to the index."""
+        domain = domain.strip().lower()
+        if not domain or domain in self.known:
+            return
+        if self.packed is not None:
+            self._unpack()
+        position = len(self.domains)
+        self.domains.append(domain)
+        self.known.add(domain)
+        for key in _deletes(domain, self.max_distance):
+            self.index.setdefault(key, []).append(position)
+
+    def _limit(self, domain):
+        # Short domains tolerate fewer edits to avoid wild suggestions
+        return 1 if len(domain) < 8 else self.max_distance
+
+    def _positions(self, key):
+        """Return positions of domains indexed under a delete key."""
+        if self.packed is None:
+            return self.index.get(key, ())
+        hashes, positions = self.packed
+        key_hash = zlib.crc32(key.encode('utf-8'))
+        i = bisect_left(hashes, key_hash)
+        found = []
+        while i < len(hashes) and hashes[i] == key_hash:
+            found.append(positions[i])
+            i += 1
+        return found
+
+    def _unpack(self):
+        """Rebuild the dict index so a loaded index can be extended."""
+        self.packed = None
+        self.index = {}
+        for position, domain in enumerate(self.domains):
+            for key in _deletes(domain, self.max_distance):
+                self.index.setdefault(key, []).append(position)
+
+    def suggest(self, domain):
+        """
+        Return the closest known domain, or None.
+
+        Known domains and domains with no candidate within the edit
+        distance limit return None. Ties go to the earliest-added domain.
+        """
+        domain = domain.lower()
+        if domain in self.known:
+            return None
+
+        limit = self._limit(domain)
+        candidates = set()
+        for key in _deletes(domain, limit):
+            candidates.update(self._positions(key))
+
+        best = None
+        best_distance = limit + 1
+        for position in sorted(candidates):
+            candidate = self.domains[position]
+            distance = edit_distance(domain, candidate, limit)
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    def save(self, path):
+        """Write the index as sorted (hash, position) arrays."""
+        if self.packed is None:
+            unsorted_hashes = array('I')
+            unsorted_positions = array('I')
+            for key, key_positions in self.index.items():
+                key_hash = zlib.crc32(key.encode('utf-8'))
+                for position in key_positions:
+                    unsorted_hashes.append(key_hash)
+                    unsorted_positions.append(position)
+            order = sorted(range(len(unsorted_hashes)), key=unsorted_hashes.__getitem__)
+            hashes = array('I', (unsorted_hashes[i] for i in order))
+            positions = array('I', (unsorted_positions[i] for i in order))
+        else:
+            hashes, positions = self.packed
+
+        names = '\n'.join(self.domains).encode('utf-8')
+        if sys.byteorder == 'big':
+            hashes, positions = array('I', hashes), array('I', positions)
+            hashes.byteswap()
+            positions.byteswap()
+
+        with open(path, 'wb') as f:
+            f.write(INDEX_MAGIC)
+            f.write(struct.pack('<IIII', self.max_distance, len(self.domains),
+                                len(hashes), len(names)))
+            f.write(names)
+            hashes.tofile(f)
+            positions.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save()."""
+        with open(path, 'rb') as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError(f"{path} is not a domain index file")
+            max_distance, domain_count, entry_count, names_size = struct.unpack(
+                '<IIII', f.read(16))
+            names = f.read(names_size).decode('utf-8')
+            hashes = array('I')
+            hashes.fromfile(f, entry_count)
+            positions = array('I')
+            positions.fromfile(f, entry_count)
+
+        if sys.byteorder == 'big':
+            hashes.byteswap()
+            positions.byteswap()
+
+        instance = cls(max_distance=max_distance)
+        instance.domains = names.split('\n') if domain_count else []
+        instance.known = set(instance.domains)
+        instance.packed = (hashes, positions)
+        return instance
+
+
+def read_domains(filename):
+    """Read one domain per line, skipping blanks and '#' comments."""
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+
+def main():
+    """Build an index file or query one."""
+    if len(sys.argv) < 4 or sys.argv[1] not in ('build', 'suggest'):
+        print("Usage: python domain_suggester.py build <domains.txt> <index.idx>")
+        print("       python domain_suggester.py suggest <index.idx> <domain> [domain ...]")
+        sys.exit(1)
+
+    if sys.argv[1] == 'build':
+        try:
+            index = DomainIndex(read_domains(sys.argv[2]))
+        except FileNotFoundError:
+            print(f"Error: File '{sys.argv[2]}' not found.")
+            sys.exit(1)
+        index.save(sys.argv[3])
+        print(f"✓ Indexed {len(index.domains)} domains into {sys.argv[3]}")
+    else:
+        index = DomainIndex.load(sys.argv[2])
+        for domain in sys.argv[3:]:
+            suggestion = index.suggest(domain)
+            print(f"{domain} -> {suggestion or '(no suggestion)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Duplicate Detector - Project Implementation
+
+Finds adjacent repeated words and repeated character sequences in large
+documents without running backreference regexes over all of the text,
+reporting exactly the spans of
+
+    repeated words:      \\b(\\w+)\\s+\\1\\b    (backreferences.example_repeated_words)
+    repeated sequences:  (.{2,})\\1+         (backreferences.example_repeated_sequences)
+
+This is not a linear-time detector, and it does not use rolling hashes.
+It prefilters the input so the regexes run on less of it, and its cost
+depends on the text.
+
+Repeated words: the regex is linear but runs its backtracking steps at
+every word. Here the stream is cut into blocks of BLOCK_SIZE characters
+ending in whitespace, and each block is split into words in C
+(str.translate + str.split). The regex then runs only on blocks where
+two adjacent words are equal. Every block is tokenized, so the gain
+depends on how many blocks are clean. When duplicates are frequent
+(a few per block), nearly every block goes to the regex as well, and
+the detector is slower than the regex alone.
+
+Repeated sequences: at each start position the regex tries every unit
+length from the longest down, which is quadratic in the line length. Here
+a unit of length L starting at p needs the two characters at p to recur
+at p + L, so only those positions (looked up in a per-line index of
+character pairs) are tried, longest first. Each try still compares up
+to L characters, so the worst case stays above linear. Lines shorter
+than SHORT_LINE go straight to `re`, where the quadratic cost is
+negligible. In low-entropy lines (say, random 'a'/'b' noise) every pair
+recurs everywhere and the candidates are quadratic too. Once a line has
+used CANDIDATE_BUDGET checks per character, the rest of it is left to
+`re` from where the scan stopped, so such lines cost about what the
+regex costs.
+
+Speedup over the regexes (regex time / detector time) on synthetic text:
+
+    text                          repeated words   repeated sequences
+    prose, 0.1% doubled words          1.4x               2.8x
+    prose, 5% doubled words            0.7x               1.8x
+    prose in 13 KB lines               1.5x               8.5x
+    random 'a'/'b' lines                9x                0.9x
+
+Input can be streamed in chunks (e.g. a file object); spans are offsets
+into the whole stream.
+
+Usage:
+    python duplicate_detector.py article.txt
+    python duplicate_detector.py article.txt --benchmark
+"""
+
+import argparse
+import bisect
+import sys
+import time
+
+import patterns
+
+REPEATED_WORD_PATTERN = r'\b(\w+)\s+\1\b'
+REPEATED_SEQUENCE_PATTERN = r'(.{2,})\1+'
+
+# Maps every non-word ASCII character to a space, so str.split() yields \w+ runs
+ASCII_SEPARATORS = {c: ' ' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')}
+NON_WORD = patterns.compile(r'\W+')
+
+WHITESPACE = ' \n\t'
+WHITESPACE_AFTER = patterns.compile(r'\s')
+
+# Blocks checked at a time when looking for repeated words
+BLOCK_SIZE = 2048
+
+# Lines shorter than this are scanned with the regex itself
+SHORT_LINE = 128
+
+# Candidate checks per character allowed before a line is handed to the regex
+CANDIDATE_BUDGET = 8
+
+CHUNK_SIZE = 1 << 16
+
+
+def _chunks(source):
+    """Yield str chunks from a string or an iterable of strings (e.g. a file)."""
+    if isinstance(source, str):
+        yield source
+    else:
+        yield from source
+
+
+def _tokens(block):
+    """Return the \\w+ runs of block, splitting in C where possible."""
+    if block.isascii():
+        return block.translate(ASCII_SEPARATORS).split()
+    return NON_WORD.sub(' ', block).split()
+
+
+def _word_regions(source, block_size=None):
+    """
+    Yield (offset, text) for the regions that may contain a repeated word.
+
+    The stream is cut into blocks ending in whitespace. A block is dirty
+    when two adjacent words in it are equal; a block whose first word
+    equals the previous block's last word is joined to it. Every regex
+    match lies inside one dirty region: it needs two equal adjacent words,
+    and regions start and end next to whitespace, where \\b behaves as at
+    the ends of a string.
+    """
+    block_size = block_size or BLOCK_SIZE
+    buffer = ''
+    region = ''           # pending region, starting at stream offset start
+    start = 0
+    dirty = False
+    last_word = None      # last word of the pending region
+
+    blocks = []
+    for chunk in _chunks(source):
+        buffer += chunk
+        pos = 0
+        while len(buffer) - pos >= block_size:
+            limit = pos + block_size
+            cut = max(buffer.rfind(c, pos, limit) for c in WHITESPACE) + 1
+            if cut <= pos:
+                match = WHITESPACE_AFTER.search(buffer, limit)
+                if match is None:
+                    break
+                cut = match.end()
+            blocks.append(buffer[pos:cut])
+            pos = cut
+        buffer = buffer[pos:]
+
+        for block in blocks:
+            words = _tokens(block)
+            if not words:
+                region += block
+                continue
+            if words[0] == last_word:
+                region += block
+                dirty = True
+            else:
+                if dirty:
+                    yield start, region
+                start += len(region)
+                region = block
+                dirty = any(map(str.__eq__, words, words[1:]))
+            last_word = words[-1]
+        blocks.clear()
+
+    region += buffer
+    words = _tokens(buffer)
+    if words and words[0] == last_word or any(map(str.__eq__, words, words[1:])):
+        dirty = True
+    if dirty:
+        yield start, region
+
+
+def iter_repeated_words(source):
+    """
+    Yield (start, end, word) for each match of \\b(\\w+)\\s+\\1\\b.
+
+    source is a string or an iterable of string chunks; offsets are
+    relative to the start of the stream. Only regions where two adjacent
+    words are equal are handed to the regex.
+    """
+    compiled = patterns.compile(REPEATED_WORD_PATTERN)
+    for offset, region in _word_regions(source):
+        for match in compiled.finditer(region):
+            yield offset + match.start(), offset + match.end(), match.group(1)
+
+
+def find_repeated_words(text):
+    """Return [(start, end, word)] for \\b(\\w+)\\s+\\1\\b in text."""
+    return list(iter_repeated_words(text))
+
+
+def _line_sequences(line, base):
+    """Yield (start, end, unit) for (.{2,})\\1+ within one line."""
+    length = len(line)
+    compiled = patterns.compile(REPEATED_SEQUENCE_PATTERN)
+    if length < SHORT_LINE:
+        for match in compiled.finditer(line):
+            yield base + match.start(), base + match.end(), match.group(1)
+        return
+
+    index = {}
+    for i in range(length - 1):
+        index.setdefault(line[i:i + 2], []).append(i)
+
+    budget = CANDIDATE_BUDGET * length
+    pos = 0
+    while pos <= length - 4:
+        candidates = index[line[pos:pos + 2]]
+        lo = bisect.bisect_left(candidates, pos + 2)
+        hi = bisect.bisect_right(candidates, pos + (length - pos) // 2)
+        budget -= hi - lo
+        if budget < 0:
+            # Low-entropy line: the regex from here finds the same matches
+            for match in compiled.finditer(line, pos):
+                yield base + match.start(), base + match.end(), match.group(1)
+            return
+        # The regex tries the longest unit first
+        for k in range(hi - 1, lo - 1, -1):
+            q = candidates[k]
+            size = q - pos
+            if line[q + size - 1] == line[q - 1] and line[pos:q] == line[q:q + size]:
+                break
+        else:
+            pos += 1
+            continue
+        unit = line[pos:q]
+        end = q + size
+        while line.startswith(unit, end):
+            end += size
+        yield base + pos, base + end, unit
+        pos = end
+
+
+def iter_repeated_sequences(source):
+    """
+    Yield (start, end, unit) for each match of (.{2,})\\1+.
+
+    Matches never cross a newline, so the stream is processed one line at
+    a time; offsets are relative to the start of the stream.
+    """
+    base = 0
+    pending = ''
+    for chunk in _chunks(source):
+        pending += chunk
+        cut = pending.rfind('\n')
+        if cut < 0:
+            continue
+        start = 0
+        while start <= cut:
+            end = pending.find('\n', start)
+            yield from _line_sequences(pending[start:end], base + start)
+            start = end + 1
+        pending = pending[cut + 1:]
+        base += cut + 1
+    if pending:
+        yield from _line_sequences(pending, base)
+
+
+def find_repeated_sequences(text):
+    """Return [(start, end, unit)] for (.{2,})\\1+ in text."""
+    return list(iter_repeated_sequences(text))
+
+
+def _read_chunks(filename, size=CHUNK_SIZE):
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def benchmark(text):
+    """Time the detectors against the backreference regexes; returns result dicts."""
+    results = []
+    for name, pattern, finder in (
+            ('repeated words', REPEATED_WORD_PATTERN, find_repeated_words),
+            ('repeated sequences', REPEATED_SEQUENCE_PATTERN, find_repeated_sequences)):
+        compiled = patterns.compile(pattern)
+        start = time.perf_counter()
+        expected = [(m.start(), m.end(), m.group(1)) for m in compiled.finditer(text)]
+        regex_time = time.perf_counter() - start
+        start = time.perf_counter()
+        found = finder(text)
+        detector_time = time.perf_counter() - start
+        results.append({
+            'name': name,
+            'matches': len(found),
+            'same_spans': found == expected,
+            'regex_ms': regex_time * 1000,
+            'detector_ms': detector_time * 1000
+        })
+    return results
+
+
+def main():
+    """Report repeated words and sequences in a file."""
+    parser = argparse.ArgumentParser(description="Find repeated words and sequences in large text.")
+    parser.add_argument('file', help="text file to scan")
+    parser.add_argument('--words', action='store_true', help="only repeated words")
+    parser.add_argument('--sequences', action='store_true', help="only repeated sequences")
+    parser.add_argument('--benchmark', action='store_true', help="compare with the regex versions")
+    args = parser.parse_args()
+
+    try:
+        if args.benchmark:
+            with open(args.file, 'r', encoding='utf-8', errors='ignore') as f:
+                text = f.read()
+            print(f"{'Detector':<20} {'Matches':>8} {'Regex ms':>10} {'Linear ms':>10} {'Speedup':>8}")
+            print("-" * 60)
+            for r in benchmark(text):
+                speedup = r['regex_ms'] / r['detector_ms'] if r['detector_ms'] else float('inf')
+                note = '' if r['same_spans'] else '  (MISMATCH)'
+                print(f"{r['name']:<20} {r['matches']:>8} {r['regex_ms']:>10.1f} "
+                      f"{r['detector_ms']:>10.1f} {speedup:>7.1f}x{note}")
+            return
+
+        if not args.sequences:
+            print("Repeated words:")
+            for start, end, word in iter_repeated_words(_read_chunks(args.file)):
+                print(f"  {start}-{end}: {word!r}")
+        if not args.words:
+            print("Repeated sequences:")
+            for start, end, unit in iter_repeated_sequences(_read_chunks(args.file)):
+                print(f"  {start}-{end}: {unit!r} x{(end - start) // len(unit)}")
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Email Validation Service - Project Implementation
+
+Serves email validation over a local TCP or Unix socket with asyncio.
+
+Protocol (one request per line, one JSON response line per request):
+    user@example.com            -> {"valid": ..., "email": ..., ...}
+    ["a@b.com", "c@d.org"]      -> [{...}, {...}]
+    {"emails": ["a@b.com"]}     -> [{...}]
+    STATS                       -> latency percentiles and cache counters
+
+Request lines longer than MAX_REQUEST_BYTES get {"error": "request too
+large"} and the connection stays open.
+
+Addresses from concurrent requests are coalesced into micro-batches before
+they reach the validator, and every request's latency is recorded in a
+log-scale histogram so p50/p99 can be read from the STATS command.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+
+from email_validator import (
+    cache_stats,
+    load_domain_index,
+    load_mx_snapshot,
+    validate_batch,
+)
+
+# Longest request line accepted (asyncio's default is 64 KiB); leaves room
+# for a JSON batch of 50,000 addresses at the 320-character maximum
+MAX_REQUEST_BYTES = 1 << 24
+
+
+class LatencyHistogram:
+    """
+    Log-scale latency histogram (about 10% relative error per bucket).
+
+    Args:
+        min_latency: smallest latency tracked, in seconds
+        growth: ratio between consecutive bucket bounds
+    """
+
+    def __init__(self, min_latency=1e-6, growth=1.1):
+        self.min_latency = min_latency
+        self.log_growth = math.log(growth)
+        self.growth = growth
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, latency):
+        """Add one latency sample (seconds)."""
+        if latency <= self.min_latency:
+            bucket = 0
+        else:
+            bucket = int(math.log(latency / self.min_latency) / self.log_growth) + 1
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    def percentile(self, p):
+        """Return the upper bound of the bucket holding the p-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.min_latency * self.growth ** bucket, self.max)
+        return self.max
+
+    def summary(self):
+        """Return count, mean and percentiles in milliseconds."""
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p90_ms': self.percentile(90) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max * 1000
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces addresses from concurrent requests into validator batches.
+
+    A batch is flushed when it reaches max_batch addresses or max_delay
+    seconds after its first request arrived.
+    """
+
+    def __init__(self, max_batch=512, max_delay=0.002, fail_fast=False):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.fail_fast = fail_fast
+        self.queue = asyncio.Queue()
+        self.batch_sizes = LatencyHistogram(min_latency=1, growth=2)
+
+    async def validate(self, emails):
+        """Validate a list of addresses as part of the next batch."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((emails, future))
+        return await future
+
+    async def run(self):
+        """Batch loop: collect requests, validate, resolve futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = [await self.queue.get()]
+            size = len(requests[0][0])
+            deadline = loop.time() + self.max_delay
+
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                requests.append(request)
+                size += len(request[0])
+
+            emails = [email for request_emails, _ in requests for email in request_emails]
+            self.batch_sizes.record(len(emails))
+            try:
+                results = await loop.run_in_executor(
+                    None, validate_batch, emails, True, self.fail_fast)
+            except Exception as e:
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_emails, future in requests:
+                end = offset + len(request_emails)
+                if not future.done():
+                    future.set_result(results[offset:end])
+                offset = end
+
+
+def parse_request(line):
+    """
+    Parse one request line.
+
+    Returns (emails, is_batch). Raises ValueError on malformed JSON.
+    """
+    if line.startswith('['):
+        emails = json.loads(line)
+    elif line.startswith('{'):
+        emails = json.loads(line).get('emails', [])
+    else:
+        return [line], False
+
+    if not isinstance(emails, list) or not all(isinstance(e, str) for e in emails):
+        raise ValueError("expected a list of email strings")
+    return emails, True
+
+
+class ValidationServer:
+    """Line-oriented asyncio server in front of a MicroBatcher."""
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.latency = LatencyHistogram()
+
+    def stats(self):
+        """Return latency, batching and cache statistics."""
+        return {
+            'latency': self.latency.summary(),
+            'batch_size': {
+                'count': self.batcher.batch_sizes.count,
+                'mean': (self.batcher.batch_sizes.total / self.batcher.batch_sizes.count
+                         if self.batcher.batch_sizes.count else 0.0),
+                'max': self.batcher.batch_sizes.max
+            },
+            'cache': cache_stats()
+        }
+
+    async def _read_request(self, reader):
+        """
+        Return the next request line, b'' at end of stream, or None if the
+        line was longer than the reader's limit (it is then skipped).
+        """
+        too_large = False
+        while True:
+            try:
+                line = await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError as e:
+                line = e.partial
+            except asyncio.LimitOverrunError as e:
+                await reader.readexactly(e.consumed)
+                too_large = True
+                continue
+            return None if too_large else line
+
+    async def handle_client(self, reader, writer):
+        """Serve requests from one connection until it closes."""
+        try:
+            while True:
+                line = await self._read_request(reader)
+                if line is None:
+                    response = {'error': "request too large"}
+                    writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                    await writer.drain()
+                    continue
+                if not line:
+                    break
+                line = line.decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+
+                if line.upper() == 'STATS':
+                    response = self.stats()
+                else:
+                    start = time.perf_counter()
+                    try:
+                        emails, is_batch = parse_request(line)
+                    except ValueError as e:
+                        response = {'error': f"Bad request: {e}"}
+                    else:
+                        results = await self.batcher.validate(emails)
+                        response = results if is_batch else results[0]
+                        self.latency.record(time.perf_counter() - start)
+
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host='127.0.0.1', port=8025, unix_path=None, max_batch=512,
+                max_delay=0.002, fail_fast=False, limit=MAX_REQUEST_BYTES):
+    """
+    Start the service and run until cancelled.
+
+    Request lines longer than limit bytes get a "request too large" error.
+    """
+    batcher = MicroBatcher(max_batch, max_delay, fail_fast)
+    server = ValidationServer(batcher)
+    batch_task = asyncio.ensure_future(batcher.run())
+
+    if unix_path:
+        listener = await asyncio.start_unix_server(server.handle_client, path=unix_path,
+                                                  limit=limit)
+        print(f"Listening on unix:{unix_path}")
+    else:
+        listener = await asyncio.start_server(server.handle_client, host, port, limit=limit)
+        print(f"Listening on {host}:{port}")
+
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        batch_task.cancel()
+        print(json.dumps(server.stats()['latency']))
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Email validation service.")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP host (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8025, help="TCP port (default 8025)")
+    parser.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--max-batch', type=int, default=512, help="max addresses per batch")
+    parser.add_argument('--max-delay-ms', type=float, default=2.0, help="max wait to fill a batch")
+    parser.add_argument('-d', '--domains', help="precomputed domain index for typo suggestions")
+    parser.add_argument('-m', '--mx-snapshot', help="sorted file of domains with MX records")
+    parser.add_argument('--fail-fast', action='store_true', help="report only the first error per address")
+    args = parser.parse_args()
+
+    if args.domains:
+        try:
+            load_domain_index(args.domains)
+        except (OSError, ValueError) as e:
+            print(f"Error loading domain index: {e}")
+            sys.exit(1)
+
+    if args.mx_snapshot:
+        try:
+            load_mx_snapshot(args.mx_snapshot)
+        except OSError as e:
+            print(f"Error loading MX snapshot: {e}")
+            sys.exit(1)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.max_batch,
+                          args.max_delay_ms / 1000, args.fail_fast))
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+
+
+if __name__ == "__main__":
+    main()
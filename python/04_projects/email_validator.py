@@ -5,14 +5,188 @@ Email Validator CLI - Project Implementation
 Validates email addresses using regex and provides detailed feedback.
 """
 
-import re
+import argparse
+import csv
 import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
+import patterns
+from domain_snapshot import DomainSnapshot
+from domain_suggester import COMMON_DOMAINS, DomainIndex
 
-def validate_email(email):
+
+# Basic pattern, compiled once at import
+EMAIL_PATTERN = patterns.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Longest address worth running the regex on (64 local + '@' + 255 domain)
+MAX_EMAIL_LENGTH = 320
+
+
+class ValidationCache:
+    """
+    Bounded LRU cache with optional time-to-live and hit/miss counters.
+    
+    Args:
+        maxsize: max number of entries kept
+        ttl: seconds an entry stays valid (None = forever)
+    """
+    
+    def __init__(self, maxsize=100000, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        """Return cached value for key, or None on a miss."""
+        entry = self.data.get(key)
+        if entry is not None:
+            value, expires = entry
+            if expires is None or expires > time.monotonic():
+                self.data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self.data[key]
+        self.misses += 1
+        return None
+    
+    def put(self, key, value):
+        """Store value for key, evicting the least recently used entry."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self.data[key] = (value, expires)
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all entries and reset counters."""
+        self.data.clear()
+        self.hits = self.misses = 0
+    
+    def stats(self):
+        """Return hit/miss counters as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+# Known-good domains for typo suggestions
+domain_index = DomainIndex(COMMON_DOMAINS)
+domain_index_path = None
+
+
+def load_domain_index(path):
+    """Replace the typo suggestion index with a precomputed index file."""
+    global domain_index, domain_index_path
+    domain_index = DomainIndex.load(path)
+    domain_index_path = path
+    domain_cache.clear()
+    email_cache.clear()
+
+
+# Offline snapshot of domains with MX records (None = check skipped)
+mx_snapshot = None
+mx_snapshot_path = None
+
+
+def load_mx_snapshot(path):
+    """Check domains against a sorted snapshot file of mail domains."""
+    global mx_snapshot, mx_snapshot_path
+    if mx_snapshot is not None:
+        mx_snapshot.close()
+    mx_snapshot = DomainSnapshot(path)
+    mx_snapshot_path = path
+    domain_cache.clear()
+    email_cache.clear()
+
+
+def _init_worker(index_path, snapshot_path):
+    """Give pool workers the same domain data as the parent process."""
+    if index_path:
+        load_domain_index(index_path)
+    if snapshot_path:
+        load_mx_snapshot(snapshot_path)
+
+
+# Full-address results, keyed on the normalized address
+email_cache = ValidationCache(maxsize=100000)
+
+# Domain-level check results, shared by every address at a domain
+domain_cache = ValidationCache(maxsize=100000)
+
+
+def normalize_email(email):
+    """
+    Normalize an address for caching (domains are case-insensitive).
+    
+    Surrounding whitespace is kept: validate_email rejects it, so ' a@b.com'
+    and 'a@b.com' must not share a cache entry. Input without an '@' is
+    returned unchanged, so it cannot collide with an empty local part.
+    """
+    if '@' not in email:
+        return email
+    local_part, _, domain = email.rpartition('@')
+    return f"{local_part}@{domain.lower()}"
+
+
+def check_domain(domain):
+    """
+    Run domain-level checks, caching the outcome per domain.
+    
+    Returns:
+        tuple: (errors, warnings) as tuples of messages
+    """
+    domain_key = domain.lower()
+    cached = domain_cache.get(domain_key)
+    if cached is not None:
+        return cached
+    
+    errors = []
+    warnings = []
+    
+    if len(domain) > 255:
+        errors.append("Domain too long (max 255 characters)")
+    
+    domain_parts = domain.split('.')
+    if len(domain_parts) < 2:
+        errors.append("Domain must have at least one dot")
+    
+    tld = domain_parts[-1]
+    if len(tld) < 2:
+        errors.append("TLD must be at least 2 characters")
+    
+    if mx_snapshot is not None and domain_key not in mx_snapshot:
+        errors.append("Domain has no mail server (not in MX snapshot)")
+    
+    # Check for common typos
+    suggestion = domain_index.suggest(domain_key)
+    if suggestion:
+        warnings.append(f"Did you mean '{suggestion}'?")
+    
+    cached = (tuple(errors), tuple(warnings))
+    domain_cache.put(domain_key, cached)
+    return cached
+
+
+def validate_email(email, fail_fast=False):
     """
     Validate email address and return result with details.
     
+    Checks run in order of cost: length and '@' checks first, then a
+    single partition into local and domain parts, and only then the
+    compiled regex. An address longer than MAX_EMAIL_LENGTH is rejected
+    on length alone, without any further checks. Otherwise, with
+    fail_fast=True validation stops at the first error, and without it
+    every applicable error is collected.
+    
     Returns:
         dict: {
             'valid': bool,
@@ -27,52 +201,244 @@ def validate_email(email):
         'errors': [],
         'warnings': []
     }
+    errors = result['errors']
     
-    # Basic pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    # Stage 1: cheap whole-string checks
+    if len(email) > MAX_EMAIL_LENGTH:
+        errors.append(f"Email too long (max {MAX_EMAIL_LENGTH} characters)")
+        return result
     
-    # Check basic format
-    if not re.match(pattern, email):
-        result['errors'].append("Invalid email format")
+    if email.count('@') != 1:
+        errors.append("Invalid email format")
         return result
     
-    # Split into local and domain parts
-    local_part, domain = email.split('@', 1)
+    # Stage 2: split into local and domain parts
+    local_part, _, domain = email.partition('@')
     
     # Check local part
     if len(local_part) > 64:
-        result['errors'].append("Local part too long (max 64 characters)")
+        errors.append("Local part too long (max 64 characters)")
+        if fail_fast:
+            return result
     
     if local_part.startswith('.') or local_part.endswith('.'):
-        result['errors'].append("Local part cannot start or end with dot")
+        errors.append("Local part cannot start or end with dot")
+        if fail_fast:
+            return result
     
     if '..' in local_part:
-        result['errors'].append("Local part cannot contain consecutive dots")
+        errors.append("Local part cannot contain consecutive dots")
+        if fail_fast:
+            return result
+    
+    # Stage 3: full format check
+    if not EMAIL_PATTERN.match(email):
+        errors.append("Invalid email format")
+        return result
     
     # Check domain
-    if len(domain) > 255:
-        result['errors'].append("Domain too long (max 255 characters)")
+    domain_errors, domain_warnings = check_domain(domain)
+    if domain_errors:
+        errors.extend(domain_errors[:1] if fail_fast else domain_errors)
+    result['warnings'].extend(domain_warnings)
     
-    domain_parts = domain.split('.')
-    if len(domain_parts) < 2:
-        result['errors'].append("Domain must have at least one dot")
+    # Final validation
+    if not errors:
+        result['valid'] = True
     
-    tld = domain_parts[-1]
-    if len(tld) < 2:
-        result['errors'].append("TLD must be at least 2 characters")
+    return result
+
+
+def cached_validate_email(email, fail_fast=False):
+    """Validate email address, reusing results for repeated addresses."""
+    key = (normalize_email(email), fail_fast)
+    cached = email_cache.get(key)
+    if cached is None:
+        result = validate_email(email, fail_fast)
+        email_cache.put(key, (
+            result['valid'],
+            tuple(result['errors']),
+            tuple(result['warnings'])
+        ))
+        return result
     
-    # Check for common typos
-    if 'gmial' in domain.lower():
-        result['warnings'].append("Did you mean 'gmail'?")
+    valid, errors, warnings = cached
+    return {
+        'valid': valid,
+        'email': email,
+        'errors': list(errors),
+        'warnings': list(warnings)
+    }
+
+
+def cache_stats():
+    """Return hit/miss counters for the address and domain caches."""
+    return {
+        'email': email_cache.stats(),
+        'domain': domain_cache.stats()
+    }
+
+
+def validate_batch(emails, cached=True, fail_fast=False):
+    """Validate a list of email addresses (unit of work for the pool)."""
+    validate = cached_validate_email if cached else validate_email
+    return [validate(email, fail_fast) for email in emails]
+
+
+def _chunks(iterable, size):
+    """Split an iterable into lists of at most size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_emails(emails, workers=None, chunksize=10000, cached=True,
+                    fail_fast=False):
+    """
+    Validate many email addresses, yielding results in input order.
     
-    if 'yahooo' in domain.lower():
-        result['warnings'].append("Did you mean 'yahoo'?")
+    With workers set, chunks of addresses are validated in a process pool.
+    At most two chunks per worker are in flight, so arbitrarily large
+    inputs are streamed rather than loaded into memory. With cached=True
+    repeated addresses are served from the validation cache (per process).
+    fail_fast stops each validation at its first error.
+    """
+    if not workers:
+        validate = cached_validate_email if cached else validate_email
+        for email in emails:
+            yield validate(email, fail_fast)
+        return
     
-    # Final validation
-    if not result['errors']:
-        result['valid'] = True
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(domain_index_path, mx_snapshot_path)) as pool:
+        pending = deque()
+        for chunk in _chunks(emails, chunksize):
+            pending.append(pool.submit(validate_batch, chunk, cached, fail_fast))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class ColumnNotFound(Exception):
+    """Raised when a CSV file has no column with the requested name."""
     
-    return result
+    def __init__(self, column, filename):
+        self.column = column
+        self.filename = filename
+        super().__init__(f"Column '{column}' not found in {filename}")
+
+
+def read_emails(filename, column=None):
+    """
+    Stream email addresses from a file.
+    
+    Plain files are read one address per line. For .csv files the
+    address is taken from the named column, or the first column.
+    
+    The file is opened and a CSV header is checked before returning, so
+    a missing file (FileNotFoundError) or column (ColumnNotFound) is
+    reported here rather than partway through iteration.
+    """
+    f = open(filename, 'r', encoding='utf-8', errors='ignore', newline='')
+    try:
+        if not filename.lower().endswith('.csv'):
+            return _read_lines(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        first = None
+        if header is None:
+            index = 0
+        elif column is not None:
+            if column not in header:
+                raise ColumnNotFound(column, filename)
+            index = header.index(column)
+        elif 'email' in header:
+            index = header.index('email')
+        else:
+            index = 0
+            first = header[0].strip()
+        return _read_column(f, reader, index, first)
+    except BaseException:
+        f.close()
+        raise
+
+
+def _read_lines(f):
+    """Yield the non-blank lines of an open file, stripped, then close it."""
+    with f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _read_column(f, reader, index, first):
+    """Yield one CSV column (after an optional first value), then close the file."""
+    with f:
+        if first is not None:
+            yield first
+        for row in reader:
+            if len(row) > index:
+                yield row[index].strip()
+
+
+def write_results(results, output_file):
+    """Write validation results to CSV and return (valid, invalid) counts."""
+    valid = invalid = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['email', 'valid', 'errors', 'warnings'])
+        for result in results:
+            if result['valid']:
+                valid += 1
+            else:
+                invalid += 1
+            writer.writerow([
+                result['email'],
+                result['valid'],
+                '; '.join(result['errors']),
+                '; '.join(result['warnings'])
+            ])
+    return valid, invalid
+
+
+def validate_file(input_file, output_file=None, column=None, workers=None,
+                  fail_fast=False):
+    """Validate every address in a file, optionally writing a CSV report."""
+    try:
+        emails = read_emails(input_file, column)
+    except FileNotFoundError:
+        print(f"Error: File '{input_file}' not found.")
+        return
+    except ColumnNotFound as e:
+        print(f"Error: {e}.")
+        return
+    
+    results = validate_emails(emails, workers, fail_fast=fail_fast)
+    if output_file:
+        valid, invalid = write_results(results, output_file)
+        print(f"✓ Results saved to {output_file}")
+    else:
+        valid = invalid = 0
+        for result in results:
+            if result['valid']:
+                valid += 1
+            else:
+                invalid += 1
+                print(f"✗ {result['email']}: {'; '.join(result['errors'])}")
+    
+    print(f"\nTotal: {valid + invalid}")
+    print(f"Valid: {valid}")
+    print(f"Invalid: {invalid}")
+    
+    if not workers:
+        stats = cache_stats()
+        print(f"Address cache hit rate: {stats['email']['hit_rate']:.1%}")
+        print(f"Domain cache hit rate: {stats['domain']['hit_rate']:.1%}")
 
 
 def print_result(result):
@@ -101,10 +467,37 @@ def print_result(result):
 
 def main():
     """Main function for CLI usage."""
-    if len(sys.argv) > 1:
+    parser = argparse.ArgumentParser(description="Validate email addresses.")
+    parser.add_argument('email', nargs='?', help="email address to validate")
+    parser.add_argument('-f', '--file', help="file of addresses (one per line, or .csv)")
+    parser.add_argument('-o', '--output', help="write results to this CSV file")
+    parser.add_argument('-c', '--column', help="CSV column holding the address")
+    parser.add_argument('-w', '--workers', type=int, help="validate in N processes")
+    parser.add_argument('-d', '--domains', help="precomputed domain index for typo suggestions")
+    parser.add_argument('-m', '--mx-snapshot', help="sorted file of domains with MX records")
+    parser.add_argument('--fail-fast', action='store_true', help="report only the first error per address")
+    args = parser.parse_args()
+    
+    if args.domains:
+        try:
+            load_domain_index(args.domains)
+        except (OSError, ValueError) as e:
+            print(f"Error loading domain index: {e}")
+            sys.exit(1)
+    
+    if args.mx_snapshot:
+        try:
+            load_mx_snapshot(args.mx_snapshot)
+        except OSError as e:
+            print(f"Error loading MX snapshot: {e}")
+            sys.exit(1)
+    
+    if args.file:
+        validate_file(args.file, args.output, args.column, args.workers,
+                      args.fail_fast)
+    elif args.email:
         # Command-line argument provided
-        email = sys.argv[1]
-        result = validate_email(email)
+        result = validate_email(args.email, args.fail_fast)
         print_result(result)
     else:
         # Interactive mode
@@ -7,65 +7,157 @@ Extracts URLs, phone numbers, and email addresses from HTML files.
 
 import re
 import sys
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
+import literal_prefilter
+import patterns
+from pattern_set import PatternSet
 
-def extract_urls(html, base_url=None):
-    """Extract all URLs from HTML."""
-    urls = []
+
+# Single pattern for href and src attributes, compiled once
+LINK_PATTERN = patterns.compile(r'(?:href|src)=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Ports that can be dropped from a canonical URL
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+@lru_cache(maxsize=65536)
+def normalize_url(url, base_url=None):
+    """
+    Resolve a link against base_url and return its canonical form.
     
-    # Pattern for href attributes
-    href_pattern = r'href=["\']([^"\']+)["\']'
-    href_matches = re.findall(href_pattern, html, re.IGNORECASE)
+    Lowercases scheme and host, drops default ports and strips the
+    fragment. Results are cached on (url, base_url), so links repeated
+    across a crawl are only joined and parsed once.
     
-    # Pattern for src attributes
-    src_pattern = r'src=["\']([^"\']+)["\']'
-    src_matches = re.findall(src_pattern, html, re.IGNORECASE)
+    Returns the canonical URL, or '' for empty and fragment-only links
+    (with or without base_url: an in-page anchor is not a new URL).
+    """
+    url = url.strip()
+    if not url or url.startswith('#'):
+        return ''
     
-    # Combine and deduplicate
-    all_urls = set(href_matches + src_matches)
+    # Handle relative and protocol-relative URLs
+    if base_url:
+        url = urljoin(base_url, url)
     
-    for url in all_urls:
-        # Handle relative URLs
-        if base_url and not url.startswith(('http://', 'https://', '//')):
-            url = urljoin(base_url, url)
-        urls.append(url)
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc
     
-    return sorted(set(urls))
+    if netloc:
+        host = parts.hostname or ''
+        if ':' in host:
+            host = f"[{host}]"  # IPv6 literal
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        if port is not None and DEFAULT_PORTS.get(scheme) != port:
+            host = f"{host}:{port}"
+        userinfo = netloc.rpartition('@')[0]
+        netloc = f"{userinfo}@{host}" if userinfo else host
+    
+    return urlunsplit((scheme, netloc, parts.path, parts.query, ''))
 
 
-def extract_phone_numbers(html):
-    """Extract phone numbers from HTML."""
-    phone_numbers = []
+def extract_urls(html, base_url=None):
+    """Extract all URLs from HTML."""
+    urls = set()
     
-    # Pattern for various phone formats
-    patterns = [
-        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',           # XXX-XXX-XXXX
-        r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',             # (XXX) XXX-XXXX
-        r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
-        r'\b\d{10}\b',                               # XXXXXXXXXX
-    ]
+    # One scan over the document for both href and src attributes
+    for url in LINK_PATTERN.findall(html):
+        url = normalize_url(url, base_url)
+        if url:
+            urls.add(url)
     
-    for pattern in patterns:
-        matches = re.findall(pattern, html)
-        phone_numbers.extend(matches)
+    return sorted(urls)
+
+
+# Patterns for various phone formats, scanned together in one pass
+PHONE_PATTERNS = PatternSet([
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',           # XXX-XXX-XXXX
+    r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',             # (XXX) XXX-XXXX
+    r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
+    r'\b\d{10}\b',                               # XXXXXXXXXX
+])
+
+NON_DIGIT = patterns.compile(r'\D')
+
+
+def normalize_phone(number, default_country='1'):
+    """
+    Map a phone number to an E.164-like canonical key.
+    
+    '555-123-4567', '(555) 123-4567' and '5551234567' all become
+    '+15551234567'. Numbers written with a leading '+' keep their
+    own country code.
+    """
+    digits = NON_DIGIT.sub('', number)
+    if number.startswith('+'):
+        return '+' + digits
+    if len(digits) == 10:
+        return '+' + default_country + digits
+    return '+' + digits
+
+
+def extract_phone_numbers(html, canonical=False):
+    """
+    Extract phone numbers from HTML.
+    
+    All phone formats are matched through one PatternSet: a merged scan
+    for the two digit-only formats plus a prefix search each for the '('
+    and '+' formats. Where hits overlap, the leftmost wins, and the
+    longest format matching at that position; numbers are deduplicated
+    on their canonical key. Returns the first spelling seen for each
+    number, or the canonical keys when canonical=True.
+    """
+    phone_numbers = {}
+    for _, match in PHONE_PATTERNS.finditer(html, longest=True):
+        number = match.group()
+        key = normalize_phone(number)
+        if key not in phone_numbers:
+            phone_numbers[key] = number
     
-    # Remove duplicates and clean
-    return sorted(set(phone_numbers))
+    if canonical:
+        return sorted(phone_numbers)
+    return sorted(phone_numbers.values())
+
+
+# Pattern for email addresses; only lines containing '@' are scanned
+EMAIL_PATTERN = literal_prefilter.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 
 
 def extract_emails(html):
     """Extract email addresses from HTML."""
-    # Pattern for email addresses
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(pattern, html)
+    emails = EMAIL_PATTERN.findall(html)
     
     # Remove duplicates
     return sorted(set(emails))
 
 
-def scrape_html_file(filename, base_url=None):
-    """Scrape HTML file and extract all data."""
+def extract_all(html, base_url=None):
+    """Strip scripts and styles, then extract URLs, phones and emails."""
+    # Remove script and style content (they often contain false positives)
+    html = patterns.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = patterns.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    
+    return {
+        'urls': extract_urls(html, base_url),
+        'phone_numbers': extract_phone_numbers(html),
+        'emails': extract_emails(html)
+    }
+
+
+def scrape_html_file(filename, base_url=None, timeout=None):
+    """
+    Scrape HTML file and extract all data.
+    
+    With timeout set, extraction runs in a worker process that is killed
+    if it takes longer than timeout seconds, so a crafted page cannot
+    hang the scraper.
+    """
     try:
         with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
             html = f.read()
@@ -76,17 +168,43 @@ def scrape_html_file(filename, base_url=None):
         print(f"Error reading file: {e}")
         return None
     
-    # Remove script and style content (they often contain false positives)
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    if timeout is None:
+        return extract_all(html, base_url)
     
-    results = {
-        'urls': extract_urls(html, base_url),
-        'phone_numbers': extract_phone_numbers(html),
-        'emails': extract_emails(html)
-    }
+    from safe_match import MatchTimeout, call_with_timeout
+    try:
+        return call_with_timeout(extract_all, (html, base_url), timeout)
+    except MatchTimeout as e:
+        print(f"Error: Timed out scraping '{filename}' ({e.input_length} chars) after {e.timeout}s")
+        return None
+
+
+def scrape_html_files(filenames, base_url=None, store=None, timeout=None):
+    """
+    Scrape many HTML files, yielding only entities not seen before.
+    
+    Uniqueness is tracked across all files in a DedupStore, so memory
+    stays bounded no matter how many pages are scraped.
+    
+    Yields (filename, results) tuples.
+    """
+    from dedup_store import DedupStore
     
-    return results
+    own_store = store is None
+    if own_store:
+        store = DedupStore()
+    
+    try:
+        for filename in filenames:
+            results = scrape_html_file(filename, base_url, timeout)
+            if results is None:
+                continue
+            for kind, values in results.items():
+                results[kind] = [v for v in values if store.add(f"{kind}:{v}")]
+            yield filename, results
+    finally:
+        if own_store:
+            store.close()
 
 
 def print_results(results):
@@ -0,0 +1,774 @@
+#!/usr/bin/env python3
+"""
+Lazy DFA Engine - Project Implementation
+
+Linear-time matching for the backtracking-free subset of regular
+expressions (no backreferences, lookarounds, atomic groups or possessive
+quantifiers).
+
+A pattern is compiled to a Thompson NFA, and DFA states (ordered sets of
+NFA states) are built lazily as input characters are seen and cached, so
+each input character costs one dictionary lookup once the cache is warm.
+Matching never backtracks: time is linear in the input whatever the
+pattern, including the nested-quantifier patterns that make `re` hang.
+
+Results follow `re` semantics (leftmost-first, greedy/lazy preference):
+a forward scan finds where the leftmost match ends, then a reverse scan
+finds where it starts. Capture groups are not tracked by the DFA; they
+are filled in by `re` on first access to a group.
+
+Patterns outside the supported subset, and patterns that can match the
+empty string, are compiled with `re` instead, so `compile()` is always
+safe to use.
+
+Usage:
+    import lazy_dfa
+    pattern = lazy_dfa.compile(r'\\d{4}-\\d{2}-\\d{2}')
+    for match in pattern.finditer(text):
+        print(match.span(), match.group())
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import patterns
+import regex_ast
+from regex_ast import (
+    ANY, AT, BRANCH, CATEGORY, IN, LITERAL, MAX_REPEAT, MAXREPEAT, MIN_REPEAT,
+    NEGATE, NOT_LITERAL, RANGE, SUBPATTERN, sre_parse,
+)
+
+# NFA state kinds
+CHAR, SPLIT, ASSERT_AT, MATCH = range(4)
+
+# Context kinds for the character on either side of a position
+EDGE, NEWLINE, FINAL_NEWLINE, WORD, OTHER = range(5)
+LINE_STARTS = (EDGE, NEWLINE, FINAL_NEWLINE)
+
+# Transition key for a '\n' that is the last character of the input
+FINAL = object()
+
+MAX_NFA_STATES = 20000
+
+ASCII_WORD = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+ASCII_SPACE = frozenset(' \t\n\r\f\v')
+ASCII_DIGIT = frozenset('0123456789')
+
+UNSUPPORTED_FLAGS = re.IGNORECASE | re.LOCALE
+
+
+class Unsupported(Exception):
+    """Raised when a pattern uses features the DFA engine cannot run."""
+
+
+def _category_test(category, ascii_only):
+    """Return a predicate for a \\d/\\s/\\w style category."""
+    if category == sre_parse.CATEGORY_DIGIT:
+        return ASCII_DIGIT.__contains__ if ascii_only else str.isdecimal
+    if category == sre_parse.CATEGORY_NOT_DIGIT:
+        return (lambda c: c not in ASCII_DIGIT) if ascii_only else (lambda c: not c.isdecimal())
+    if category == sre_parse.CATEGORY_SPACE:
+        return ASCII_SPACE.__contains__ if ascii_only else str.isspace
+    if category == sre_parse.CATEGORY_NOT_SPACE:
+        return (lambda c: c not in ASCII_SPACE) if ascii_only else (lambda c: not c.isspace())
+    if category == sre_parse.CATEGORY_WORD:
+        return ASCII_WORD.__contains__ if ascii_only else (lambda c: c.isalnum() or c == '_')
+    if category == sre_parse.CATEGORY_NOT_WORD:
+        if ascii_only:
+            return lambda c: c not in ASCII_WORD
+        return lambda c: not (c.isalnum() or c == '_')
+    raise Unsupported(f"category {category}")
+
+
+def _char_test(op, av, flags):
+    """Return a predicate for a single-character item."""
+    ascii_only = bool(flags & re.ASCII)
+    if op is LITERAL:
+        return chr(av).__eq__
+    if op is NOT_LITERAL:
+        return chr(av).__ne__
+    if op is ANY:
+        return (lambda c: True) if flags & re.DOTALL else '\n'.__ne__
+
+    negate = False
+    chars = set()
+    ranges = []
+    tests = []
+    for in_op, in_av in av:
+        if in_op is NEGATE:
+            negate = True
+        elif in_op is LITERAL:
+            chars.add(chr(in_av))
+        elif in_op is RANGE:
+            ranges.append(in_av)
+        elif in_op is CATEGORY:
+            tests.append(_category_test(in_av, ascii_only))
+        else:
+            raise Unsupported(f"class item {in_op}")
+
+    def test(c):
+        if c in chars:
+            return not negate
+        code = ord(c)
+        for low, high in ranges:
+            if low <= code <= high:
+                return not negate
+        for category in tests:
+            if category(c):
+                return not negate
+        return negate
+
+    return test
+
+
+class _NFA:
+    """Thompson NFA built from a parsed pattern, forwards or reversed."""
+
+    def __init__(self, items, flags, reverse=False):
+        self.flags = flags
+        self.reverse = reverse
+        self.kinds = []
+        self.args = []
+        match = self._add(MATCH, None)
+        self.start = self._sequence(items, match)
+
+    def _add(self, kind, arg):
+        if len(self.kinds) >= MAX_NFA_STATES:
+            raise Unsupported("pattern too large")
+        self.kinds.append(kind)
+        self.args.append(arg)
+        return len(self.kinds) - 1
+
+    def _sequence(self, items, next_state):
+        """Build items so they end at next_state; return the entry state."""
+        order = items if self.reverse else reversed(items)
+        for op, av in order:
+            next_state = self._item(op, av, next_state)
+        return next_state
+
+    def _item(self, op, av, next_state):
+        if op in (LITERAL, NOT_LITERAL, ANY, IN):
+            return self._add(CHAR, (_char_test(op, av, self.flags), next_state))
+        if op is SUBPATTERN:
+            if av[1] or av[2]:
+                raise Unsupported("scoped inline flags")
+            return self._sequence(av[-1], next_state)
+        if op is BRANCH:
+            return self._add(SPLIT, [self._sequence(branch, next_state) for branch in av[1]])
+        if op is AT:
+            code = self._at_code(av)
+            _check_at(code, EDGE, EDGE)
+            return self._add(ASSERT_AT, (code, next_state))
+        if op in (MAX_REPEAT, MIN_REPEAT):
+            return self._repeat(av, op is MAX_REPEAT, next_state)
+        raise Unsupported(f"{op}".lower())
+
+    def _at_code(self, code):
+        if self.flags & re.MULTILINE:
+            if code == sre_parse.AT_BEGINNING:
+                return sre_parse.AT_BEGINNING_LINE
+            if code == sre_parse.AT_END:
+                return sre_parse.AT_END_LINE
+        return code
+
+    def _repeat(self, av, greedy, next_state):
+        low, high, body = av
+        if regex_ast.nullable(body):
+            raise Unsupported("repeat of a sub-pattern that can match empty")
+
+        if high == MAXREPEAT:
+            loop = self._add(SPLIT, None)
+            body_entry = self._sequence(body, loop)
+            self.args[loop] = [body_entry, next_state] if greedy else [next_state, body_entry]
+            current = loop
+        else:
+            current = next_state
+            for _ in range(high - low):
+                body_entry = self._sequence(body, current)
+                current = self._add(
+                    SPLIT, [body_entry, next_state] if greedy else [next_state, body_entry])
+        for _ in range(low):
+            current = self._sequence(body, current)
+        return current
+
+
+def _first_items(items):
+    """
+    Return (single-char items a match can start with, nullable).
+
+    Assertions are treated as always passing, so the result is a superset.
+    """
+    first = []
+    for op, av in items:
+        if op in (LITERAL, NOT_LITERAL, ANY, IN):
+            first.append((op, av))
+            return first, False
+        if op is SUBPATTERN:
+            sub, is_nullable = _first_items(av[-1])
+        elif op is BRANCH:
+            sub, is_nullable = [], False
+            for branch in av[1]:
+                branch_first, branch_nullable = _first_items(branch)
+                sub += branch_first
+                is_nullable = is_nullable or branch_nullable
+        elif op in (MAX_REPEAT, MIN_REPEAT):
+            sub, is_nullable = _first_items(av[2])
+            is_nullable = is_nullable or av[0] == 0
+        else:
+            sub, is_nullable = [], True
+        first += sub
+        if not is_nullable:
+            return first, False
+    return first, True
+
+
+CATEGORY_SOURCE = {
+    sre_parse.CATEGORY_DIGIT: r'\d', sre_parse.CATEGORY_NOT_DIGIT: r'\D',
+    sre_parse.CATEGORY_SPACE: r'\s', sre_parse.CATEGORY_NOT_SPACE: r'\S',
+    sre_parse.CATEGORY_WORD: r'\w', sre_parse.CATEGORY_NOT_WORD: r'\W',
+}
+
+
+def _class_source(op, av):
+    """Rebuild regex source for a single-character item."""
+    if op is LITERAL:
+        return re.escape(chr(av))
+    if op is NOT_LITERAL:
+        return '[^' + re.escape(chr(av)) + ']'
+    parts = []
+    for in_op, in_av in av:
+        if in_op is NEGATE:
+            parts.insert(0, '^')
+        elif in_op is LITERAL:
+            parts.append(re.escape(chr(in_av)))
+        elif in_op is RANGE:
+            parts.append(re.escape(chr(in_av[0])) + '-' + re.escape(chr(in_av[1])))
+        else:
+            parts.append(CATEGORY_SOURCE[in_av])
+    return '[' + ''.join(parts) + ']'
+
+
+def _prefilter(items, flags):
+    """
+    Compile an `re` pattern matching any character a match can start with.
+
+    Used to skip input between matches at C speed. Returns None when
+    almost any character can start a match.
+    """
+    first, _ = _first_items(items)
+    if not first or any(op is ANY for op, _ in first):
+        return None
+    source = '|'.join(sorted({_class_source(op, av) for op, av in first}))
+    return patterns.compile(source, flags & re.ASCII)
+
+
+def _check_at(code, left, right):
+    """Evaluate a zero-width assertion between two context kinds."""
+    if code == sre_parse.AT_BEGINNING or code == sre_parse.AT_BEGINNING_STRING:
+        return left == EDGE
+    if code == sre_parse.AT_BEGINNING_LINE:
+        return left in LINE_STARTS
+    if code == sre_parse.AT_END:
+        return right == EDGE or right == FINAL_NEWLINE
+    if code == sre_parse.AT_END_LINE:
+        return right in LINE_STARTS
+    if code == sre_parse.AT_END_STRING:
+        return right == EDGE
+    if code == sre_parse.AT_BOUNDARY:
+        return (left == WORD) != (right == WORD)
+    if code == sre_parse.AT_NON_BOUNDARY:
+        return (left == WORD) == (right == WORD)
+    raise Unsupported(f"assertion {code}")
+
+
+class _State:
+    """
+    One DFA state: pending NFA states in priority order, the kind of the
+    character already consumed, and whether new match attempts may start.
+    """
+
+    __slots__ = ('threads', 'context', 'unanchored', 'dead', 'idle', 'next', 'final')
+
+    def __init__(self, threads, context, unanchored):
+        self.threads = threads
+        self.context = context
+        self.unanchored = unanchored
+        self.dead = not threads and not unanchored
+        self.idle = not threads and unanchored
+        self.next = {}
+        self.final = {}
+
+
+class _DFA:
+    """
+    Lazily built DFA over an NFA.
+
+    In leftmost-first mode, threads of lower priority than a thread that
+    reached MATCH are dropped, which reproduces backtracking preference.
+    In longest mode every thread is kept.
+    """
+
+    def __init__(self, nfa, leftmost_first=True, max_states=10000):
+        self.nfa = nfa
+        self.leftmost_first = leftmost_first
+        self.max_states = max_states
+        self.word = ASCII_WORD.__contains__ if nfa.flags & re.ASCII else None
+        self.states = {}
+        self.flushes = 0
+
+    def kind(self, c, final=False):
+        """Classify a character for assertion checks."""
+        if c == '\n':
+            return FINAL_NEWLINE if final else NEWLINE
+        if self.word is not None:
+            return WORD if self.word(c) else OTHER
+        return WORD if c.isalnum() or c == '_' else OTHER
+
+    def state(self, threads, context, unanchored):
+        """Return the cached state for this key, flushing a full cache."""
+        key = (threads, context, unanchored)
+        state = self.states.get(key)
+        if state is None:
+            if len(self.states) >= self.max_states:
+                for old in self.states.values():
+                    old.next.clear()
+                    old.final.clear()
+                self.states.clear()
+                self.flushes += 1
+            state = self.states[key] = _State(threads, context, unanchored)
+        return state
+
+    def _closure(self, state, left, right):
+        """Follow splits and assertions; return (char states, matched)."""
+        kinds = self.nfa.kinds
+        args = self.nfa.args
+        threads = state.threads + (self.nfa.start,) if state.unanchored else state.threads
+        stack = list(reversed(threads))
+        seen = set()
+        consuming = []
+        matched = False
+        while stack:
+            s = stack.pop()
+            if s in seen:
+                continue
+            seen.add(s)
+            kind = kinds[s]
+            if kind == CHAR:
+                consuming.append(s)
+            elif kind == SPLIT:
+                stack.extend(reversed(args[s]))
+            elif kind == ASSERT_AT:
+                if _check_at(args[s][0], left, right):
+                    stack.append(args[s][1])
+            else:
+                matched = True
+                if self.leftmost_first:
+                    break
+        return consuming, matched
+
+    def transition(self, state, c, key, kind):
+        """Compute and cache the transition of state on character c."""
+        if self.nfa.reverse:
+            consuming, matched = self._closure(state, kind, state.context)
+        else:
+            consuming, matched = self._closure(state, state.context, kind)
+        args = self.nfa.args
+        threads = []
+        for s in consuming:
+            test, target = args[s]
+            if test(c) and target not in threads:
+                threads.append(target)
+        unanchored = state.unanchored and not matched
+        result = (self.state(tuple(threads), kind, unanchored), matched)
+        state.next[key] = result
+        return result
+
+    def accepts(self, state, kind):
+        """Return True if state matches with kind on the far side."""
+        matched = state.final.get(kind)
+        if matched is None:
+            if self.nfa.reverse:
+                matched = self._closure(state, kind, state.context)[1]
+            else:
+                matched = self._closure(state, state.context, kind)[1]
+            state.final[kind] = matched
+        return matched
+
+
+class LinearMatch:
+    """
+    Match object returned by LinearPattern.
+
+    The overall span comes from the DFA; groups are resolved with `re`
+    the first time they are requested.
+    """
+
+    def __init__(self, pattern, string, start, end, pos, endpos, full=False):
+        self.re = pattern
+        self.string = string
+        self.pos = pos
+        self.endpos = endpos
+        self._span = (start, end)
+        self._match = None
+        self._fullmatch = full
+
+    def _full(self):
+        if self._match is None:
+            method = self.re.compiled.fullmatch if self._fullmatch else self.re.compiled.match
+            self._match = method(self.string, self._span[0], self.endpos)
+        return self._match
+
+    def group(self, *groups):
+        if not groups or groups == (0,):
+            return self.string[self._span[0]:self._span[1]]
+        return self._full().group(*groups)
+
+    def __getitem__(self, group):
+        return self.group(group)
+
+    def groups(self, default=None):
+        if not self.re.groups:
+            return ()
+        return self._full().groups(default)
+
+    def groupdict(self, default=None):
+        if not self.re.groupindex:
+            return {}
+        return self._full().groupdict(default)
+
+    def span(self, group=0):
+        return self._span if group == 0 else self._full().span(group)
+
+    def start(self, group=0):
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        return self.span(group)[1]
+
+    def __repr__(self):
+        return f"<LinearMatch object; span={self._span!r}, match={self.group()!r}>"
+
+
+class LinearPattern:
+    """
+    Compiled pattern that matches with lazy DFAs in linear time.
+
+    Mirrors the re.Pattern methods used in this project: search, match,
+    fullmatch, finditer and findall (with pos/endpos).
+
+    Raises Unsupported if the pattern is outside the supported subset.
+    """
+
+    def __init__(self, pattern, flags=0, max_states=10000):
+        if not isinstance(pattern, str):
+            raise Unsupported("bytes patterns")
+        self.compiled = patterns.compile(pattern, flags)
+        self.pattern = pattern
+        self.flags = self.compiled.flags
+        self.groups = self.compiled.groups
+        self.groupindex = self.compiled.groupindex
+        if self.flags & UNSUPPORTED_FLAGS:
+            raise Unsupported("IGNORECASE/LOCALE")
+
+        items, parsed_flags = regex_ast.parse(pattern, flags)
+        if regex_ast.nullable(items):
+            raise Unsupported("pattern can match the empty string")
+        self.prefilter = _prefilter(items, parsed_flags)
+        forward = _NFA(items, parsed_flags)
+        backward = _NFA(items, parsed_flags, reverse=True)
+        self.forward = _DFA(forward, True, max_states)
+        self.backward = _DFA(backward, False, max_states)
+        self.anchored = _DFA(forward, True, max_states)
+        self.longest = _DFA(forward, False, max_states)
+
+    def _left(self, dfa, string, pos, endpos):
+        if pos == 0:
+            return EDGE
+        return dfa.kind(string[pos - 1], pos == endpos)
+
+    def _right(self, dfa, string, pos, endpos):
+        if pos >= endpos:
+            return EDGE
+        return dfa.kind(string[pos], pos == endpos - 1)
+
+    def _scan_forward(self, dfa, string, pos, endpos, unanchored):
+        """Return the end of the match found by dfa, or -1."""
+        state = dfa.state((() if unanchored else (dfa.nfa.start,)),
+                          self._left(dfa, string, pos, endpos), unanchored)
+        prefilter = self.prefilter if unanchored else None
+        last = -1
+        stop = endpos - 1
+        i = pos
+        while i < stop:
+            if state.idle and prefilter is not None:
+                # No attempt in progress: jump to the next possible first char
+                found = prefilter.search(string, i, endpos)
+                if found is None:
+                    return -1
+                if found.start() != i:
+                    i = found.start()
+                    state = dfa.state((), dfa.kind(string[i - 1]), True)
+                    if i == stop:
+                        break
+            c = string[i]
+            step = state.next.get(c)
+            if step is None:
+                step = dfa.transition(state, c, c, dfa.kind(c))
+            state, matched = step
+            if matched:
+                last = i
+            if state.dead:
+                return last
+            i += 1
+
+        if i == stop:
+            c = string[stop]
+            key = FINAL if c == '\n' else c
+            step = state.next.get(key)
+            if step is None:
+                step = dfa.transition(state, c, key, dfa.kind(c, True))
+            state, matched = step
+            if matched:
+                last = stop
+            if state.dead:
+                return last
+        if dfa.accepts(state, EDGE):
+            last = endpos
+        return last
+
+    def _scan_backward(self, string, pos, end, endpos):
+        """Return the leftmost start of a match ending at end."""
+        dfa = self.backward
+        state = dfa.state((dfa.nfa.start,), self._right(dfa, string, end, endpos), False)
+        first = -1
+        for i in range(end - 1, pos - 1, -1):
+            c = string[i]
+            key = FINAL if c == '\n' and i == endpos - 1 else c
+            step = state.next.get(key)
+            if step is None:
+                step = dfa.transition(state, c, key, dfa.kind(c, key is FINAL))
+            state, matched = step
+            if matched:
+                first = i + 1
+            if state.dead:
+                return first
+        if dfa.accepts(state, self._left(dfa, string, pos, endpos)):
+            first = pos
+        return first
+
+    def _bounds(self, string, pos, endpos):
+        length = len(string)
+        if endpos is None or endpos > length:
+            endpos = length
+        return max(pos, 0), max(endpos, 0)
+
+    def search(self, string, pos=0, endpos=None):
+        pos, endpos = self._bounds(string, pos, endpos)
+        if pos > endpos:
+            return None
+        end = self._scan_forward(self.forward, string, pos, endpos, True)
+        if end < 0:
+            return None
+        start = self._scan_backward(string, pos, end, endpos)
+        return LinearMatch(self, string, start, end, pos, endpos)
+
+    def match(self, string, pos=0, endpos=None):
+        pos, endpos = self._bounds(string, pos, endpos)
+        if pos > endpos:
+            return None
+        end = self._scan_forward(self.anchored, string, pos, endpos, False)
+        if end < 0:
+            return None
+        return LinearMatch(self, string, pos, end, pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=None):
+        pos, endpos = self._bounds(string, pos, endpos)
+        if pos > endpos:
+            return None
+        if self._scan_forward(self.longest, string, pos, endpos, False) != endpos:
+            return None
+        return LinearMatch(self, string, pos, endpos, pos, endpos, full=True)
+
+    def finditer(self, string, pos=0, endpos=None):
+        pos, endpos = self._bounds(string, pos, endpos)
+        while pos <= endpos:
+            match = self.search(string, pos, endpos)
+            if match is None:
+                return
+            yield match
+            pos = match.end()
+
+    def findall(self, string, pos=0, endpos=None):
+        if not self.groups:
+            return [match.group() for match in self.finditer(string, pos, endpos)]
+        if self.groups == 1:
+            return [match.group(1) or '' for match in self.finditer(string, pos, endpos)]
+        return [match.groups('') for match in self.finditer(string, pos, endpos)]
+
+    def stats(self):
+        """Return DFA cache sizes and flush counts."""
+        dfas = {'forward': self.forward, 'backward': self.backward,
+                'anchored': self.anchored, 'longest': self.longest}
+        return {name: {'states': len(dfa.states), 'flushes': dfa.flushes}
+                for name, dfa in dfas.items()}
+
+    def __repr__(self):
+        return f"lazy_dfa.compile({self.pattern!r})"
+
+
+def supported(pattern, flags=0):
+    """Return (True, None) or (False, reason) for the DFA engine."""
+    try:
+        LinearPattern(pattern, flags)
+    except Unsupported as e:
+        return False, str(e)
+    return True, None
+
+
+def compile(pattern, flags=0, max_states=10000):
+    """
+    Compile pattern with the DFA engine, falling back to `re`.
+
+    Returns a LinearPattern when the pattern is supported, otherwise the
+    re.Pattern from the shared pattern cache. Both expose search, match,
+    fullmatch, finditer and findall.
+    """
+    try:
+        return LinearPattern(pattern, flags, max_states)
+    except Unsupported:
+        return patterns.compile(pattern, flags)
+
+
+def search(pattern, string, flags=0):
+    """DFA equivalent of re.search."""
+    return compile(pattern, flags).search(string)
+
+
+def finditer(pattern, string, flags=0):
+    """DFA equivalent of re.finditer."""
+    return compile(pattern, flags).finditer(string)
+
+
+def findall(pattern, string, flags=0):
+    """DFA equivalent of re.findall."""
+    return compile(pattern, flags).findall(string)
+
+
+# Lesson patterns used for the benchmark, with a sample line to repeat
+BENCHMARKS = [
+    ('ip_address', r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}',
+     "request from 192.168.1.10 forwarded to 10.0.0.1 at noon; "),
+    ('date', r'\d{4}-\d{2}-\d{2}',
+     "invoice 4471 issued 2024-03-15, due 2024-04-15 per terms. "),
+    ('phone', r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+     "Call 555-123-4567 or 555.987.6543 between 9 and 5 daily. "),
+    ('hex_color', r'#[0-9a-fA-F]{6}',
+     "body { color: #1a2b3c; background: #FFFFFF; margin: 0 } "),
+    ('capitalized', r'\b[A-Z][a-z]+\b',
+     "Alice met Bob in Paris before the meeting with Carol. "),
+    ('url_components', r'(https?)://([^/]+)(/[^\s?]*)?(\?[^\s]*)?',
+     "see https://example.com/path/to/page?id=123 for details "),
+]
+
+# Exponential under backtracking, linear here: (name, pattern, prefix, unit, suffix)
+PATHOLOGICAL = [
+    ('nested_quantifier', r'(\w+\s?)+$', '', 'a', '!'),
+    ('nested_parentheses', r'\(([^()]+|\([^()]*\))*\)', '(', 'a', ''),
+]
+
+
+def _time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(size=100000, repeat=3, attack_size=20):
+    """
+    Compare finditer throughput of re and the DFA engine.
+
+    Returns a list of result dicts; results must agree or an
+    AssertionError is raised.
+    """
+    results = []
+    for name, pattern, line in BENCHMARKS:
+        text = line * (size // len(line) + 1)
+        expected = [m.span() for m in re.finditer(pattern, text)]
+        linear = LinearPattern(pattern)
+        actual = [m.span() for m in linear.finditer(text)]
+        assert actual == expected, f"{name}: DFA results differ from re"
+
+        re_time = _time(lambda: list(patterns.compile(pattern).finditer(text)), repeat)
+        dfa_time = _time(lambda: list(linear.finditer(text)), repeat)
+        results.append({'name': name, 'chars': len(text), 'matches': len(expected),
+                        're_ms': re_time * 1000, 'dfa_ms': dfa_time * 1000})
+
+    for name, pattern, prefix, unit, suffix in PATHOLOGICAL:
+        text = prefix + unit * attack_size + suffix
+        linear = LinearPattern(pattern)
+        dfa_time = _time(lambda: linear.search(text), repeat)
+        re_time = _time(lambda: re.search(pattern, text), 1)
+        assert (linear.search(text) is None) == (re.search(pattern, text) is None)
+        results.append({'name': name, 'chars': len(text), 'matches': 0,
+                        're_ms': re_time * 1000, 'dfa_ms': dfa_time * 1000})
+    return results
+
+
+def print_benchmark(results):
+    print(f"{'Pattern':<20} {'Chars':>8} {'Matches':>8} {'re ms':>10} {'DFA ms':>10} {'Speedup':>9}")
+    print("-" * 69)
+    for r in results:
+        speedup = r['re_ms'] / r['dfa_ms'] if r['dfa_ms'] else float('inf')
+        print(f"{r['name']:<20} {r['chars']:>8} {r['matches']:>8} "
+              f"{r['re_ms']:>10.2f} {r['dfa_ms']:>10.2f} {speedup:>8.2f}x")
+
+
+def main():
+    """Search a file with the DFA engine, or run the benchmark."""
+    parser = argparse.ArgumentParser(description="Linear-time regex search with a lazy DFA.")
+    parser.add_argument('pattern', nargs='?', help="regex pattern")
+    parser.add_argument('file', nargs='?', help="file to search (default stdin)")
+    parser.add_argument('--benchmark', action='store_true', help="compare against re on lesson patterns")
+    parser.add_argument('--size', type=int, default=100000, help="benchmark input size in chars")
+    parser.add_argument('--attack-size', type=int, default=20,
+                        help="length of the pathological benchmark inputs")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print_benchmark(benchmark(args.size, attack_size=args.attack_size))
+        return
+    if not args.pattern:
+        parser.error("a pattern is required unless --benchmark is given")
+
+    try:
+        ok, reason = supported(args.pattern)
+        pattern = compile(args.pattern)
+    except re.error as e:
+        print(f"Error: invalid pattern: {e}")
+        sys.exit(1)
+    print(f"Engine: {'lazy DFA' if ok else 're (' + reason + ')'}")
+
+    try:
+        if args.file:
+            with open(args.file, 'r', encoding='utf-8', errors='ignore') as f:
+                text = f.read()
+        else:
+            text = sys.stdin.read()
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+
+    count = 0
+    for match in pattern.finditer(text):
+        count += 1
+        print(f"{match.start()}-{match.end()}: {match.group()}")
+    print(f"Matches: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Lesson Benchmark - Project Implementation
+
+Times every pattern used in the lesson examples (python/01_basics to
+03_advanced) without running the examples themselves, which interleave
+matching with print.
+
+Each example function is read with `ast`: calls like re.search(pattern,
+text) are collected, and the pattern and input arguments are resolved to
+the string literals assigned to them in the function, including loop
+variables such as `for text in test_cases`. Every discovered case is then
+timed:
+
+- compiled: re.compile(pattern).<op>(text) per input
+- uncompiled: re.<op>(pattern, text), which pays re's cache lookup
+- scaling: finditer over a synthetic corpus built from the inputs at
+  growing sizes, giving ns/char, ns/match and a fitted growth exponent
+
+Results can be written to JSON and compared against a stored baseline.
+A case slower than the baseline by more than the tolerance, or newly
+super-linear, is timed again and reported only if it still regresses on
+every re-run. Confirmed regressions set exit status 1; with
+--warn-only-timing, slowdowns are printed as warnings and only a growth
+exponent crossing MAX_EXPONENT fails, for machines whose wall clock
+times drift too much to gate on.
+
+Usage:
+    python lesson_benchmark.py --list
+    python lesson_benchmark.py --output baseline.json
+    python lesson_benchmark.py --baseline baseline.json --tolerance 0.25 --confirm 2
+    python lesson_benchmark.py --baseline baseline.json --warn-only-timing
+"""
+
+import argparse
+import ast
+import json
+import platform
+import re
+import sys
+import time
+import timeit
+from pathlib import Path
+
+from redos_analyzer import growth_exponent
+
+LESSONS_DIR = Path(__file__).resolve().parent.parent
+LESSON_PACKAGES = ('01_basics', '02_intermediate', '03_advanced')
+
+# re functions the lessons call: name -> position of the input argument
+OPERATIONS = {
+    'match': 1, 'fullmatch': 1, 'search': 1, 'findall': 1,
+    'finditer': 1, 'split': 1, 'sub': 2, 'subn': 2,
+}
+
+# Corpus sizes (chars) for the scaling curve, and the time per run at
+# which scaling stops early
+SCALE_SIZES = (1 << 10, 1 << 12, 1 << 14, 1 << 16)
+SCALE_BUDGET = 0.5
+
+# A case whose growth exponent crosses this is flagged as super-linear
+MAX_EXPONENT = 1.5
+
+# Seconds each timed batch of calls must run for, and batches per timing
+# (per call, and per scaling point)
+MIN_TIME = 0.05
+REPEAT = 5
+SCALE_REPEAT = 3
+
+# Metrics compared with the baseline; re-runs keep the lowest value seen
+TIMED_METRICS = ('compiled_ns', 'uncompiled_ns', 'ns_per_char', 'exponent')
+
+
+class _Scope:
+    """String literals bound to local names in one example function."""
+
+    def __init__(self, func):
+        # name -> (loop node or None, list of possible values)
+        self.bindings = {}
+        for node in ast.walk(func):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target = node.targets[0]
+                if isinstance(target, ast.Name):
+                    value = _literal(node.value)
+                    if isinstance(value, str):
+                        self.bindings[target.id] = (None, [value])
+                    elif isinstance(value, list):
+                        self.bindings[target.id] = (None, value)
+        for node in ast.walk(func):
+            if isinstance(node, ast.For):
+                self._bind_loop(node)
+
+    def _bind_loop(self, loop):
+        items = self.resolve_list(loop.iter)
+        if items is None:
+            return
+        target = loop.target
+        if isinstance(target, ast.Name):
+            values = [v for v in items if isinstance(v, str)]
+            self.bindings[target.id] = (loop, values)
+        elif isinstance(target, ast.Tuple):
+            for position, element in enumerate(target.elts):
+                if isinstance(element, ast.Name):
+                    values = [v[position] for v in items
+                              if isinstance(v, (list, tuple)) and len(v) > position
+                              and isinstance(v[position], str)]
+                    self.bindings[element.id] = (loop, values)
+
+    def resolve_list(self, node):
+        value = _literal(node)
+        if isinstance(value, list):
+            return value
+        if isinstance(node, ast.Name) and node.id in self.bindings:
+            loop, values = self.bindings[node.id]
+            if loop is None:
+                return values
+        return None
+
+    def resolve(self, node):
+        """Return (loop, values) for an argument, or (None, []) if unknown."""
+        value = _literal(node)
+        if isinstance(value, str):
+            return None, [value]
+        if isinstance(node, ast.Name) and node.id in self.bindings:
+            loop, values = self.bindings[node.id]
+            if loop is not None or len(values) == 1:
+                return loop, values
+        return None, []
+
+
+def _literal(node):
+    """Return a str or a list of literal values, or None."""
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if isinstance(value, tuple):
+        value = list(value)
+    return value if isinstance(value, (str, list)) else None
+
+
+def _flags(node):
+    """Evaluate re.IGNORECASE | re.MULTILINE style flag arguments."""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) \
+            and node.value.id == 're':
+        return int(getattr(re, node.attr))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _flags(node.left) | _flags(node.right)
+    raise ValueError("unsupported flags expression")
+
+
+def _re_calls(func):
+    for node in ast.walk(func):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == 're'
+                and node.func.attr in OPERATIONS):
+            yield node
+
+
+def discover_cases(lessons_dir=LESSONS_DIR):
+    """
+    Find the re calls in every lesson example function.
+
+    Returns a list of case dicts with 'id', 'module', 'function', 'op',
+    'pattern', 'flags', 'inputs' and, for sub, 'repl'. Calls whose
+    pattern or input is not a string literal in the function are skipped.
+    """
+    cases = []
+    for module, func in example_functions(lessons_dir):
+        cases += _function_cases(module, func)
+    return cases
+
+
+def example_functions(lessons_dir=LESSONS_DIR):
+    """Yield (module name, ast.FunctionDef) for every lesson example."""
+    for package in LESSON_PACKAGES:
+        for path in sorted((Path(lessons_dir) / package).glob('*.py')):
+            tree = ast.parse(path.read_text(encoding='utf-8'), str(path))
+            for func in tree.body:
+                if isinstance(func, ast.FunctionDef) and func.name.startswith(('example_', 'exercise_')):
+                    yield path.stem, func
+
+
+def _function_cases(module, func):
+    scope = _Scope(func)
+    found = {}
+    for call in _re_calls(func):
+        op = call.func.attr
+        text_index = OPERATIONS[op]
+        if len(call.args) <= text_index:
+            continue
+        try:
+            flags = 0
+            if len(call.args) > text_index + 1 and op not in ('sub', 'subn', 'split'):
+                flags = _flags(call.args[text_index + 1])
+            for keyword in call.keywords:
+                if keyword.arg == 'flags':
+                    flags = _flags(keyword.value)
+        except (ValueError, AttributeError):
+            continue
+
+        pattern_loop, pattern_values = scope.resolve(call.args[0])
+        text_loop, texts = scope.resolve(call.args[text_index])
+        repl = None
+        if op in ('sub', 'subn'):
+            repl = _literal(call.args[1])
+            if not isinstance(repl, str):
+                continue
+        if not pattern_values or not texts:
+            continue
+
+        if pattern_loop is not None and pattern_loop is text_loop:
+            pairs = {}
+            for pattern, text in zip(pattern_values, texts):
+                pairs.setdefault(pattern, []).append(text)
+        else:
+            pairs = {pattern: texts for pattern in pattern_values}
+        for pattern, inputs in pairs.items():
+            key = (op, pattern, flags, repl)
+            entry = found.setdefault(key, [])
+            entry += [t for t in inputs if t not in entry]
+
+    cases = []
+    for n, ((op, pattern, flags, repl), inputs) in enumerate(found.items(), 1):
+        case_id = f"{module}.{func.name}" + (f"#{n}" if n > 1 else '')
+        case = {'id': case_id, 'module': module, 'function': func.name, 'op': op,
+                'pattern': pattern, 'flags': flags, 'inputs': inputs}
+        if repl is not None:
+            case['repl'] = repl
+        cases.append(case)
+    return cases
+
+
+def _calls(case):
+    """Return (compiled_call, uncompiled_call) running the case once over all inputs."""
+    op, pattern, flags, inputs = case['op'], case['pattern'], case['flags'], case['inputs']
+    compiled = re.compile(pattern, flags)
+    if op in ('sub', 'subn'):
+        repl = case['repl']
+        method, function = getattr(compiled, op), getattr(re, op)
+
+        def run_compiled():
+            for text in inputs:
+                method(repl, text)
+
+        def run_uncompiled():
+            for text in inputs:
+                function(pattern, repl, text, flags=flags)
+    else:
+        method, function = getattr(compiled, op), getattr(re, op)
+        consume = op == 'finditer'
+
+        def run_compiled():
+            for text in inputs:
+                result = method(text)
+                if consume:
+                    for _ in result:
+                        pass
+
+        def run_uncompiled():
+            for text in inputs:
+                result = function(pattern, text, flags) if op != 'split' \
+                    else function(pattern, text, flags=flags)
+                if consume:
+                    for _ in result:
+                        pass
+    return run_compiled, run_uncompiled
+
+
+def _time_ns(func, repeat=REPEAT, min_time=MIN_TIME):
+    """
+    Best-of-repeat time per call in nanoseconds, timeit-style.
+
+    Like Timer.autorange, but calibrates the loop count to min_time
+    rather than 0.2s so the whole lesson set runs in a couple of minutes.
+    """
+    timer = timeit.Timer(func)
+    scale = 1
+    while True:
+        for number in (scale, scale * 2, scale * 5):
+            if timer.timeit(number) >= min_time:
+                return min(timer.repeat(repeat, number)) / number * 1e9
+        scale *= 10
+
+
+def corpus(inputs, size):
+    """Synthetic text of about size chars made of the inputs, one per line."""
+    unit = '\n'.join(inputs) + '\n'
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def scaling_curve(case, sizes=SCALE_SIZES, budget=SCALE_BUDGET, repeat=SCALE_REPEAT):
+    """
+    Time finditer over corpora of growing size.
+
+    Returns a list of [size, seconds, matches]; stops after the first
+    size whose scan takes longer than budget seconds. Faster scans are
+    timed like the per-call numbers (_time_ns), since a single scan of
+    a few milliseconds is too noisy to compare with a baseline.
+    """
+    compiled = re.compile(case['pattern'], case['flags'])
+    curve = []
+    for size in sizes:
+        text = corpus(case['inputs'], size)
+
+        def scan():
+            return sum(1 for _ in compiled.finditer(text))
+
+        start = time.perf_counter()
+        matches = scan()
+        seconds = time.perf_counter() - start
+        if seconds <= budget:
+            seconds = _time_ns(scan, repeat) / 1e9
+        curve.append([size, seconds, matches])
+        if seconds > budget:
+            break
+    return curve
+
+
+def benchmark_case(case, repeat=REPEAT, sizes=SCALE_SIZES):
+    """Time one case; returns its result dict."""
+    run_compiled, run_uncompiled = _calls(case)
+    count = len(case['inputs'])
+    curve = scaling_curve(case, sizes)
+    size, seconds, matches = curve[-1]
+    return {
+        'module': case['module'],
+        'function': case['function'],
+        'op': case['op'],
+        'pattern': case['pattern'],
+        'flags': case['flags'],
+        'inputs': count,
+        'compiled_ns': _time_ns(run_compiled, repeat) / count,
+        'uncompiled_ns': _time_ns(run_uncompiled, repeat) / count,
+        'scaling': curve,
+        'ns_per_char': seconds / size * 1e9,
+        'ns_per_match': seconds / matches * 1e9 if matches else None,
+        'exponent': growth_exponent([(s, t) for s, t, _ in curve])
+    }
+
+
+def run(cases, repeat=REPEAT, sizes=SCALE_SIZES, progress=None):
+    """Benchmark cases; returns the JSON-ready report."""
+    results = {}
+    for case in cases:
+        try:
+            results[case['id']] = benchmark_case(case, repeat, sizes)
+        except re.error as e:
+            results[case['id']] = {'pattern': case['pattern'], 'error': str(e)}
+        if progress:
+            progress(case['id'], results[case['id']])
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results
+    }
+
+
+def compare(report, baseline, tolerance=0.25, max_exponent=MAX_EXPONENT):
+    """
+    Compare a report with a baseline report.
+
+    Returns a list of (case_id, metric, message) regressions: compiled
+    ns/call or scaling ns/char more than tolerance above the baseline, or
+    a growth exponent ('exponent') that crossed max_exponent.
+    """
+    regressions = []
+    for case_id, new in report['results'].items():
+        old = baseline['results'].get(case_id)
+        if old is None or 'error' in new or 'error' in old:
+            continue
+        if old['pattern'] != new['pattern']:
+            continue  # the lesson changed; nothing comparable
+        for metric in ('compiled_ns', 'ns_per_char'):
+            if new[metric] > old[metric] * (1 + tolerance):
+                regressions.append((case_id, metric,
+                                    f"{metric} {old[metric]:.1f} -> {new[metric]:.1f} "
+                                    f"(+{(new[metric] / old[metric] - 1) * 100:.0f}%)"))
+        if new['exponent'] > max_exponent >= old['exponent']:
+            regressions.append((case_id, 'exponent',
+                                f"growth exponent {old['exponent']:.2f} -> {new['exponent']:.2f}"))
+    return regressions
+
+
+def confirm(cases, report, baseline, tolerance=0.25, runs=2, repeat=REPEAT,
+            sizes=SCALE_SIZES, max_exponent=MAX_EXPONENT, progress=None):
+    """
+    Re-time the cases compare() flags, and return only lasting regressions.
+
+    Each flagged case is benchmarked up to runs more times. Its result
+    in report keeps the lowest value seen for each of TIMED_METRICS, so
+    a case stays a regression only if it was slower than the baseline on
+    every run; a one-off stall from the scheduler or a noisy neighbour
+    is dropped.
+    """
+    by_id = {case['id']: case for case in cases}
+    for _ in range(runs):
+        flagged = {case_id for case_id, _, _ in compare(report, baseline, tolerance, max_exponent)}
+        if not flagged:
+            break
+        for case_id in sorted(flagged):
+            result = report['results'][case_id]
+            rerun = benchmark_case(by_id[case_id], repeat, sizes)
+            for metric in TIMED_METRICS:
+                result[metric] = min(result[metric], rerun[metric])
+            if progress:
+                progress(case_id, result)
+    return compare(report, baseline, tolerance, max_exponent)
+
+
+def _print_result(case_id, result):
+    if 'error' in result:
+        print(f"✗ {case_id}: {result['error']}")
+        return
+    per_match = f"{result['ns_per_match']:.0f}" if result['ns_per_match'] else '-'
+    flag = ' super-linear' if result['exponent'] > MAX_EXPONENT else ''
+    print(f"{case_id:<58} {result['op']:<9} {result['compiled_ns']:>9.0f} "
+          f"{result['uncompiled_ns']:>9.0f} {result['ns_per_char']:>8.2f} {per_match:>8} "
+          f"{result['exponent']:>5.2f}{flag}")
+
+
+def main():
+    """Discover, time and compare the lesson patterns."""
+    parser = argparse.ArgumentParser(description="Benchmark the patterns used in the lessons.")
+    parser.add_argument('filter', nargs='?', help="only cases whose id contains this text")
+    parser.add_argument('--list', action='store_true', help="list discovered cases and exit")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare against a previous JSON results file")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown vs baseline as a fraction (default 0.25)")
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help=f"timing repetitions (default {REPEAT})")
+    parser.add_argument('--confirm', type=int, default=2,
+                        help="re-runs a regression must survive before it is reported (default 2)")
+    parser.add_argument('--warn-only-timing', action='store_true',
+                        help="only warn on slowdowns; exit 1 on growth exponent regressions alone")
+    parser.add_argument('--max-size', type=int, default=SCALE_SIZES[-1],
+                        help=f"largest synthetic input in chars (default {SCALE_SIZES[-1]})")
+    args = parser.parse_args()
+
+    cases = discover_cases()
+    if args.filter:
+        cases = [c for c in cases if args.filter in c['id']]
+    if args.list:
+        for case in cases:
+            flags = f" (flags={case['flags']})" if case['flags'] else ''
+            print(f"{case['id']:<58} {case['op']:<9} {len(case['inputs']):>3} inputs  "
+                  f"{case['pattern']}{flags}")
+        covered = {(c['module'], c['function']) for c in cases}
+        skipped = [f"{module}.{func.name}" for module, func in example_functions()
+                   if (module, func.name) not in covered]
+        print(f"\n{len(cases)} cases")
+        if skipped and not args.filter:
+            print(f"No re calls with literal arguments: {', '.join(skipped)}")
+        return
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: File '{args.baseline}' not found.")
+            sys.exit(1)
+
+    sizes = tuple(s for s in SCALE_SIZES if s <= args.max_size) or (args.max_size,)
+    print(f"{'Case':<58} {'Op':<9} {'Comp ns':>9} {'Uncomp ns':>9} {'ns/char':>8} "
+          f"{'ns/match':>8} {'Exp':>5}")
+    print("-" * 112)
+    report = run(cases, args.repeat, sizes, _print_result)
+
+    regressions = None
+    if baseline is not None:
+        if compare(report, baseline, args.tolerance) and args.confirm:
+            print(f"\nRe-timing possible regressions (up to {args.confirm} runs):")
+        regressions = confirm(cases, report, baseline, args.tolerance, args.confirm,
+                              args.repeat, sizes, progress=_print_result)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Results written to {args.output}")
+
+    if baseline is not None:
+        failures = [r for r in regressions if not args.warn_only_timing or r[1] == 'exponent']
+        warnings = [r for r in regressions if r not in failures]
+        if warnings:
+            print(f"\n⚠ {len(warnings)} slowdown(s) vs {args.baseline} (not failing, "
+                  f"--warn-only-timing):")
+            for case_id, _, message in warnings:
+                print(f"  {case_id}: {message}")
+        if failures:
+            print(f"\n✗ {len(failures)} REGRESSION(S) vs {args.baseline}:")
+            for case_id, _, message in failures:
+                print(f"  {case_id}: {message}")
+            sys.exit(1)
+        kind = 'failing regressions' if warnings else 'regressions'
+        print(f"\n✓ No {kind} vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Literal Prefilter - Project Implementation
+
+Finds the literal strings every match of a pattern must contain, and uses
+`str.find` (or `bytes.find`) to skip inputs and regions that lack them
+before running the regex.
+
+For example every match of
+    r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\\.[a-zA-Z]{2,})'   requires '@'
+    r'(https?)://([^/]+)(/[^\\s?]*)?(\\?[^\\s]*)?'           requires 'http' and '://'
+    r'(cat|dog|bird)'                                     requires one of 'bird', 'cat', 'dog'
+
+A PrefilteredPattern rejects texts missing a required literal with a few
+`find` calls. finditer and findall go further and only run the regex in
+a window around each occurrence of the most selective literal (the
+anchor), so the gaps between candidates are skipped at `find` speed. The
+window is the pattern's maximum match length on either side when that is
+bounded, otherwise the anchor's line when the pattern cannot match a
+newline.
+
+Usage:
+    pattern = literal_prefilter.compile(r'\\d{1,3}(?:\\.\\d{1,3}){3}:\\d{1,5}')
+    pattern.required    # [('.',), (':',)]
+    pattern.findall(big_text)
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import patterns
+import regex_ast
+from regex_ast import (
+    ASSERT, ASSERT_NOT, AT, BRANCH, GROUPREF, GROUPREF_EXISTS, LITERAL, SUBPATTERN, sre_parse,
+)
+
+# Windows wider than this are not worth the extra search calls
+MAX_WINDOW = 1000
+
+# Assertions that look past the end of a match and so rule out windows
+END_ASSERTIONS = (sre_parse.AT_END, sre_parse.AT_END_STRING)
+
+
+def _is_cased(code):
+    c = chr(code)
+    return c.lower() != c.upper()
+
+
+def _literal(codes, as_bytes):
+    return bytes(codes) if as_bytes else ''.join(map(chr, codes))
+
+
+def _requirements(items, ignorecase, as_bytes):
+    """
+    Return the requirements of a parsed sequence.
+
+    Each requirement is a tuple of alternatives; a match contains at
+    least one of them.
+    """
+    required = []
+    run = []
+
+    def flush():
+        if run:
+            required.append((_literal(run, as_bytes),))
+            run.clear()
+
+    for op, av in items:
+        if op is LITERAL and not (ignorecase and _is_cased(av)):
+            run.append(av)
+            continue
+        if op is AT:
+            continue  # zero-width: literals either side stay adjacent
+        flush()
+        if op is SUBPATTERN:
+            sub_ignorecase = (ignorecase or bool(av[1] & re.IGNORECASE)) and not av[2] & re.IGNORECASE
+            required += _requirements(av[-1], sub_ignorecase, as_bytes)
+        elif regex_ast.is_repeat(op) and av[0] >= 1:
+            required += _requirements(av[2], ignorecase, as_bytes)
+        elif op is BRANCH:
+            alternatives = []
+            for branch in av[1]:
+                best = _best(_requirements(branch, ignorecase, as_bytes))
+                if best is None:
+                    break
+                alternatives += best
+            else:
+                required.append(tuple(sorted(set(alternatives))))
+    flush()
+    return required
+
+
+def _best(requirements):
+    """Pick the most selective requirement: fewest, then longest, alternatives."""
+    if not requirements:
+        return None
+    return min(requirements, key=lambda alts: (len(alts), -min(len(a) for a in alts)))
+
+
+def _has_ops(items, ops, at_codes=()):
+    for op, av in items:
+        if op in ops or (op is AT and av in at_codes):
+            return True
+        for child in regex_ast.children(op, av):
+            if _has_ops(child, ops, at_codes):
+                return True
+    return False
+
+
+def required_literals(pattern, flags=0):
+    """
+    Return the literal requirements of a pattern, most selective first.
+
+    Each entry is a tuple of alternatives, at least one of which appears
+    in every match. Returns [] when nothing is required.
+    """
+    if hasattr(pattern, 'pattern'):
+        flags |= pattern.flags
+        pattern = pattern.pattern
+    items, flags = regex_ast.parse(pattern, flags)
+    found = _requirements(items, bool(flags & re.IGNORECASE), isinstance(pattern, bytes))
+    unique = list(dict.fromkeys(found))
+    unique.sort(key=lambda alts: (len(alts), -min(len(a) for a in alts)))
+    return unique
+
+
+class PrefilteredPattern:
+    """
+    Compiled pattern guarded by required-literal checks.
+
+    search, match, fullmatch, finditer and findall return exactly what
+    the underlying re.Pattern would; other attributes are passed through.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.compiled = patterns.compile(pattern, flags)
+        self.required = required_literals(self.compiled)
+        self.anchor = None
+        self.window = None
+
+        items, flags = regex_ast.parse(self.compiled)
+        if not self.required or len(self.required[0]) != 1:
+            return
+        if _has_ops(items, (ASSERT, ASSERT_NOT, GROUPREF, GROUPREF_EXISTS), END_ASSERTIONS):
+            return
+        _, max_width = regex_ast.width(self.compiled)
+        if max_width is not None and max_width <= MAX_WINDOW:
+            self.anchor = self.required[0][0]
+            self.window = max_width
+        elif '\n' not in regex_ast.all_chars(items, bool(flags & re.DOTALL)):
+            self.anchor = self.required[0][0]  # window is the anchor's line
+
+    def __getattr__(self, name):
+        return getattr(self.compiled, name)
+
+    def possible(self, string, pos=0, endpos=None):
+        """Return False if string[pos:endpos] lacks a required literal."""
+        if endpos is None:
+            endpos = len(string)
+        for alternatives in self.required:
+            for literal in alternatives:
+                if string.find(literal, pos, endpos) >= 0:
+                    break
+            else:
+                return False
+        return True
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        if not self.possible(string, pos, endpos):
+            return None
+        return self.compiled.search(string, pos, endpos)
+
+    def match(self, string, pos=0, endpos=sys.maxsize):
+        if not self.possible(string, pos, endpos):
+            return None
+        return self.compiled.match(string, pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=sys.maxsize):
+        if not self.possible(string, pos, endpos):
+            return None
+        return self.compiled.fullmatch(string, pos, endpos)
+
+    def finditer(self, string, pos=0, endpos=sys.maxsize):
+        endpos = min(endpos, len(string))
+        if not self.possible(string, pos, endpos):
+            return iter(())
+        if self.anchor is None:
+            return self.compiled.finditer(string, pos, endpos)
+        return self._windowed(string, pos, endpos)
+
+    def _windowed(self, string, pos, endpos):
+        """
+        Yield matches by searching only near occurrences of the anchor.
+
+        A match of at most `window` characters that contains the anchor at
+        k starts in [k + len(anchor) - window, k] and is decided by
+        characters before k + window + 1, so searching that window gives
+        the same result as searching the whole string. A match that cannot
+        contain a newline lies within the anchor's line.
+        """
+        anchor = self.anchor
+        size = len(anchor)
+        window = self.window
+        search = self.compiled.search
+        find = string.find
+        newline = b'\n' if isinstance(string, bytes) else '\n'
+        while True:
+            k = find(anchor, pos, endpos)
+            if k < 0:
+                return
+            if window is None:
+                line_end = find(newline, k, endpos)
+                stop = endpos if line_end < 0 else line_end + 1
+                match = search(string, max(pos, string.rfind(newline, 0, k) + 1), stop)
+                if match is None:
+                    pos = stop
+                else:
+                    yield match
+                    pos = match.end() if match.end() > match.start() else match.end() + 1
+                continue
+            match = search(string, max(pos, k + size - window), min(k + window + 1, endpos))
+            if match is not None and match.start() <= k:
+                yield match
+                pos = match.end() if match.end() > match.start() else match.end() + 1
+            else:
+                pos = k + 1
+
+    def findall(self, string, pos=0, endpos=sys.maxsize):
+        endpos = min(endpos, len(string))
+        if not self.possible(string, pos, endpos):
+            return []
+        if self.anchor is None:
+            return self.compiled.findall(string, pos, endpos)
+        groups = self.compiled.groups
+        if groups == 0:
+            return [m.group() for m in self._windowed(string, pos, endpos)]
+        if groups == 1:
+            return [m.group(1) or m.string[:0] for m in self._windowed(string, pos, endpos)]
+        return [m.groups(m.string[:0]) for m in self._windowed(string, pos, endpos)]
+
+    def __repr__(self):
+        return f"literal_prefilter.compile({self.compiled.pattern!r})"
+
+
+def compile(pattern, flags=0):
+    """
+    Compile pattern with a literal prefilter when it has requirements.
+
+    Returns a PrefilteredPattern, or the plain re.Pattern from the shared
+    pattern cache when no literal is required.
+    """
+    prefiltered = PrefilteredPattern(pattern, flags)
+    if not prefiltered.required:
+        return prefiltered.compiled
+    return prefiltered
+
+
+def main():
+    """Show a pattern's required literals and time findall over a file."""
+    parser = argparse.ArgumentParser(description="Required-literal prefilter for regex search.")
+    parser.add_argument('pattern', help="regex pattern")
+    parser.add_argument('file', nargs='?', help="file to search")
+    parser.add_argument('-i', '--ignore-case', action='store_true', help="case-insensitive pattern")
+    args = parser.parse_args()
+
+    try:
+        prefiltered = PrefilteredPattern(args.pattern, re.IGNORECASE if args.ignore_case else 0)
+    except re.error as e:
+        print(f"Error: invalid pattern: {e}")
+        sys.exit(1)
+
+    print("Required literals:")
+    for alternatives in prefiltered.required or [("(none)",)]:
+        print(f"  {' | '.join(repr(a) for a in alternatives)}")
+    if prefiltered.window is not None:
+        print(f"Window: {prefiltered.window} chars around {prefiltered.anchor!r}")
+    elif prefiltered.anchor is not None:
+        print(f"Window: lines containing {prefiltered.anchor!r}")
+    if not args.file:
+        return
+
+    try:
+        with open(args.file, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    expected = prefiltered.compiled.findall(text)
+    re_time = time.perf_counter() - start
+    start = time.perf_counter()
+    found = prefiltered.findall(text)
+    filtered_time = time.perf_counter() - start
+
+    print(f"Matches: {len(found)}{'' if found == expected else ' (MISMATCH)'}")
+    print(f"re findall:          {re_time * 1000:.2f} ms")
+    print(f"prefiltered findall: {filtered_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,34 +5,72 @@ Log File Parser - Project Implementation
 Parses Apache/Nginx log files and extracts structured data.
 """
 
-import re
 import csv
+import re
 import sys
+import time
 from collections import Counter
 
+import patterns
+
+try:
+    import numpy as np
+except ImportError:  # optional: numeric columns stay lists of ints
+    np = None
+
+
+# Pattern for Apache Common Log Format
+APACHE_LOG_PATTERN = (
+    r'(\d+\.\d+\.\d+\.\d+)\s+'  # IP
+    r'-\s+'                     # Remote logname (usually -)
+    r'-\s+'                     # Remote user (usually -)
+    r'\[([^\]]+)\]\s+'          # Timestamp
+    r'"(\w+)\s+'                # HTTP method
+    r'([^\s]+)\s+'              # Path
+    r'([^"]+)"\s+'              # Protocol
+    r'(\d+)\s+'                 # Status code
+    r'(\d+|-)'                  # Size
+)
+
+# APACHE_LOG_PATTERN for whole blocks of lines (with re.MULTILINE): anchored at
+# each line start, and no part of a match can cross a newline
+APACHE_BLOCK_PATTERN = (
+    r'^[^\S\n]*(\d+\.\d+\.\d+\.\d+)[^\S\n]+'
+    r'-[^\S\n]+'
+    r'-[^\S\n]+'
+    r'\[([^\]\n]+)\][^\S\n]+'
+    r'"(\w+)[^\S\n]+'
+    r'(\S+)[^\S\n]+'
+    r'([^"\n]+)"[^\S\n]+'
+    r'(\d+)[^\S\n]+'
+    r'(\d+|-)'
+)
 
-def parse_apache_log(log_line):
+APACHE_FIELDS = ('ip', 'timestamp', 'method', 'path', 'protocol', 'status', 'size')
+
+# Characters read per block by parse_log_file_columns (extended to a newline)
+BLOCK_SIZE = 1 << 20
+
+
+def parse_apache_log(log_line, pattern=APACHE_LOG_PATTERN):
     """
     Parse Apache Common Log Format entry.
     
+    pattern may be replaced with another format that uses the same seven
+    groups; it is compiled once through the shared pattern cache.
+    
     Returns dict with parsed fields or None if parsing fails.
     """
-    # Pattern for Apache Common Log Format
-    pattern = r'(\d+\.\d+\.\d+\.\d+)\s+'  # IP
-    pattern += r'-\s+'                     # Remote logname (usually -)
-    pattern += r'-\s+'                     # Remote user (usually -)
-    pattern += r'\[([^\]]+)\]\s+'          # Timestamp
-    pattern += r'"(\w+)\s+'                # HTTP method
-    pattern += r'([^\s]+)\s+'              # Path
-    pattern += r'([^"]+)"\s+'              # Protocol
-    pattern += r'(\d+)\s+'                 # Status code
-    pattern += r'(\d+|-)'                  # Size
-    
-    match = re.match(pattern, log_line)
+    match = patterns.match(pattern, log_line)
     
     if not match:
         return None
     
+    return entry_from_match(match)
+
+
+def entry_from_match(match):
+    """Build an entry dict from a match of APACHE_LOG_PATTERN."""
     return {
         'ip': match.group(1),
         'timestamp': match.group(2),
@@ -44,9 +82,132 @@ def parse_apache_log(log_line):
     }
 
 
-def parse_log_file(filename):
-    """Parse entire log file and return list of entries."""
+def parse_apache_block(block, line_numbers=False):
+    """
+    Parse every Apache log line in a block of text into columns.
+
+    block holds whole lines, e.g. a chunk of a log file. One findall over
+    the block (in C) yields all field tuples, which are transposed into a
+    dict of column lists keyed by APACHE_FIELDS. Values are those
+    parse_apache_log gives line by line, including '0' for a '-' size;
+    lines that do not parse are skipped. With line_numbers=True a
+    'line_number' column (1-based within the block) is added, which costs
+    a Python step per match.
+    """
+    compiled = patterns.compile(APACHE_BLOCK_PATTERN, re.MULTILINE)
+    if line_numbers:
+        rows = []
+        numbers = []
+        line = 1
+        position = 0
+        for match in compiled.finditer(block):
+            line += block.count('\n', position, match.start())
+            position = match.start()
+            numbers.append(line)
+            rows.append(match.groups())
+    else:
+        rows = compiled.findall(block)
+
+    columns = {field: list(values) for field, values in
+               zip(APACHE_FIELDS, zip(*rows) if rows else [()] * len(APACHE_FIELDS))}
+    columns['protocol'] = list(map(str.strip, columns['protocol']))
+    if '-' in columns['size']:
+        columns['size'] = ['0' if size == '-' else size for size in columns['size']]
+    if line_numbers:
+        columns['line_number'] = numbers
+    return columns
+
+
+def numeric_columns(columns):
+    """
+    Convert the 'status' and 'size' columns to integers, in place.
+
+    They become int64 NumPy arrays when NumPy is installed, lists of ints
+    otherwise. Returns columns.
+    """
+    for field in ('status', 'size'):
+        values = columns[field]
+        if np is not None:
+            columns[field] = np.fromiter(map(int, values), dtype=np.int64, count=len(values))
+        else:
+            columns[field] = list(map(int, values))
+    return columns
+
+
+def _read_blocks(filename, block_size=BLOCK_SIZE):
+    """Stream a text file as blocks of whole lines of about block_size characters."""
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        pending = ''
+        while True:
+            chunk = f.read(block_size)
+            if not chunk:
+                break
+            pending += chunk
+            cut = pending.rfind('\n') + 1
+            if cut:
+                yield pending[:cut]
+                pending = pending[cut:]
+        if pending:
+            yield pending
+
+
+def parse_log_file_columns(filename, numeric=False, line_numbers=False, block_size=BLOCK_SIZE):
+    """
+    Parse an entire Apache log file into columns, block by block.
+
+    Returns the parse_apache_block dict for the whole file; line numbers
+    count from the start of the file. With numeric=True the result goes
+    through numeric_columns.
+    """
+    columns = {field: [] for field in APACHE_FIELDS}
+    if line_numbers:
+        columns['line_number'] = []
+    offset = 0
+    for block in _read_blocks(filename, block_size):
+        part = parse_apache_block(block, line_numbers)
+        if line_numbers:
+            part['line_number'] = [offset + number for number in part['line_number']]
+            offset += block.count('\n')
+        for field, values in part.items():
+            columns[field].extend(values)
+    return numeric_columns(columns) if numeric else columns
+
+
+def benchmark(text):
+    """
+    Time parse_apache_log per line against parse_apache_block; returns a result dict.
+
+    Lines are stripped for the per-line parse, as in parse_log_file.
+    """
+    start = time.perf_counter()
+    entries = [entry for entry in map(parse_apache_log, map(str.strip, text.split('\n')))
+               if entry]
+    line_time = time.perf_counter() - start
+    start = time.perf_counter()
+    columns = parse_apache_block(text)
+    block_time = time.perf_counter() - start
+    same = all(columns[field] == [entry[field] for entry in entries] for field in APACHE_FIELDS)
+    return {
+        'entries': len(entries),
+        'same_output': same,
+        'line_mb_s': len(text) / line_time / 1e6,
+        'block_mb_s': len(text) / block_time / 1e6
+    }
+
+
+def parse_log_file(filename, pattern=APACHE_LOG_PATTERN, timeout=None):
+    """
+    Parse entire log file and return list of entries.
+    
+    With timeout set, every line is matched in a SafeMatcher worker under
+    a per-line deadline (whatever the ReDoS analyzer makes of pattern);
+    lines that exceed it are reported and skipped.
+    """
     entries = []
+    matcher = None
+    if timeout is not None:
+        from safe_match import MatchTimeout, SafeMatcher
+        matcher = SafeMatcher(pattern, timeout=timeout, mode='always')
     
     try:
         with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
@@ -55,7 +216,17 @@ def parse_log_file(filename):
                 if not line:
                     continue
                 
-                entry = parse_apache_log(line)
+                if matcher is None:
+                    entry = parse_apache_log(line, pattern)
+                else:
+                    try:
+                        match = matcher.match(line)
+                    except MatchTimeout as e:
+                        print(f"Warning: Timed out on line {line_num} "
+                              f"({e.input_length} chars) after {e.timeout}s")
+                        continue
+                    entry = entry_from_match(match) if match else None
+                
                 if entry:
                     entry['line_number'] = line_num
                     entries.append(entry)
@@ -82,7 +253,7 @@ def save_to_csv(entries, output_file):
     
     try:
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(entries)
         print(f"✓ Saved {len(entries)} entries to {output_file}")
@@ -132,9 +303,24 @@ def main():
     """Main function."""
     if len(sys.argv) < 2:
         print("Usage: python log_parser.py <log_file> [output.csv]")
+        print("       python log_parser.py <log_file> --benchmark")
         sys.exit(1)
     
     log_file = sys.argv[1]
+    if sys.argv[2:] == ['--benchmark']:
+        try:
+            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+                r = benchmark(f.read())
+        except FileNotFoundError:
+            print(f"Error: File '{log_file}' not found.")
+            sys.exit(1)
+        print(f"{'Entries':>10} {'Per-line MB/s':>14} {'Block MB/s':>11} {'Speedup':>8}")
+        print("-" * 46)
+        note = '' if r['same_output'] else '  (MISMATCH)'
+        print(f"{r['entries']:>10} {r['line_mb_s']:>14.1f} {r['block_mb_s']:>11.1f} "
+              f"{r['block_mb_s'] / r['line_mb_s']:>7.1f}x{note}")
+        return
+    
     output_file = sys.argv[2] if len(sys.argv) > 2 else 'parsed_logs.csv'
     
     print(f"Parsing log file: {log_file}")
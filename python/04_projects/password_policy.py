@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Password Policy - Project Implementation
+
+Checks passwords against a configurable policy, replacing the stacked
+lookahead regexes from the lessons
+
+    ^(?=.*[A-Z])(?=.*[a-z])(?=.*\\d).{8,}$                      (lookarounds.example_validate_password)
+    ^(?=.*[A-Z])(?=.*[a-z])(?=.*\\d)(?=.*[!@#$%^&*]).{8,}$       (intermediate_exercises.exercise_1_validate_strong_password)
+    ^(?=.*[A-Z])(?=.*[a-z])(?=.*\\d)(?=.*[!@#$%^&*])(?!.*\\s)(?!.*(.)\\1{2,}).{8,}$
+                                                               (complex_patterns.example_complex_password)
+
+A failed lookahead match cannot say which rule failed. Here one
+translate pass maps every character to the code of its class (U, L, D,
+S, or W for forbidden whitespace) and drops the rest; the codes left
+answer every class rule at once. ASCII passwords go through
+bytes.translate with a 256-byte table, others through a lazily filled
+str.translate table. Runs of repeated characters are found with a single
+compiled search. check() reports every failed rule; audit() counts valid
+passwords and failures per rule over whole batches with the per-item
+work done in C (map over bound methods, tallied by a Counter) and can
+fan chunks out to a process pool.
+
+is_valid() and validate_many() do not use this engine: they run the
+same kind of stacked lookahead regex the lessons use, built from the
+policy (see PasswordPolicy.regex). For a plain valid/invalid verdict on
+short passwords one C call beats any per-item Python work, so the regex
+stays the fastest way to get one.
+
+The policy treats newlines as whitespace and counts them towards the
+length, so it differs from the lesson regexes, where '.' does not match
+'\\n' and $ also matches before a final newline: a password ending in
+'\\n' is rejected where the lessons accept it, and with allow_whitespace
+('basic', 'strong') one with an embedded '\\n' is accepted where the
+lessons reject it.
+
+Usage:
+    python password_policy.py 'Password123!' 'Pass 123!'
+    python password_policy.py --file passwords.txt --workers 4
+    python password_policy.py --benchmark
+"""
+
+import argparse
+import operator
+import random
+import re
+import string
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+
+import patterns
+
+DEFAULT_SPECIAL = '!@#$%^&*'
+
+# Class codes produced by the translate tables (the bytes of 'ULDSW')
+UPPER, LOWER, DIGIT, SPECIAL, WHITESPACE = b'ULDSW'
+
+# Rule names in report order
+RULES = ('too_short', 'too_long', 'no_upper', 'no_lower', 'no_digit',
+         'no_special', 'whitespace', 'repeated')
+
+CHUNK_SIZE = 100000
+
+
+class _ClassTable(dict):
+    """str.translate table from code point to class code, filled on first sight."""
+
+    def __init__(self, classify):
+        super().__init__()
+        self.classify = classify
+
+    def __missing__(self, code):
+        value = self[code] = self.classify(chr(code))
+        return value
+
+
+class PasswordPolicy:
+    """
+    A password policy evaluated in one pass over the characters.
+
+    A character counts towards the first class it belongs to, in the
+    order special, A-Z, a-z, decimal digit (\\d), whitespace (\\s).
+
+    Args:
+        min_length: minimum number of characters
+        max_length: maximum number of characters (None = no limit)
+        require_upper: require an ASCII uppercase letter
+        require_lower: require an ASCII lowercase letter
+        require_digit: require a decimal digit
+        special: characters of which one is required ('' = none)
+        allow_whitespace: whether whitespace may appear
+        max_repeat: longest allowed run of one character (None = no limit)
+    """
+
+    def __init__(self, min_length=8, max_length=None, require_upper=True,
+                 require_lower=True, require_digit=True, special=DEFAULT_SPECIAL,
+                 allow_whitespace=False, max_repeat=2):
+        if max_length is not None and max_length < min_length:
+            raise ValueError("max_length must be at least min_length")
+        if max_repeat is not None and max_repeat < 1:
+            raise ValueError("max_repeat must be at least 1")
+        self.min_length = min_length
+        self.max_length = max_length
+        self.require_upper = require_upper
+        self.require_lower = require_lower
+        self.require_digit = require_digit
+        self.special = special
+        self.allow_whitespace = allow_whitespace
+        self.max_repeat = max_repeat
+
+        self._lengths = range(min_length, (max_length if max_length is not None else sys.maxsize) + 1)
+        self._classes = [(code, rule) for code, rule, required in (
+            (UPPER, 'no_upper', require_upper),
+            (LOWER, 'no_lower', require_lower),
+            (DIGIT, 'no_digit', require_digit),
+            (SPECIAL, 'no_special', bool(special))) if required]
+        self._table = _ClassTable(self._classify)
+        # ASCII passwords go through bytes.translate: class code, or deleted
+        ascii_codes = [self._table[code] for code in range(128)]
+        self._ascii_table = bytes(code or 0 for code in ascii_codes) + bytes(128)
+        self._ascii_dropped = bytes(c for c, code in enumerate(ascii_codes) if code is None)
+        self._runs = (patterns.compile(r'(.)\1{%d}' % max_repeat, re.DOTALL)
+                      if max_repeat is not None else None)
+        self.regex = self._build_regex()
+        self._fullmatch = patterns.compile(self.regex, re.DOTALL).fullmatch
+
+        self.messages = {
+            'too_short': f"shorter than {min_length} characters",
+            'too_long': f"longer than {max_length} characters",
+            'no_upper': "no uppercase letter",
+            'no_lower': "no lowercase letter",
+            'no_digit': "no digit",
+            'no_special': f"none of {special}",
+            'whitespace': "contains whitespace",
+            'repeated': f"a character repeated more than {max_repeat} times in a row"
+        }
+
+    def _build_regex(self):
+        """
+        Lookahead regex (for fullmatch with re.DOTALL) accepting exactly
+        the passwords check() finds no fault with.
+
+        Characters in special count only as special, so they are excluded
+        from the other classes.
+        """
+        special = ''.join(sorted(set(self.special)))
+        escaped = re.escape(special)
+        parts = []
+        for required, letters, span in ((self.require_upper, string.ascii_uppercase, 'A-Z'),
+                                        (self.require_lower, string.ascii_lowercase, 'a-z')):
+            if required:
+                if any(c in special for c in letters):
+                    span = ''.join(c for c in letters if c not in special)
+                parts.append(f'(?=.*[{span}])' if span else '(?!)')
+        if self.require_digit:
+            guard = f'(?![{escaped}])' if any(c.isdecimal() for c in special) else ''
+            parts.append(f'(?=.*{guard}\\d)')
+        if special:
+            parts.append(f'(?=.*[{escaped}])')
+        if not self.allow_whitespace:
+            guard = f'(?![{escaped}])' if any(c.isspace() for c in special) else ''
+            parts.append(f'(?!.*{guard}\\s)')
+        if self.max_repeat is not None:
+            parts.append(r'(?!.*(.)\1{%d})' % self.max_repeat)
+        max_length = '' if self.max_length is None else self.max_length
+        parts.append(f'.{{{self.min_length},{max_length}}}')
+        return ''.join(parts)
+
+    def _classify(self, char):
+        """Class code for char, or None to drop it."""
+        if char in self.special:
+            return SPECIAL
+        if 'A' <= char <= 'Z':
+            return UPPER if self.require_upper else None
+        if 'a' <= char <= 'z':
+            return LOWER if self.require_lower else None
+        if char.isdecimal():
+            return DIGIT if self.require_digit else None
+        if char.isspace() and not self.allow_whitespace:
+            return WHITESPACE
+        return None
+
+    def check(self, password):
+        """Return the names of every rule password fails, in RULES order ([] = valid)."""
+        failures = []
+        length = len(password)
+        if length not in self._lengths:
+            failures.append('too_short' if length < self.min_length else 'too_long')
+        classes = self._codes(password)
+        for code, rule in self._classes:
+            if code not in classes:
+                failures.append(rule)
+        if WHITESPACE in classes:
+            failures.append('whitespace')
+        if self._runs is not None and self._runs.search(password):
+            failures.append('repeated')
+        return failures
+
+    def is_valid(self, password):
+        return self._fullmatch(password) is not None
+
+    def _codes(self, password):
+        """Class code of every classified character in password, from one translate pass."""
+        if password.isascii():
+            return password.encode().translate(self._ascii_table, self._ascii_dropped)
+        return password.translate(self._table).encode()
+
+    def _codes_many(self, passwords):
+        if all(map(str.isascii, passwords)):
+            return list(map(bytes.translate, map(str.encode, passwords),
+                            repeat(self._ascii_table), repeat(self._ascii_dropped)))
+        return list(map(self._codes, passwords))
+
+    def validate_many(self, passwords):
+        """Return [bool] for a list of passwords, same as is_valid on each."""
+        return list(map(bool, map(self._fullmatch, passwords)))
+
+    def audit_batch(self, passwords):
+        """
+        Count valid passwords and failures per rule in a list of passwords.
+
+        Each password is translated once and every rule's outcome is
+        computed with map in C; the outcomes are zipped into one tuple per
+        password and tallied with a Counter, so 'valid' (no rule failed)
+        comes from the same results as the failure counts.
+
+        Returns {'checked', 'valid', 'failures': {rule: count}}.
+        """
+        codes = self._codes_many(passwords)
+        lengths = list(map(len, passwords))
+        # (rule, outcome per password, outcome of a password that passes)
+        columns = [('too_short', map(self.min_length.__gt__, lengths), False)]
+        if self.max_length is not None:
+            columns.append(('too_long', map(self.max_length.__lt__, lengths), False))
+        for code, rule in self._classes:
+            columns.append((rule, map(operator.contains, codes, repeat(code)), True))
+        if not self.allow_whitespace:
+            columns.append(('whitespace', map(operator.contains, codes, repeat(WHITESPACE)), False))
+        if self._runs is not None:
+            columns.append(('repeated', map(bool, map(self._runs.search, passwords)), False))
+
+        outcomes = Counter(zip(*[outcome for _, outcome, _ in columns]))
+        passing = tuple(ok for _, _, ok in columns)
+        failures = dict.fromkeys(RULES, 0)
+        for outcome, count in outcomes.items():
+            for (rule, _, ok), value in zip(columns, outcome):
+                if value != ok:
+                    failures[rule] += count
+        return {'checked': len(passwords), 'valid': outcomes[passing], 'failures': failures}
+
+    def audit(self, passwords, workers=None, chunksize=CHUNK_SIZE):
+        """
+        Audit any number of passwords, streamed in chunks.
+
+        With workers set, chunks are audited in a process pool with at
+        most two chunks per worker in flight. Returns the summed
+        audit_batch() counts.
+        """
+        total = {'checked': 0, 'valid': 0, 'failures': dict.fromkeys(RULES, 0)}
+
+        def add(result):
+            total['checked'] += result['checked']
+            total['valid'] += result['valid']
+            for rule, count in result['failures'].items():
+                total['failures'][rule] += count
+
+        if not workers:
+            for chunk in _chunks(passwords, chunksize):
+                add(self.audit_batch(chunk))
+            return total
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in _chunks(passwords, chunksize):
+                pending.append(pool.submit(self.audit_batch, chunk))
+                if len(pending) >= workers * 2:
+                    add(pending.popleft().result())
+            while pending:
+                add(pending.popleft().result())
+        return total
+
+    def __repr__(self):
+        return (f"PasswordPolicy(min_length={self.min_length}, max_length={self.max_length}, "
+                f"require_upper={self.require_upper}, require_lower={self.require_lower}, "
+                f"require_digit={self.require_digit}, special={self.special!r}, "
+                f"allow_whitespace={self.allow_whitespace}, max_repeat={self.max_repeat})")
+
+
+def _chunks(iterable, size):
+    """Split an iterable into lists of at most size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# name -> (policy, equivalent lesson regex, lesson function)
+POLICIES = {
+    'basic': (PasswordPolicy(special='', allow_whitespace=True, max_repeat=None),
+              r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}$',
+              'lookarounds.example_validate_password'),
+    'strong': (PasswordPolicy(allow_whitespace=True, max_repeat=None),
+               r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*]).{8,}$',
+               'intermediate_exercises.exercise_1_validate_strong_password'),
+    'complex': (PasswordPolicy(),
+                r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*])(?!.*\s)(?!.*(.)\1{2,}).{8,}$',
+                'complex_patterns.example_complex_password'),
+}
+
+# Test inputs used by the lessons
+LESSON_PASSWORDS = ["Password123!", "PASS123!word", "password123!", "Pass123!", "Pass 123!",
+                    "Paass123!", "Password123", "password123", "PASSWORD123", "Pass123"]
+
+
+def random_passwords(count, min_length=6, max_length=16, seed=0):
+    """Seeded random passwords from letters, digits, some specials and a space."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + '!@#$%^&* '
+    return [''.join(rng.choices(alphabet, k=rng.randint(min_length, max_length)))
+            for _ in range(count)]
+
+
+def regex_report(policy):
+    """
+    Return a check() equivalent built from one regex per rule.
+
+    This is what reporting every failed rule costs with `re` alone; the
+    benchmark compares it with check().
+    """
+    tests = []
+    for rule, pattern, fail_on_match, enabled in (
+            ('no_upper', r'[A-Z]', False, policy.require_upper),
+            ('no_lower', r'[a-z]', False, policy.require_lower),
+            ('no_digit', r'\d', False, policy.require_digit),
+            ('no_special', f'[{re.escape(policy.special)}]', False, bool(policy.special)),
+            ('whitespace', r'\s', True, not policy.allow_whitespace),
+            ('repeated', r'(.)\1{%s}' % policy.max_repeat, True, policy.max_repeat is not None)):
+        if enabled:
+            tests.append((rule, patterns.compile(pattern, re.DOTALL), fail_on_match))
+
+    def report(password):
+        failures = []
+        length = len(password)
+        if length < policy.min_length:
+            failures.append('too_short')
+        elif policy.max_length is not None and length > policy.max_length:
+            failures.append('too_long')
+        for rule, compiled, fail_on_match in tests:
+            if (compiled.search(password) is not None) == fail_on_match:
+                failures.append(rule)
+        return failures
+    return report
+
+
+def _rate(func, *args):
+    """Best-of-3 items per second of func over the list args[-1]."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return len(args[-1]) / best
+
+
+def benchmark(count=200000, min_length=6, max_length=16, seed=0):
+    """
+    Compare each preset policy with its lesson regex.
+
+    Checks that both give the same verdicts, and that check() reports the
+    same rules as regex_report(), on the lesson inputs and on random
+    passwords. Measures checks per second for the lesson regex (re.match
+    on each), validate_many, audit_batch (counts per rule), check() on
+    each password, and regex_report() on each password. Returns a list
+    of result dicts.
+    """
+    passwords = random_passwords(count, min_length, max_length, seed)
+    inputs = LESSON_PASSWORDS + passwords
+    results = []
+    for name, (policy, regex, source) in POLICIES.items():
+        compiled = patterns.compile(regex)
+        report = regex_report(policy)
+        expected = [bool(m) for m in map(compiled.match, inputs)]
+        results.append({
+            'name': name,
+            'source': source,
+            'same_verdicts': policy.validate_many(inputs) == expected,
+            'same_reports': list(map(policy.check, inputs)) == list(map(report, inputs)),
+            'valid': sum(expected[len(LESSON_PASSWORDS):]),
+            'regex_per_s': _rate(lambda items: list(map(compiled.match, items)), passwords),
+            'bulk_per_s': _rate(policy.validate_many, passwords),
+            'audit_per_s': _rate(policy.audit_batch, passwords),
+            'check_per_s': _rate(lambda items: list(map(policy.check, items)), passwords),
+            'regex_report_per_s': _rate(lambda items: list(map(report, items)), passwords)
+        })
+    return results
+
+
+def read_passwords(filename):
+    """Stream passwords from a file, one per line (surrounding spaces kept)."""
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+
+def main():
+    """Check passwords, audit a password file, or run the benchmark."""
+    parser = argparse.ArgumentParser(description="Check passwords against a policy.")
+    parser.add_argument('passwords', nargs='*', help="passwords to check")
+    parser.add_argument('--policy', choices=list(POLICIES), default='complex',
+                        help="preset policy (default complex)")
+    parser.add_argument('--min-length', type=int, help="override the minimum length")
+    parser.add_argument('--max-length', type=int, help="override the maximum length")
+    parser.add_argument('--special', help="override the required special characters ('' = none)")
+    parser.add_argument('--max-repeat', type=int, help="override the longest allowed run")
+    parser.add_argument('--allow-whitespace', action='store_true', help="allow whitespace")
+    parser.add_argument('--file', help="audit a file of passwords, one per line")
+    parser.add_argument('--workers', type=int, help="audit in this many processes")
+    parser.add_argument('--benchmark', action='store_true', help="compare with the lesson regexes")
+    parser.add_argument('--count', type=int, default=200000, help="benchmark passwords")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(f"{'Policy':<8} {'Same':>5} {'Regex/s':>11} {'Bulk/s':>11} "
+              f"{'Audit/s':>11} {'check()/s':>11} {'Rule regexes/s':>15}")
+        print("-" * 78)
+        for r in benchmark(args.count):
+            same = '✓' if r['same_verdicts'] and r['same_reports'] else '✗'
+            print(f"{r['name']:<8} {same:>5} {r['regex_per_s']:>11,.0f} {r['bulk_per_s']:>11,.0f} "
+                  f"{r['audit_per_s']:>11,.0f} {r['check_per_s']:>11,.0f} "
+                  f"{r['regex_report_per_s']:>15,.0f}")
+        return
+
+    policy = POLICIES[args.policy][0]
+    overrides = {key: value for key, value in (
+        ('min_length', args.min_length), ('max_length', args.max_length),
+        ('special', args.special), ('max_repeat', args.max_repeat)) if value is not None}
+    if args.allow_whitespace:
+        overrides['allow_whitespace'] = True
+    if overrides:
+        settings = {key: getattr(policy, key) for key in (
+            'min_length', 'max_length', 'require_upper', 'require_lower', 'require_digit',
+            'special', 'allow_whitespace', 'max_repeat')}
+        try:
+            policy = PasswordPolicy(**{**settings, **overrides})
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    if args.file:
+        try:
+            start = time.perf_counter()
+            result = policy.audit(read_passwords(args.file), args.workers)
+            elapsed = time.perf_counter() - start
+        except FileNotFoundError:
+            print(f"Error: File '{args.file}' not found.")
+            sys.exit(1)
+        checked = result['checked']
+        print(f"Checked {checked} passwords in {elapsed:.2f}s "
+              f"({checked / elapsed if elapsed else 0:,.0f}/s)")
+        print(f"✓ {result['valid']} valid, ✗ {checked - result['valid']} invalid")
+        for rule in RULES:
+            count = result['failures'][rule]
+            if count:
+                print(f"  {count:>10}  {policy.messages[rule]}")
+        return
+
+    if not args.passwords:
+        parser.error("give passwords to check, --file or --benchmark")
+    failed = 0
+    for password in args.passwords:
+        failures = policy.check(password)
+        failed += bool(failures)
+        print(f"{'✓' if not failures else '✗'} {password!r}")
+        for rule in failures:
+            print(f"    {policy.messages[rule]}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
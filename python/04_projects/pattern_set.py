@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Pattern Set - Project Implementation
+
+Matches many patterns against a text in one scan, in the spirit of RE2's
+RegexSet.
+
+The patterns are merged into a single alternation with one wrapper group
+per pattern, so `re` tries all of them at each position in C, and the
+wrapper group that closed last tells which pattern matched. Checking a
+line against dozens of classification rules then costs one scan instead
+of one scan per rule.
+
+Patterns that start with a literal are searched on their own instead:
+`re` finds their prefix with a fast string search, which is cheaper than
+trying them at every position inside the alternation. So are patterns
+that cannot be merged (backreferences, which would be renumbered, group
+names used by another pattern, or global inline flags). A set therefore
+costs one scan for the merged patterns plus one prefix search per
+separate pattern, and only the merged part stays flat as the set grows.
+
+Usage:
+    rules = PatternSet([('error', r'\\bERROR\\b'), ('timeout', r'timed? ?out')])
+    rules.matches(line)           # ['error', 'timeout']
+    for name, match in rules.finditer(text):
+        print(name, match.span())
+"""
+
+import re
+import sys
+
+import patterns
+import regex_ast
+from regex_ast import GROUPREF, GROUPREF_EXISTS, LITERAL, SUBPATTERN
+
+
+def _has_backreference(items):
+    """Return True if a parsed pattern refers back to a group."""
+    for op, av in items:
+        if op is GROUPREF or op is GROUPREF_EXISTS:
+            return True
+        for child in regex_ast.children(op, av):
+            if _has_backreference(child):
+                return True
+    return False
+
+
+def _has_literal_prefix(items, flags):
+    """
+    Return True if a parsed pattern always starts with a literal.
+
+    Such patterns are kept out of the merged alternation and searched one
+    by one: `re` finds a literal prefix with a fast string search, which
+    it cannot use once the pattern is wrapped in a group inside an
+    alternation.
+    """
+    if flags & re.IGNORECASE:
+        return False
+    while items:
+        op, av = items[0]
+        if op is not SUBPATTERN:
+            return op is LITERAL
+        if av[1] & re.IGNORECASE:
+            return False
+        items = av[-1]
+    return False
+
+
+class PatternSet:
+    """
+    A set of patterns scanned together.
+
+    Args:
+        patterns: list of pattern strings or (name, pattern) pairs, or a
+            dict of name -> pattern; unnamed patterns are named by index
+        flags: re flags applied to every pattern
+    """
+
+    def __init__(self, patterns_, flags=0):
+        if isinstance(patterns_, dict):
+            entries = list(patterns_.items())
+        else:
+            entries = [p if isinstance(p, tuple) else (i, p) for i, p in enumerate(patterns_)]
+        self.names = [name for name, _ in entries]
+        self.sources = [source for _, source in entries]
+        self.flags = flags
+        self.compiled = [patterns.compile(source, flags) for source in self.sources]
+
+        self.mergeable = []
+        self.separate = []
+        group_names = set()
+        for i, compiled in enumerate(self.compiled):
+            if self._can_merge(i, group_names):
+                self.mergeable.append(i)
+                group_names.update(compiled.groupindex)
+            else:
+                self.separate.append(i)
+        self.merged = {}
+
+    def _can_merge(self, i, group_names):
+        if group_names.intersection(self.compiled[i].groupindex):
+            return False
+        items, flags = regex_ast.parse(self.sources[i], self.flags)
+        if _has_backreference(items) or _has_literal_prefix(items, flags):
+            return False
+        try:
+            re.compile(f'(?:)|({self.sources[i]})', self.flags)
+        except re.error:
+            return False  # e.g. global flags like (?i) not at the start
+        return True
+
+    def _merge(self, indices):
+        """
+        Return (compiled, owners) for an alternation of the given patterns.
+
+        owners maps each wrapper group number to its pattern index.
+        """
+        merged = self.merged.get(indices)
+        if merged is None:
+            owners = {}
+            group = 1
+            for i in indices:
+                owners[group] = i
+                group += 1 + self.compiled[i].groups
+            source = '|'.join(f'({self.sources[i]})' for i in indices)
+            merged = self.merged[indices] = (patterns.compile(source, self.flags), owners)
+        return merged
+
+    def __len__(self):
+        return len(self.sources)
+
+    def matches(self, text):
+        """
+        Return the names of all patterns that match anywhere in text.
+
+        The merged alternation is rescanned once per pattern found, from
+        the start of the last hit, so the cost grows with the number of
+        patterns that match rather than the number in the set.
+        """
+        found = set()
+        remaining = tuple(self.mergeable)
+        pos = 0
+        while remaining:
+            compiled, owners = self._merge(remaining)
+            match = compiled.search(text, pos)
+            if match is None:
+                break
+            index = owners[match.lastindex]
+            found.add(index)
+            remaining = tuple(i for i in remaining if i != index)
+            pos = match.start()
+
+        for i in self.separate:
+            if self.compiled[i].search(text):
+                found.add(i)
+        return [self.names[i] for i in sorted(found)]
+
+    def search(self, text, pos=0):
+        """Return (name, match) for the leftmost match, or None."""
+        for result in self.finditer(text, pos):
+            return result
+        return None
+
+    def finditer(self, text, pos=0, longest=False):
+        """
+        Yield (name, match) for non-overlapping matches of any pattern.
+
+        As with a plain alternation, the leftmost match wins and earlier
+        patterns win ties. With longest=True, the longest of the patterns
+        matching at that position wins instead. Matches come from the
+        individual patterns, so group numbers are the pattern's own.
+        """
+        # (compiled, owners) for the merged alternation; (compiled, index) for the rest
+        sources = []
+        if self.mergeable:
+            sources.append(self._merge(tuple(self.mergeable)))
+        sources += [(self.compiled[i], i) for i in self.separate]
+        pending = [None] * len(sources)
+        length = len(text)
+
+        while pos <= length:
+            best = None
+            for k, (compiled, owner) in enumerate(sources):
+                if compiled is None:
+                    continue  # no more matches from this source
+                match = pending[k]
+                if match is None or match.start() < pos:
+                    match = pending[k] = compiled.search(text, pos)
+                    if match is None:
+                        sources[k] = (None, None)
+                        continue
+                merged = isinstance(owner, dict)
+                index = owner[match.lastindex] if merged else owner
+                if best is None or (match.start(), index) < (best[1].start(), best[0]):
+                    best = (index, match, merged)
+            if best is None:
+                return
+
+            index, match, merged = best
+            start = match.start()
+            if merged:
+                match = self.compiled[index].match(text, start)
+            if longest:
+                for j, compiled in enumerate(self.compiled):
+                    if j != index:
+                        other = compiled.match(text, start)
+                        if other and other.end() > match.end():
+                            index, match = j, other
+
+            yield self.names[index], match
+            pos = match.end() if match.end() > start else start + 1
+
+
+def main():
+    """Report which of the given patterns match each line of a file."""
+    if len(sys.argv) < 3:
+        print("Usage: python pattern_set.py <file> <pattern> [pattern ...]")
+        sys.exit(1)
+
+    try:
+        pattern_set = PatternSet(sys.argv[2:])
+    except re.error as e:
+        print(f"Error: invalid pattern: {e}")
+        sys.exit(1)
+
+    try:
+        with open(sys.argv[1], 'r', encoding='utf-8', errors='ignore') as f:
+            for line_num, line in enumerate(f, 1):
+                names = pattern_set.matches(line)
+                if names:
+                    print(f"{line_num}: {', '.join(sys.argv[2 + i] for i in names)}")
+    except FileNotFoundError:
+        print(f"Error: File '{sys.argv[1]}' not found.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
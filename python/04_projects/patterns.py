@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Compiled Pattern Cache - Project Implementation
+
+Process-wide cache of compiled regular expressions shared by the project
+modules.
+
+Python's `re` keeps its own small internal cache, which silently evicts
+when many distinct patterns are in use (for example, one log format per
+tenant). This module makes the cache explicit: its size is configurable,
+eviction is LRU, and hits, misses, evictions and time spent compiling are
+counted so cache pressure can be seen.
+
+Usage:
+    import patterns
+    pattern = patterns.compile(r'\\d+')
+    patterns.findall(r'\\d+', text)
+    patterns.warm_up('patterns.json')
+    print(patterns.stats())
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+class PatternCache:
+    """
+    LRU cache of compiled patterns keyed on (pattern, flags).
+
+    Args:
+        maxsize: max number of compiled patterns kept
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+
+    def compile(self, pattern, flags=0):
+        """Return the compiled pattern, compiling it on a miss."""
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        key = (type(pattern), pattern, flags)
+        with self.lock:
+            compiled = self.data.get(key)
+            if compiled is not None:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        start = time.perf_counter()
+        compiled = re.compile(pattern, flags)
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            self.compile_time += elapsed
+            self.data[key] = compiled
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def resize(self, maxsize):
+        """Change capacity, evicting least recently used patterns if needed."""
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all compiled patterns and reset counters."""
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.compile_time = 0.0
+
+    def stats(self):
+        """Return cache counters as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'compile_time_ms': self.compile_time * 1000
+        }
+
+
+# Shared cache used by the module-level helpers
+cache = PatternCache()
+
+
+def parse_flags(names):
+    """Convert flag names like ['IGNORECASE', 'M'] to an re flags value."""
+    if isinstance(names, int):
+        return names
+    if isinstance(names, str):
+        names = names.replace('|', ' ').replace(',', ' ').split()
+    flags = 0
+    for name in names:
+        flags |= getattr(re, name.upper())
+    return flags
+
+
+def read_manifest(filename):
+    """
+    Read (pattern, flags) pairs from a manifest file.
+
+    JSON manifests hold a list of pattern strings or objects with
+    "pattern" and optional "flags" (a list of names such as "IGNORECASE").
+    Any other file is read as one pattern per line.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        if filename.lower().endswith('.json'):
+            for entry in json.load(f):
+                if isinstance(entry, str):
+                    yield entry, 0
+                else:
+                    yield entry['pattern'], parse_flags(entry.get('flags', 0))
+        else:
+            for line in f:
+                line = line.rstrip('\n')
+                if line and not line.startswith('#'):
+                    yield line, 0
+
+
+def warm_up(manifest):
+    """
+    Precompile patterns from a manifest file or an iterable of patterns.
+
+    Iterables may hold pattern strings or (pattern, flags) pairs.
+    Returns the number of patterns compiled.
+    """
+    entries = read_manifest(manifest) if isinstance(manifest, str) else manifest
+    count = 0
+    for entry in entries:
+        if isinstance(entry, tuple):
+            cache.compile(entry[0], parse_flags(entry[1]))
+        else:
+            cache.compile(entry)
+        count += 1
+    return count
+
+
+def configure(maxsize):
+    """Set the capacity of the shared cache."""
+    cache.resize(maxsize)
+
+
+def stats():
+    """Return counters for the shared cache."""
+    return cache.stats()
+
+
+def compile(pattern, flags=0):
+    """Return a compiled pattern from the shared cache."""
+    return cache.compile(pattern, flags)
+
+
+def match(pattern, string, flags=0):
+    """Cached equivalent of re.match."""
+    return cache.compile(pattern, flags).match(string)
+
+
+def fullmatch(pattern, string, flags=0):
+    """Cached equivalent of re.fullmatch."""
+    return cache.compile(pattern, flags).fullmatch(string)
+
+
+def search(pattern, string, flags=0):
+    """Cached equivalent of re.search."""
+    return cache.compile(pattern, flags).search(string)
+
+
+def findall(pattern, string, flags=0):
+    """Cached equivalent of re.findall."""
+    return cache.compile(pattern, flags).findall(string)
+
+
+def finditer(pattern, string, flags=0):
+    """Cached equivalent of re.finditer."""
+    return cache.compile(pattern, flags).finditer(string)
+
+
+def sub(pattern, repl, string, count=0, flags=0):
+    """Cached equivalent of re.sub."""
+    return cache.compile(pattern, flags).sub(repl, string, count)
+
+
+def split(pattern, string, maxsplit=0, flags=0):
+    """Cached equivalent of re.split."""
+    return cache.compile(pattern, flags).split(string, maxsplit)
+
+
+def main():
+    """Warm the cache from a manifest and print statistics."""
+    if len(sys.argv) < 2:
+        print("Usage: python patterns.py <manifest.json|patterns.txt>")
+        sys.exit(1)
+
+    try:
+        count = warm_up(sys.argv[1])
+    except FileNotFoundError:
+        print(f"Error: File '{sys.argv[1]}' not found.")
+        sys.exit(1)
+    except (re.error, ValueError, KeyError, AttributeError) as e:
+        print(f"Error in manifest: {e}")
+        sys.exit(1)
+
+    print(f"✓ Compiled {count} patterns")
+    for name, value in stats().items():
+        print(f"  {name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
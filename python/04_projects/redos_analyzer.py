@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+ReDoS Analyzer - Project Implementation
+
+Finds regex constructs that can make Python's backtracking engine take
+super-linear time, builds attack strings for them, and measures how match
+time grows with input length.
+
+Static checks (on the parse tree from `re._parser`):
+- nested quantifier: an unbounded repeat inside another, where one
+  iteration of the outer repeat can end inside the inner one ((a+)+)
+- ambiguous alternation: alternatives inside an unbounded repeat that can
+  start with the same character or both match empty ((ab|a.)*, (a|a)*)
+- overlapping quantifiers: adjacent unbounded repeats over overlapping
+  characters (\\d+\\d+, .*.*=)
+- unanchored leading quantifier: re.search retries an unbounded leading
+  repeat at every start position (\\w+@ on a long word)
+
+Usage:
+    python redos_analyzer.py                 # analyze the built-in catalog
+    python redos_analyzer.py '(a+)+$' --measure
+"""
+
+import argparse
+import math
+import multiprocessing
+import re
+import sys
+import time
+
+import regex_ast
+from regex_ast import (
+    AT, AT_BEGINNING, AT_BEGINNING_STRING, BRANCH, MAXREPEAT, MAX_REPEAT,
+    MIN_REPEAT, SUBPATTERN,
+)
+
+
+# Patterns from the lessons and projects, checked when no pattern is given
+CATALOG = [
+    ('simple_patterns.basic_email', r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    ('basic_exercises.time_format', r'([01]\d|2[0-3]):([0-5]\d)'),
+    ('basic_exercises.simple_ip_address', r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'),
+    ('basic_exercises.remove_extra_spaces', r'\s{2,}'),
+    ('character_classes.hex_color_code', r'#[0-9a-fA-F]{6}'),
+    ('lookarounds.validate_password', r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}$'),
+    ('intermediate_exercises.parse_log_entry', r'\[([^\]]+)\]\s+(\w+):\s+(.*)'),
+    ('intermediate_exercises.validate_credit_card', r'^\d{4}([- ]?)\d{4}\1\d{4}\1\d{4}$'),
+    ('backreferences.repeated_words', r'\b(\w+)\s+\1\b'),
+    ('backreferences.html_tags', r'<(\w+)>.*?</\1>'),
+    ('backreferences.repeated_sequences', r'(.{2,})\1+'),
+    ('greedy_lazy.lazy_matching', r'<div>.*?</div>'),
+    ('greedy_lazy.better_alternative', r'<div>[^<]+</div>'),
+    ('complex_patterns.complex_password',
+     r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*])(?!.*\s)(?!.*(.)\1{2,}).{8,}$'),
+    ('complex_patterns.log_parsing_named_groups',
+     r'(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(?P<level>\w+)\]\s+(?P<message>.*)'),
+    ('complex_patterns.nested_parentheses', r'\(([^()]+|\([^()]*\))*\)'),
+    ('complex_patterns.extract_url_components', r'(https?)://([^/]+)(/[^\s?]*)?(\?[^\s]*)?'),
+    ('email_validator.EMAIL_PATTERN', r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'),
+    ('html_scraper.international_phone', r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+    ('log_parser.APACHE_LOG_PATTERN',
+     r'(\d+\.\d+\.\d+\.\d+)\s+-\s+-\s+\[([^\]]+)\]\s+"(\w+)\s+([^\s]+)\s+([^"]+)"\s+(\d+)\s+(\d+|-)'),
+]
+
+# Characters tried, in order, when a suffix must break the match
+FAIL_CHARS = '!\x00~#` ()\n'
+
+EXPONENTIAL = 'exponential'
+POLYNOMIAL = 'polynomial'
+
+
+def _fail_char(*excluded):
+    """Return a character outside every set in excluded."""
+    blocked = set()
+    for chars in excluded:
+        blocked |= chars
+    for char in FAIL_CHARS:
+        if char not in blocked:
+            return char
+    remaining = regex_ast.ALPHABET - blocked
+    return regex_ast.pick_char(remaining) if remaining else '\x00'
+
+
+def _finding(kind, severity, detail, prefix, pump, suffix):
+    return {
+        'kind': kind,
+        'severity': severity,
+        'detail': detail,
+        'attack': {'prefix': prefix, 'pump': pump, 'suffix': suffix}
+    }
+
+
+def _unbounded(op, av):
+    return op in (MAX_REPEAT, MIN_REPEAT) and av[1] == MAXREPEAT
+
+
+def _trailing_repeats(items):
+    """
+    Yield unbounded repeats that can be the last thing items consumes.
+
+    These are the repeats an outer iteration can end inside, which is
+    what lets the next iteration re-split the same characters.
+    """
+    for index in reversed(range(len(items))):
+        op, av = items[index]
+        if _unbounded(op, av):
+            yield op, av
+        if op in (MAX_REPEAT, MIN_REPEAT, SUBPATTERN, BRANCH):
+            for child in regex_ast.children(op, av):
+                yield from _trailing_repeats(child)
+        if not regex_ast.nullable([items[index]]):
+            return
+
+
+def _branches(items):
+    """Yield the alternative lists of BRANCH nodes in items (outside lookarounds)."""
+    for op, av in items:
+        if op is BRANCH:
+            yield av[1]
+        if op in (MAX_REPEAT, MIN_REPEAT, SUBPATTERN, BRANCH):
+            for child in regex_ast.children(op, av):
+                yield from _branches(child)
+
+
+def _leading_repeat(items):
+    """
+    Find an unbounded repeat that starts an unanchored pattern.
+
+    Looks through groups and zero-width assertions such as \\b. Returns
+    (op, min, body, rest) where rest are the items following the repeat
+    at its own level, or None.
+    """
+    for index, (op, av) in enumerate(items):
+        if op is AT:
+            if av in (AT_BEGINNING, AT_BEGINNING_STRING):
+                return None
+            continue
+        if _unbounded(op, av):
+            return op, av[0], av[2], items[index + 1:]
+        if op is SUBPATTERN:
+            found = _leading_repeat(regex_ast.children(op, av)[0])
+            if found is not None and not found[3]:
+                found = found[:3] + (items[index + 1:],)
+            return found
+        return None
+    return None
+
+
+class _Analysis:
+    """Walks a parse tree and collects findings."""
+
+    def __init__(self, dotall):
+        self.dotall = dotall
+        self.findings = []
+
+    def walk(self, items, prefix, follow):
+        """
+        Check a sequence of items.
+
+        prefix: sample text that reaches the start of items
+        follow: first chars of whatever may come after items
+        """
+        for index, (op, av) in enumerate(items):
+            before = prefix + regex_ast.sample(items[:index], self.dotall)
+            after_first, after_nullable = regex_ast.first_chars(items[index + 1:], self.dotall)
+            after = after_first | follow if after_nullable else after_first
+
+            if _unbounded(op, av):
+                self.check_repeat(av[2], before, after)
+                self.check_adjacent(items, index, before, after)
+
+            for child in regex_ast.children(op, av):
+                if op is BRANCH or op is SUBPATTERN or regex_ast.is_repeat(op):
+                    self.walk(child, before, after)
+
+    def check_repeat(self, body, before, after):
+        """Look for nested quantifiers and ambiguous alternation in a repeat body."""
+        body_first, _ = regex_ast.first_chars(body, self.dotall)
+
+        for op, av in _trailing_repeats(body):
+            inner_chars = regex_ast.all_chars(av[2], self.dotall)
+            overlap = inner_chars & body_first
+            if overlap:
+                pump = regex_ast.pick_char(overlap)
+                self.findings.append(_finding(
+                    'nested_quantifier', EXPONENTIAL,
+                    "unbounded repeat nested inside another unbounded repeat "
+                    f"over overlapping characters (e.g. {pump!r})",
+                    before, pump, _fail_char(inner_chars, after)
+                ))
+                return
+
+        pump = regex_ast.pick_char(body_first) or regex_ast.sample(body, self.dotall)
+        for branches in _branches(body):
+            firsts = [regex_ast.first_chars(branch, self.dotall) for branch in branches]
+            for i in range(len(branches)):
+                for j in range(i + 1, len(branches)):
+                    overlap = firsts[i][0] & firsts[j][0]
+                    if overlap:
+                        detail = f"can both start with {regex_ast.pick_char(overlap)!r}"
+                    elif firsts[i][1] and firsts[j][1]:
+                        detail = "can both match the empty string"
+                    else:
+                        continue
+                    self.findings.append(_finding(
+                        'ambiguous_alternation', EXPONENTIAL,
+                        f"alternatives {i + 1} and {j + 1} inside an unbounded repeat {detail}",
+                        before, pump,
+                        _fail_char(regex_ast.all_chars(body, self.dotall), after)
+                    ))
+                    return
+
+    def check_adjacent(self, items, index, before, after):
+        """Look for a later unbounded repeat overlapping items[index]."""
+        op, av = items[index]
+        chars = regex_ast.all_chars(av[2], self.dotall)
+        for later in range(index + 1, len(items)):
+            later_op, later_av = items[later]
+            if _unbounded(later_op, later_av):
+                overlap = chars & regex_ast.all_chars(later_av[2], self.dotall)
+                if overlap:
+                    pump = regex_ast.pick_char(overlap)
+                    self.findings.append(_finding(
+                        'overlapping_quantifiers', POLYNOMIAL,
+                        f"adjacent unbounded repeats both match {pump!r}",
+                        before, pump,
+                        _fail_char(chars, regex_ast.all_chars(later_av[2], self.dotall), after)
+                    ))
+                return
+            if not regex_ast.nullable([items[later]]):
+                return
+
+
+def analyze(pattern, flags=0):
+    """
+    Statically analyze a pattern for catastrophic backtracking.
+
+    Returns a list of findings, each a dict with 'kind', 'severity'
+    ('exponential' or 'polynomial'), 'detail' and an 'attack' dict
+    holding prefix, pump and suffix strings.
+    """
+    items, flags = regex_ast.parse(pattern, flags)
+    analysis = _Analysis(bool(flags & re.DOTALL))
+    analysis.walk(items, '', frozenset())
+
+    # re.search retries a leading unbounded repeat at every position
+    leading = _leading_repeat(items)
+    if leading is not None and not analysis.findings:
+        chars = regex_ast.all_chars(leading[2], analysis.dotall)
+        pump = regex_ast.pick_char(chars)
+        analysis.findings.append(_finding(
+            'unanchored_leading_quantifier', POLYNOMIAL,
+            f"re.search retries the leading repeat at every {pump!r}",
+            '', pump, _fail_char(chars, regex_ast.first_chars(leading[3], analysis.dotall)[0])
+        ))
+
+    return analysis.findings
+
+
+def attack_string(attack, size):
+    """Build the attack input with the pump repeated size times."""
+    return attack['prefix'] + attack['pump'] * size + attack['suffix']
+
+
+def _time_search(pattern, flags, text):
+    """Return the best-of-3 (or single, if slow) time of re.search."""
+    compiled = re.compile(pattern, flags)
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        compiled.search(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if elapsed > 0.01:
+            break
+    return best
+
+
+def measure(pattern, attack, budget=0.25, exponential=False, flags=0):
+    """
+    Time re.search on attack strings of growing size.
+
+    Exponential attacks grow the pump by 2 characters per step, others
+    double it. Measuring stops once a single search exceeds budget
+    seconds. Searches run in a worker process that is killed after
+    10 x budget, so a catastrophic pattern cannot hang the caller; a
+    killed search is recorded with a time of None.
+
+    Returns a list of (size, seconds) samples.
+    """
+    samples = []
+    size = 4 if exponential else 256
+    pool = multiprocessing.Pool(1)
+    try:
+        while True:
+            text = attack_string(attack, size)
+            try:
+                elapsed = pool.apply_async(_time_search, (pattern, flags, text)).get(budget * 10)
+            except multiprocessing.TimeoutError:
+                samples.append((size, None))
+                return samples
+            samples.append((size, elapsed))
+            if elapsed > budget or size >= (40 if exponential else 1 << 20):
+                return samples
+            size = size + 2 if exponential else size * 2
+    finally:
+        pool.terminate()
+
+
+def growth_exponent(samples):
+    """
+    Fit time ~ size**k to the samples by least squares on log-log.
+
+    Only samples above 10 microseconds are used, since smaller timings
+    are dominated by call overhead.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in samples if t and t > 1e-5]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    den = sum((x - mean_x) ** 2 for x, _ in points)
+    return num / den if den else 0.0
+
+
+def check_pattern(pattern, flags=0, max_exponent=1.5, run=True, budget=0.25):
+    """
+    Analyze a pattern and optionally confirm findings by timing them.
+
+    Returns a report dict with 'pattern', 'findings' (each with
+    'samples' and 'exponent' when run=True) and 'ok'. A pattern fails
+    when a finding is exponential, or when its measured growth exponent
+    exceeds max_exponent, or a timed search had to be killed.
+    """
+    findings = analyze(pattern, flags)
+    ok = True
+    for finding in findings:
+        exponential = finding['severity'] == EXPONENTIAL
+        if run:
+            finding['samples'] = measure(pattern, finding['attack'], budget,
+                                         exponential, flags)
+            finding['exponent'] = growth_exponent(finding['samples'])
+            if finding['samples'][-1][1] is None:
+                ok = False
+        if exponential or finding.get('exponent', 0.0) > max_exponent:
+            ok = False
+    return {'pattern': pattern, 'findings': findings, 'ok': ok}
+
+
+def print_report(name, report):
+    """Print one pattern's report."""
+    status = "✓" if report['ok'] else "✗"
+    print(f"{status} {name}")
+    print(f"    {report['pattern']}")
+    for finding in report['findings']:
+        attack = finding['attack']
+        example = attack_string(attack, 8)
+        print(f"    [{finding['severity']}] {finding['kind']}: {finding['detail']}")
+        print(f"      attack: {example!r} (pump {attack['pump']!r})")
+        if 'samples' in finding:
+            size, seconds = finding['samples'][-1]
+            took = "timed out" if seconds is None else f"took {seconds * 1000:.2f} ms"
+            print(f"      measured: n={size} {took}, "
+                  f"growth exponent {finding['exponent']:.2f}")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Detect catastrophic backtracking in regexes.")
+    parser.add_argument('patterns', nargs='*', help="patterns to check (default: built-in catalog)")
+    parser.add_argument('--measure', action='store_true', help="time attack strings of growing size")
+    parser.add_argument('--max-exponent', type=float, default=1.5,
+                        help="fail when measured growth exceeds this exponent (default 1.5)")
+    parser.add_argument('--budget', type=float, default=0.25,
+                        help="stop growing an attack once one search takes this many seconds")
+    args = parser.parse_args()
+
+    targets = [(p, p) for p in args.patterns] if args.patterns else CATALOG
+
+    failed = 0
+    for name, pattern in targets:
+        try:
+            report = check_pattern(pattern, 0, args.max_exponent, args.measure, args.budget)
+        except re.error as e:
+            print(f"✗ {name}\n    invalid pattern: {e}")
+            failed += 1
+            continue
+        print_report(name, report)
+        if not report['ok']:
+            failed += 1
+
+    print(f"\n{len(targets) - failed}/{len(targets)} patterns passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
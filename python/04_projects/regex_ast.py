@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Regex AST Helpers - Project Implementation
+
+Small helpers over the parse trees produced by Python's own regex parser
+(`re._parser`, or `sre_parse` on Python < 3.11), shared by the pattern
+analysis tools in this folder.
+
+A parsed pattern is a list of (op, av) items, for example:
+    \\d+x  ->  [(MAX_REPEAT, (1, MAXREPEAT, [(IN, [(CATEGORY, CATEGORY_DIGIT)])])),
+               (LITERAL, 120)]
+
+Character sets are approximated over ASCII, which is enough to reason
+about overlap between quantifiers and to build sample strings.
+"""
+
+import string
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Opcodes and constants (re-exported by the parser module)
+LITERAL = sre_parse.LITERAL
+NOT_LITERAL = sre_parse.NOT_LITERAL
+ANY = sre_parse.ANY
+IN = sre_parse.IN
+RANGE = sre_parse.RANGE
+NEGATE = sre_parse.NEGATE
+CATEGORY = sre_parse.CATEGORY
+BRANCH = sre_parse.BRANCH
+SUBPATTERN = sre_parse.SUBPATTERN
+MAX_REPEAT = sre_parse.MAX_REPEAT
+MIN_REPEAT = sre_parse.MIN_REPEAT
+MAXREPEAT = sre_parse.MAXREPEAT
+AT = sre_parse.AT
+ASSERT = sre_parse.ASSERT
+ASSERT_NOT = sre_parse.ASSERT_NOT
+GROUPREF = sre_parse.GROUPREF
+GROUPREF_EXISTS = sre_parse.GROUPREF_EXISTS
+AT_BEGINNING = sre_parse.AT_BEGINNING
+AT_BEGINNING_STRING = sre_parse.AT_BEGINNING_STRING
+
+# Not available before Python 3.11
+POSSESSIVE_REPEAT = getattr(sre_parse, 'POSSESSIVE_REPEAT', None)
+ATOMIC_GROUP = getattr(sre_parse, 'ATOMIC_GROUP', None)
+
+REPEATS = tuple(op for op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT) if op is not None)
+SINGLE_CHAR_OPS = (LITERAL, NOT_LITERAL, ANY, IN)
+
+ALPHABET = frozenset(chr(i) for i in range(128))
+
+CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: frozenset(string.digits),
+    sre_parse.CATEGORY_SPACE: frozenset(' \t\n\r\f\v'),
+    sre_parse.CATEGORY_WORD: frozenset(string.ascii_letters + string.digits + '_'),
+}
+CATEGORIES[sre_parse.CATEGORY_NOT_DIGIT] = ALPHABET - CATEGORIES[sre_parse.CATEGORY_DIGIT]
+CATEGORIES[sre_parse.CATEGORY_NOT_SPACE] = ALPHABET - CATEGORIES[sre_parse.CATEGORY_SPACE]
+CATEGORIES[sre_parse.CATEGORY_NOT_WORD] = ALPHABET - CATEGORIES[sre_parse.CATEGORY_WORD]
+
+
+def parse(pattern, flags=0):
+    """
+    Parse a pattern (string or compiled) into a list of (op, av) items.
+
+    Returns (items, flags) where flags includes inline flags like (?s).
+    """
+    if hasattr(pattern, 'pattern'):
+        flags |= pattern.flags
+        pattern = pattern.pattern
+    parsed = sre_parse.parse(pattern, flags)
+    return list(parsed), parsed.state.flags
+
+
+def width(pattern, flags=0):
+    """Return (min, max) match length; max is None when unbounded."""
+    if hasattr(pattern, 'pattern'):
+        flags |= pattern.flags
+        pattern = pattern.pattern
+    low, high = sre_parse.parse(pattern, flags).getwidth()
+    return low, (None if high >= MAXREPEAT else high)
+
+
+def is_repeat(op):
+    return op in REPEATS
+
+
+def item_chars(op, av, dotall=False):
+    """
+    Return the ASCII characters a single-character item can match.
+
+    Returns None if the item is not a single-character item.
+    """
+    if op is LITERAL:
+        return frozenset((chr(av),))
+    if op is NOT_LITERAL:
+        return ALPHABET - {chr(av)}
+    if op is ANY:
+        return ALPHABET if dotall else ALPHABET - {'\n'}
+    if op is IN:
+        negate = False
+        chars = set()
+        for in_op, in_av in av:
+            if in_op is NEGATE:
+                negate = True
+            elif in_op is LITERAL:
+                chars.add(chr(in_av))
+            elif in_op is RANGE:
+                low, high = in_av
+                chars.update(chr(c) for c in range(low, min(high, 127) + 1))
+            elif in_op is CATEGORY:
+                chars |= CATEGORIES.get(in_av, ALPHABET)
+            else:
+                chars |= ALPHABET
+        return frozenset(ALPHABET - chars if negate else chars)
+    return None
+
+
+def children(op, av):
+    """Return the sub-item lists nested inside an item."""
+    if is_repeat(op):
+        return [av[2]]
+    if op is SUBPATTERN:
+        return [av[-1]]
+    if op is BRANCH:
+        return list(av[1])
+    if op in (ASSERT, ASSERT_NOT):
+        return [av[1]]
+    if ATOMIC_GROUP is not None and op is ATOMIC_GROUP:
+        return [av]
+    if op is GROUPREF_EXISTS:
+        return [branch for branch in av[1:] if branch is not None]
+    return []
+
+
+def all_chars(items, dotall=False):
+    """Return every character that can appear in a match of items."""
+    chars = set()
+    for op, av in items:
+        single = item_chars(op, av, dotall)
+        if single is not None:
+            chars |= single
+        elif op is GROUPREF:
+            chars |= ALPHABET
+        elif op not in (ASSERT, ASSERT_NOT):
+            for child in children(op, av):
+                chars |= all_chars(child, dotall)
+    return frozenset(chars)
+
+
+def first_chars(items, dotall=False):
+    """
+    Return (chars, nullable) for a sequence of items.
+
+    chars is the set of characters a match can start with; nullable is
+    True when the sequence can match the empty string.
+    """
+    chars = set()
+    for op, av in items:
+        item_first, nullable = item_first_chars(op, av, dotall)
+        chars |= item_first
+        if not nullable:
+            return frozenset(chars), False
+    return frozenset(chars), True
+
+
+def item_first_chars(op, av, dotall=False):
+    """Return (chars, nullable) for a single item."""
+    single = item_chars(op, av, dotall)
+    if single is not None:
+        return single, False
+    if is_repeat(op):
+        body_first, body_nullable = first_chars(av[2], dotall)
+        return body_first, av[0] == 0 or body_nullable
+    if op is BRANCH or op is GROUPREF_EXISTS:
+        chars = set()
+        nullable = op is GROUPREF_EXISTS and av[2] is None
+        for branch in children(op, av):
+            branch_first, branch_nullable = first_chars(branch, dotall)
+            chars |= branch_first
+            nullable = nullable or branch_nullable
+        return frozenset(chars), nullable
+    if op is SUBPATTERN or (ATOMIC_GROUP is not None and op is ATOMIC_GROUP):
+        return first_chars(children(op, av)[0], dotall)
+    if op is GROUPREF:
+        return ALPHABET, True
+    # AT, ASSERT, ASSERT_NOT and anything else consume no characters
+    return frozenset(), True
+
+
+def nullable(items):
+    """Return True if items can match the empty string."""
+    return first_chars(items)[1]
+
+
+def pick_char(chars, preferred='a0 _-.!'):
+    """Pick a readable representative character from a set."""
+    for char in preferred:
+        if char in chars:
+            return char
+    for char in string.ascii_letters + string.digits + string.punctuation:
+        if char in chars:
+            return char
+    return min(chars) if chars else ''
+
+
+def sample(items, dotall=False):
+    """Build a short string that matches items, ignoring assertions."""
+    parts = []
+    for op, av in items:
+        single = item_chars(op, av, dotall)
+        if single is not None:
+            parts.append(pick_char(single))
+        elif is_repeat(op):
+            parts.append(sample(av[2], dotall) * av[0])
+        elif op is SUBPATTERN or (ATOMIC_GROUP is not None and op is ATOMIC_GROUP):
+            parts.append(sample(children(op, av)[0], dotall))
+        elif op is BRANCH:
+            parts.append(sample(av[1][0], dotall))
+    return ''.join(parts)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Regex Catalog - Project Implementation
+
+Production-ready patterns taken from the lesson examples, importable
+under stable names with one API:
+
+    import regex_catalog
+    regex_catalog.IP_ADDRESS.search(text)
+    regex_catalog.get('hex_color').finditer(css)
+    regex_catalog.search('time_hhmm', "meeting at 09:30")
+
+Patterns are compiled on first use (through the shared `patterns` cache),
+so importing the catalog is cheap no matter how many entries it has.
+
+Each entry records the lesson it came from and example inputs that must
+and must not match; `python regex_catalog.py --check` verifies them and
+`python regex_catalog.py --benchmark` times every pattern.
+"""
+
+import argparse
+import sys
+import time
+
+import patterns
+
+
+class CatalogPattern:
+    """
+    A named pattern, compiled on first use.
+
+    Args:
+        name: catalog key
+        pattern: regex source
+        flags: re flags
+        description: one-line summary
+        source: lesson function the pattern came from
+        examples: inputs the pattern must match (with match())
+        counterexamples: inputs it must not match
+    """
+
+    def __init__(self, name, pattern, flags=0, description='', source='',
+                 examples=(), counterexamples=()):
+        self.name = name
+        self.pattern = pattern
+        self.flags = flags
+        self.description = description
+        self.source = source
+        self.examples = tuple(examples)
+        self.counterexamples = tuple(counterexamples)
+        self._compiled = None
+
+    @property
+    def compiled(self):
+        """The compiled re.Pattern (compiled on first access)."""
+        if self._compiled is None:
+            self._compiled = patterns.compile(self.pattern, self.flags)
+        return self._compiled
+
+    def match(self, text, pos=0, endpos=sys.maxsize):
+        return self.compiled.match(text, pos, endpos)
+
+    def fullmatch(self, text, pos=0, endpos=sys.maxsize):
+        return self.compiled.fullmatch(text, pos, endpos)
+
+    def search(self, text, pos=0, endpos=sys.maxsize):
+        return self.compiled.search(text, pos, endpos)
+
+    def finditer(self, text, pos=0, endpos=sys.maxsize):
+        return self.compiled.finditer(text, pos, endpos)
+
+    def findall(self, text, pos=0, endpos=sys.maxsize):
+        return self.compiled.findall(text, pos, endpos)
+
+    def check(self):
+        """Return a list of example inputs that do not behave as recorded."""
+        failures = []
+        for text in self.examples:
+            if not self.match(text):
+                failures.append(f"should match: {text!r}")
+        for text in self.counterexamples:
+            if self.match(text):
+                failures.append(f"should not match: {text!r}")
+        return failures
+
+    def __repr__(self):
+        return f"<CatalogPattern {self.name}: {self.pattern}>"
+
+
+CATALOG = {}
+
+
+def _register(name, pattern, flags=0, **info):
+    entry = CATALOG[name] = CatalogPattern(name, pattern, flags, **info)
+    return entry
+
+
+IP_ADDRESS = _register(
+    'ip_address', r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}',
+    description="Dotted IPv4 address (octet ranges not checked)",
+    source='01_basics/basic_exercises.exercise_9_simple_ip_address',
+    examples=["192.168.1.1", "10.0.0.1", "192.168.1.1.1"],
+    counterexamples=["192.168.1", "192.168"])
+
+TIME_HHMM = _register(
+    'time_hhmm', r'(?P<hour>[01]\d|2[0-3]):(?P<minute>[0-5]\d)',
+    description="24-hour time HH:MM",
+    source='01_basics/basic_exercises.exercise_6_time_format',
+    examples=["09:30", "23:59", "00:00"],
+    counterexamples=["24:00", "12:60", "9:30"])
+
+PHONE_US = _register(
+    'phone_us', r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+    description="US phone number with optional -, . or space separators",
+    source='01_basics/basic_exercises.exercise_2_detect_mobile_number',
+    examples=["555-123-4567", "555.123.4567", "5551234567"],
+    counterexamples=["555-1234", "phone"])
+
+USERNAME = _register(
+    'username', r'^[a-zA-Z][a-zA-Z0-9_]{4,19}$',
+    description="Username: letter first, 5-20 letters, digits or underscores",
+    source='01_basics/basic_exercises.exercise_8_validate_username_strict',
+    examples=["john_doe", "user123", "admin"],
+    counterexamples=["123user", "user-name", "abc"])
+
+HEX_COLOR = _register(
+    'hex_color', r'#[0-9a-fA-F]{6}',
+    description="Six-digit hex color code",
+    source='02_intermediate/character_classes.example_hex_color_code',
+    examples=["#FF5733", "#00ff00", "#123456"],
+    counterexamples=["#GGG", "FF5733"])
+
+CREDIT_CARD = _register(
+    'credit_card', r'^\d{4}(?P<sep>[- ]?)\d{4}(?P=sep)\d{4}(?P=sep)\d{4}$',
+    description="16-digit card number with one consistent separator",
+    source='02_intermediate/intermediate_exercises.exercise_7_validate_credit_card',
+    examples=["1234-5678-9012-3456", "1234 5678 9012 3456", "1234567890123456"],
+    counterexamples=["1234-5678 9012-3456", "1234-5678-9012"])
+
+EMAIL = _register(
+    'email', r'(?P<local>[a-zA-Z0-9._%+-]+)@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+    description="Email address with local part and domain groups",
+    source='02_intermediate/intermediate_exercises.exercise_8_extract_email_parts',
+    examples=["user@example.com", "john.doe@company.co.uk", "user+tag@subdomain.example.org"],
+    counterexamples=["user@", "@example.com", "user@example"])
+
+PRICE = _register(
+    'price', r'\$(?P<amount>\d+(?:\.\d{2})?)',
+    description="Dollar amount with optional cents",
+    source='02_intermediate/intermediate_exercises.exercise_3_extract_prices',
+    examples=["$19.99", "$5", "$1000.00"],
+    counterexamples=["19.99", "$.99"])
+
+HASHTAG = _register(
+    'hashtag', r'#(?P<tag>\w+)',
+    description="Hashtag",
+    source='02_intermediate/intermediate_exercises.exercise_2_extract_hashtags',
+    examples=["#python", "#regex101"],
+    counterexamples=["python", "# spaced"])
+
+URL_COMPONENTS = _register(
+    'url_components',
+    r'(?P<scheme>https?)://(?P<host>[^/]+)(?P<path>/[^\s?]*)?(?P<query>\?[^\s]*)?',
+    description="HTTP(S) URL split into scheme, host, path and query",
+    source='03_advanced/complex_patterns.example_extract_url_components',
+    examples=["https://www.example.com/path?param=value", "http://example.com"],
+    counterexamples=["ftp://example.com", "example.com/path"])
+
+IP_PORT = _register(
+    'ip_port', r'(?P<ip>\d{1,3}(?:\.\d{1,3}){3}):(?P<port>\d{1,5})',
+    description="IPv4 address with port",
+    source='03_advanced/complex_patterns.example_extract_ip_port',
+    examples=["192.168.1.1:8080", "10.0.0.1:22"],
+    counterexamples=["192.168.1.1", "localhost:8080"])
+
+APP_LOG = _register(
+    'app_log',
+    r'(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(?P<level>\w+)\]\s+(?P<message>.*)',
+    description="Application log line: 'YYYY-MM-DD HH:MM:SS [LEVEL] message'",
+    source='03_advanced/complex_patterns.example_log_parsing_named_groups',
+    examples=["2024-01-15 10:30:45 [ERROR] Database connection failed"],
+    counterexamples=["[ERROR] no timestamp", "2024-01-15 [INFO] no time"])
+
+
+def get(name):
+    """Return the catalog entry for name (KeyError if unknown)."""
+    return CATALOG[name]
+
+
+def names():
+    """Return all catalog names in registration order."""
+    return list(CATALOG)
+
+
+def match(name, text):
+    return CATALOG[name].match(text)
+
+
+def fullmatch(name, text):
+    return CATALOG[name].fullmatch(text)
+
+
+def search(name, text):
+    return CATALOG[name].search(text)
+
+
+def finditer(name, text):
+    return CATALOG[name].finditer(text)
+
+
+def findall(name, text):
+    return CATALOG[name].findall(text)
+
+
+def _best_ns(func, number, repeat=5):
+    """Best-of-repeat time per call in nanoseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def benchmark(selected=None, number=20000, text_size=100000):
+    """
+    Time each catalog pattern.
+
+    Measures first use (the compile, unless already cached), match() on each example and counterexample,
+    and finditer throughput over a synthetic text mixing the examples
+    with filler. Returns a list of result dicts.
+    """
+    results = []
+    for name in selected or names():
+        entry = CATALOG[name]
+        start = time.perf_counter_ns()
+        compiled = entry.compiled
+        compile_ns = time.perf_counter_ns() - start
+
+        inputs = entry.examples + entry.counterexamples
+        match_ns = sum(_best_ns(lambda t=t: compiled.match(t), number) for t in inputs) / len(inputs)
+
+        unit = ' lorem ipsum dolor '.join(entry.examples) + ' lorem ipsum dolor sit amet\n'
+        text = unit * (text_size // len(unit) + 1)
+        count = sum(1 for _ in compiled.finditer(text))
+        scan_ns = _best_ns(lambda: sum(1 for _ in compiled.finditer(text)), 1, 3)
+        results.append({
+            'name': name,
+            'compile_us': compile_ns / 1000,
+            'match_ns': match_ns,
+            'scan_mb_s': len(text) / scan_ns * 1000,
+            'scan_ns_per_match': scan_ns / count if count else None
+        })
+    return results
+
+
+def main():
+    """List, check or benchmark the catalog."""
+    parser = argparse.ArgumentParser(description="Compiled regex catalog.")
+    parser.add_argument('names', nargs='*', help="catalog entries (default all)")
+    parser.add_argument('--check', action='store_true', help="verify examples and counterexamples")
+    parser.add_argument('--benchmark', action='store_true', help="time each pattern")
+    parser.add_argument('--number', type=int, default=20000, help="match() calls per timing")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in CATALOG]
+    if unknown:
+        print(f"Error: unknown pattern(s): {', '.join(unknown)}")
+        sys.exit(1)
+    selected = args.names or names()
+
+    if args.check:
+        failed = 0
+        for name in selected:
+            failures = CATALOG[name].check()
+            failed += bool(failures)
+            print(f"{'✓' if not failures else '✗'} {name}")
+            for failure in failures:
+                print(f"    {failure}")
+        sys.exit(1 if failed else 0)
+
+    if args.benchmark:
+        print(f"{'Pattern':<16} {'Compile us':>11} {'match() ns':>11} {'Scan MB/s':>10} {'ns/match':>10}")
+        print("-" * 62)
+        for r in benchmark(selected, args.number):
+            per_match = f"{r['scan_ns_per_match']:.0f}" if r['scan_ns_per_match'] else '-'
+            print(f"{r['name']:<16} {r['compile_us']:>11.1f} {r['match_ns']:>11.0f} "
+                  f"{r['scan_mb_s']:>10.1f} {per_match:>10}")
+        return
+
+    for name in selected:
+        entry = CATALOG[name]
+        print(f"{name:<16} {entry.pattern}")
+        print(f"{'':<16} {entry.description} ({entry.source})")
+
+
+if __name__ == "__main__":
+    main()
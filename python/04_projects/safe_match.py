@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Safe Match - Project Implementation
+
+Runs regex matching on untrusted input under a wall-clock deadline.
+
+Python's `re` has no timeout, so a single pathological input can hang a
+worker forever. Guarded calls run in a separate worker process; if the
+deadline passes, the worker is killed, a fresh one is started for the next
+call, and a MatchTimeout error describing the pattern and input is raised
+instead of stalling the pipeline.
+
+Going through a worker costs an inter-process round trip, so SafeMatcher
+only guards patterns the ReDoS analyzer flags as exponential by default
+and runs everything else inline.
+
+Usage:
+    matcher = SafeMatcher(r'\\(([^()]+|\\([^()]*\\))*\\)', timeout=0.5)
+    try:
+        match = matcher.search(text)
+    except MatchTimeout as e:
+        print(e.to_dict())
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+
+import patterns
+from redos_analyzer import EXPONENTIAL, analyze
+
+
+class MatchTimeout(Exception):
+    """Raised when a guarded call exceeds its deadline."""
+
+    def __init__(self, pattern, timeout, input_length, operation='match'):
+        self.pattern = pattern
+        self.timeout = timeout
+        self.input_length = input_length
+        self.operation = operation
+        super().__init__(
+            f"{operation} timed out after {timeout}s on {input_length} chars: {pattern}"
+        )
+
+    def to_dict(self):
+        """Return the error as a JSON-friendly dict."""
+        return {
+            'error': 'timeout',
+            'operation': self.operation,
+            'pattern': self.pattern,
+            'timeout': self.timeout,
+            'input_length': self.input_length
+        }
+
+
+class MatchResult:
+    """Picklable stand-in for re.Match returned from worker processes."""
+
+    def __init__(self, match):
+        self.string_span = match.span()
+        self.match_text = match.group()
+        self.group_values = match.groups()
+        self.group_spans = [match.span(i) for i in range(1, len(self.group_values) + 1)]
+        self.named = match.groupdict()
+        self.index = dict(match.re.groupindex)
+
+    def _index(self, group):
+        return self.index[group] if isinstance(group, str) else group
+
+    def group(self, *groups):
+        if not groups:
+            return self.match_text
+        values = [self.match_text if g == 0 else self.group_values[self._index(g) - 1]
+                  for g in groups]
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def __getitem__(self, group):
+        return self.group(group)
+
+    def groups(self, default=None):
+        return tuple(default if v is None else v for v in self.group_values)
+
+    def groupdict(self, default=None):
+        return {k: default if v is None else v for k, v in self.named.items()}
+
+    def span(self, group=0):
+        group = self._index(group)
+        return self.string_span if group == 0 else self.group_spans[group - 1]
+
+    def start(self, group=0):
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        return self.span(group)[1]
+
+
+def _run_pattern(pattern, flags, operation, text, extra):
+    """Worker-side regex call; converts match objects to MatchResult."""
+    compiled = patterns.compile(pattern, flags)
+    if operation in ('match', 'search', 'fullmatch'):
+        match = getattr(compiled, operation)(text)
+        return MatchResult(match) if match else None
+    if operation == 'finditer':
+        return [MatchResult(m) for m in compiled.finditer(text)]
+    if operation == 'findall':
+        return compiled.findall(text)
+    if operation == 'sub':
+        return compiled.sub(extra, text)
+    raise ValueError(f"unknown operation: {operation}")
+
+
+class _Guard:
+    """
+    Worker pool that is killed and restarted when a call overruns.
+
+    At most one call per worker is submitted at a time, so a call starts
+    running as soon as it is submitted: time spent waiting for a free
+    worker, or for a new pool to start, does not count toward its timeout.
+    """
+
+    def __init__(self, workers=1):
+        self.workers = workers
+        self.pool = None
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(workers)
+        self.timeouts = 0
+
+    def _pool(self):
+        with self.lock:
+            if self.pool is None:
+                self.pool = multiprocessing.Pool(self.workers)
+                self.pool.apply(os.getpid)  # wait until a worker is up
+            return self.pool
+
+    def call(self, func, args, timeout):
+        """Run func(*args) in a worker, raising TimeoutError after timeout."""
+        with self.slots:
+            pool = self._pool()
+            try:
+                return pool.apply_async(func, args).get(timeout)
+            except multiprocessing.TimeoutError:
+                with self.lock:
+                    self.timeouts += 1
+                    if self.pool is pool:
+                        self.pool = None
+                pool.terminate()
+                raise TimeoutError
+
+    def close(self):
+        with self.lock:
+            if self.pool is not None:
+                self.pool.terminate()
+                self.pool = None
+
+
+# Shared guard used by the helpers below
+guard = _Guard()
+
+
+def call_with_timeout(func, args=(), timeout=1.0):
+    """
+    Run a module-level function in a worker process with a deadline.
+
+    Raises MatchTimeout if it does not finish within timeout seconds.
+    """
+    try:
+        return guard.call(func, args, timeout)
+    except TimeoutError:
+        length = sum(len(a) for a in args if isinstance(a, str))
+        raise MatchTimeout(getattr(func, '__name__', repr(func)), timeout, length,
+                           'call') from None
+
+
+class SafeMatcher:
+    """
+    Regex wrapper enforcing a deadline on match/search/findall/...
+
+    Args:
+        pattern: pattern string
+        flags: re flags
+        timeout: seconds allowed per call
+        mode: 'auto' (guard patterns flagged as exponential), 'always'
+            or 'never'
+    """
+
+    def __init__(self, pattern, flags=0, timeout=1.0, mode='auto'):
+        self.pattern = pattern
+        self.flags = flags
+        self.timeout = timeout
+        self.compiled = patterns.compile(pattern, flags)
+        if mode == 'auto':
+            findings = analyze(pattern, flags)
+            self.guarded = any(f['severity'] == EXPONENTIAL for f in findings)
+        else:
+            self.guarded = mode == 'always'
+
+    def _call(self, operation, text, extra=None):
+        if not self.guarded:
+            if operation == 'sub':
+                return self.compiled.sub(extra, text)
+            return getattr(self.compiled, operation)(text)
+        try:
+            return guard.call(
+                _run_pattern, (self.pattern, self.flags, operation, text, extra),
+                self.timeout)
+        except TimeoutError:
+            raise MatchTimeout(self.pattern, self.timeout, len(text), operation) from None
+
+    def match(self, text):
+        return self._call('match', text)
+
+    def search(self, text):
+        return self._call('search', text)
+
+    def fullmatch(self, text):
+        return self._call('fullmatch', text)
+
+    def findall(self, text):
+        return self._call('findall', text)
+
+    def finditer(self, text):
+        return iter(self._call('finditer', text))
+
+    def sub(self, repl, text):
+        return self._call('sub', text, repl)
+
+
+def safe_match(pattern, text, timeout=1.0, flags=0):
+    """re.match with a deadline (always guarded)."""
+    return SafeMatcher(pattern, flags, timeout, 'always').match(text)
+
+
+def safe_search(pattern, text, timeout=1.0, flags=0):
+    """re.search with a deadline (always guarded)."""
+    return SafeMatcher(pattern, flags, timeout, 'always').search(text)
+
+
+def safe_findall(pattern, text, timeout=1.0, flags=0):
+    """re.findall with a deadline (always guarded)."""
+    return SafeMatcher(pattern, flags, timeout, 'always').findall(text)
+
+
+def main():
+    """Search each line of a file, reporting timeouts as JSON."""
+    parser = argparse.ArgumentParser(description="Search a file with a per-line deadline.")
+    parser.add_argument('pattern', help="regex pattern")
+    parser.add_argument('file', help="input file (one record per line)")
+    parser.add_argument('--timeout', type=float, default=1.0, help="seconds per line (default 1.0)")
+    parser.add_argument('--always', action='store_true', help="guard even patterns that look safe")
+    args = parser.parse_args()
+
+    try:
+        matcher = SafeMatcher(args.pattern, timeout=args.timeout,
+                              mode='always' if args.always else 'auto')
+    except re.error as e:
+        print(f"Error: invalid pattern: {e}")
+        sys.exit(1)
+
+    print(f"Guarded: {'yes' if matcher.guarded else 'no'}")
+    matched = timeouts = 0
+    start = time.perf_counter()
+    try:
+        with open(args.file, 'r', encoding='utf-8', errors='ignore') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.rstrip('\n')
+                try:
+                    if matcher.search(line):
+                        matched += 1
+                except MatchTimeout as e:
+                    timeouts += 1
+                    error = e.to_dict()
+                    error['line_number'] = line_num
+                    print(json.dumps(error))
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+    finally:
+        guard.close()
+
+    print(f"Matched lines: {matched}")
+    print(f"Timed out lines: {timeouts}")
+    print(f"Elapsed: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
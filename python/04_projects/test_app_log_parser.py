@@ -0,0 +1,36 @@
+"""Tests for record parsing in app_log_parser."""
+
+import random
+
+import pytest
+
+import app_log_parser
+
+PIECES = [
+    '[2024-01-01 10:00:00] ERROR: boom\n',
+    '2024-01-01 10:00:01 [INFO] ok\n',
+    'Traceback (most recent call last):\n',
+    '  File "x", line 1\n',
+    '   at com.x.Y(Y.java:3)\n',
+    'garbage\n',
+    '\n',
+    '[2024-01-01 10:00:02] WARNING: bare cr\r',
+    '  continued\r',
+    'crlf line\r\n',
+]
+
+
+def _parse(path, levels, **kwargs):
+    parser = app_log_parser.AppLogParser(levels)
+    records = list(parser.parse_file_records(str(path), **kwargs))
+    return records, (parser.lines, parser.filtered, parser.unparsed, parser.stats.counts)
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_parallel_records_match_sequential(tmp_path, seed):
+    rng = random.Random(seed)
+    path = tmp_path / 'app.log'
+    path.write_bytes(''.join(rng.choice(PIECES) for _ in range(rng.randint(0, 30))).encode())
+    levels = rng.choice([None, ['ERROR']])
+    expected = _parse(path, levels)
+    assert _parse(path, levels, workers=2, chunk_size=rng.randint(1, 40)) == expected
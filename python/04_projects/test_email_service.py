@@ -0,0 +1,47 @@
+"""Tests for the email validation service."""
+
+import asyncio
+import json
+
+import email_validator
+from email_service import MAX_REQUEST_BYTES, MicroBatcher, ValidationServer
+
+
+async def _exchange(requests, limit=MAX_REQUEST_BYTES):
+    """Send request lines to a fresh server; return the decoded responses."""
+    batcher = MicroBatcher()
+    server = ValidationServer(batcher)
+    batch_task = asyncio.ensure_future(batcher.run())
+    listener = await asyncio.start_server(server.handle_client, '127.0.0.1', 0, limit=limit)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port,
+                                                       limit=MAX_REQUEST_BYTES)
+        responses = []
+        for request in requests:
+            writer.write(request.encode('utf-8') + b'\n')
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.01)  # let the server see the connection close
+        return responses
+    finally:
+        listener.close()
+        batch_task.cancel()
+
+
+def test_batch_over_64_kib():
+    emails = [f'user{i}@example.com' for i in range(5000)]
+    request = json.dumps(emails)
+    assert len(request) > 64 * 1024
+    [response] = asyncio.run(_exchange([request]))
+    assert [r['valid'] for r in response] == [
+        email_validator.validate_email(e)['valid'] for e in emails]
+
+
+def test_request_over_limit_is_rejected_and_connection_kept():
+    request = json.dumps([f'user{i}@example.com' for i in range(500)])
+    responses = asyncio.run(_exchange([request, 'user@example.com'], limit=1024))
+    assert responses[0] == {'error': "request too large"}
+    assert responses[1]['valid'] is True
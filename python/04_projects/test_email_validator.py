@@ -0,0 +1,57 @@
+"""Tests for the email validation cache."""
+
+import pytest
+
+import email_validator
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    email_validator.email_cache.clear()
+    email_validator.domain_cache.clear()
+    yield
+    email_validator.email_cache.clear()
+    email_validator.domain_cache.clear()
+
+
+@pytest.mark.parametrize('emails', [
+    [' user@example.com', 'user@example.com', 'user@example.com '],
+    ['user@example.com', 'user@example.com ', ' user@example.com'],
+    ['x' * 320, '@' + 'x' * 320],
+    ['@' + 'x' * 320, 'x' * 320],
+])
+def test_cached_result_does_not_depend_on_call_order(emails):
+    expected = {email: email_validator.validate_email(email) for email in emails}
+    for email in emails:
+        assert email_validator.cached_validate_email(email) == expected[email]
+    for email in emails:
+        assert email_validator.cached_validate_email(email) == expected[email]
+
+
+def test_domain_case_shares_cache_entry():
+    email_validator.cached_validate_email('user@Example.com')
+    email_validator.cached_validate_email('user@example.com')
+    assert email_validator.email_cache.stats()['hits'] == 1
+
+
+@pytest.mark.parametrize('fail_fast', [False, True])
+def test_overlong_address_rejected_on_length_alone(fail_fast):
+    result = email_validator.validate_email('a' * 400 + '@example.com', fail_fast)
+    assert not result['valid']
+    assert result['errors'] == ['Email too long (max 320 characters)']
+
+
+def test_missing_column_reported_before_output_is_created(tmp_path, capsys):
+    source = tmp_path / 'emails.csv'
+    source.write_text('name,email\nx,user@example.com\n')
+    output = tmp_path / 'report.csv'
+    email_validator.validate_file(str(source), str(output), column='mail')
+    assert "Column 'mail' not found" in capsys.readouterr().out
+    assert not output.exists()
+
+
+def test_missing_input_reported_before_output_is_created(tmp_path, capsys):
+    output = tmp_path / 'report.csv'
+    email_validator.validate_file(str(tmp_path / 'missing.txt'), str(output))
+    assert 'not found' in capsys.readouterr().out
+    assert not output.exists()
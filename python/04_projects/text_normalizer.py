@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Text Normalizer - Project Implementation
+
+Composable text cleanup for large files, grown from the whitespace
+examples in the basics lessons
+
+    \\s{2,}  -> ' '    (basic_exercises.exercise_10_remove_extra_spaces)
+    [\\s\\t]+ -> ' '    (simple_patterns.example_4_find_spaces_tabs)
+
+Steps:
+    controls   delete control characters (Unicode Cc) except tab and newline
+    quotes     fold curly quotes and primes to ' and "
+    collapse   replace each run of whitespace within a line with one space
+    trim       strip whitespace from both ends of each line
+
+Text is processed in blocks of whole lines; '\\n' is the line separator
+and is always kept. Adjacent steps of the same kind are fused into one
+pass: character mappings into a single str.translate table, collapse
+and trim into ' '.join(line.split()). The default pipeline is therefore
+two passes over each block, neither running a regex on ASCII text.
+
+Files are streamed block by block, optionally through a process pool;
+output keeps the input order.
+
+Usage:
+    python text_normalizer.py input.txt -o clean.txt
+    python text_normalizer.py input.txt -o clean.txt --steps controls,collapse --workers 8
+    python text_normalizer.py input.txt --benchmark
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+import patterns
+
+# Control characters other than tab and newline
+CONTROL_CHARS = {c: None for c in chain(range(0x20), range(0x7f, 0xa0)) if c not in (0x09, 0x0a)}
+
+# Curly quotes and primes
+QUOTES = {0x2018: "'", 0x2019: "'", 0x201a: "'", 0x201b: "'", 0x2032: "'",
+          0x201c: '"', 0x201d: '"', 0x201e: '"', 0x201f: '"', 0x2033: '"'}
+
+# Whitespace runs within a line that are not already a single space
+WHITESPACE_RUN = patterns.compile(r'[^\S\n]{2,}|[^\S \n]')
+
+# Characters read per block (blocks are extended to the next newline)
+BLOCK_SIZE = 1 << 20
+
+
+def _compose(first, second):
+    """Return one translate table equal to applying first, then second."""
+    table = dict(second)
+    for code, value in first.items():
+        if value is None:
+            table[code] = None
+        else:
+            text = chr(value) if isinstance(value, int) else value
+            table[code] = text.translate(second)
+    return table
+
+
+class Translate:
+    """
+    A step that maps or deletes single characters.
+
+    ASCII blocks go through str.translate. A non-ASCII block makes
+    str.translate fall back to a dict lookup per character, so those
+    blocks use one regex over the table's keys instead.
+
+    Args:
+        name: step name
+        table: str.translate table (code point -> str, code point or None)
+    """
+
+    def __init__(self, name, table):
+        self.name = name
+        self.table = table
+        self.has_ascii = any(code < 128 for code in table)
+        self.replacements = {
+            chr(code): '' if value is None else chr(value) if isinstance(value, int) else value
+            for code, value in table.items()
+        }
+        keys = ''.join(re.escape(char) for char in sorted(self.replacements))
+        self.pattern = patterns.compile(f'[{keys}]') if keys else None
+
+    def then(self, other):
+        return Translate(f"{self.name}+{other.name}", _compose(self.table, other.table))
+
+    def _replace(self, match):
+        return self.replacements[match.group()]
+
+    def apply(self, text):
+        if text.isascii():
+            return text.translate(self.table) if self.has_ascii else text
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+    def __repr__(self):
+        return f"translate({self.name})"
+
+
+class Whitespace:
+    """
+    A step that collapses and/or trims whitespace within each line.
+
+    Args:
+        name: step name
+        collapse: replace each whitespace run with one space
+        trim: strip whitespace from both ends of each line
+    """
+
+    def __init__(self, name, collapse=False, trim=False):
+        self.name = name
+        self.collapse = collapse
+        self.trim = trim
+
+    def then(self, other):
+        return Whitespace(f"{self.name}+{other.name}", self.collapse or other.collapse,
+                          self.trim or other.trim)
+
+    def apply(self, text):
+        if self.collapse and self.trim:
+            return '\n'.join([' '.join(line.split()) for line in text.split('\n')])
+        if self.trim:
+            return '\n'.join([line.strip() for line in text.split('\n')])
+        if self.collapse:
+            return WHITESPACE_RUN.sub(' ', text)
+        return text
+
+    def __repr__(self):
+        return f"whitespace({self.name})"
+
+
+STEPS = {
+    'controls': Translate('controls', CONTROL_CHARS),
+    'quotes': Translate('quotes', QUOTES),
+    'collapse': Whitespace('collapse', collapse=True),
+    'trim': Whitespace('trim', trim=True),
+}
+
+DEFAULT_STEPS = ('controls', 'quotes', 'collapse', 'trim')
+
+
+class Pipeline:
+    """
+    Normalization steps, fused into as few passes as possible.
+
+    Calling the pipeline normalizes a string; every step works within
+    lines, so any split at newlines can be processed independently.
+
+    Args:
+        steps: names from STEPS or step objects, applied in order
+    """
+
+    def __init__(self, steps=DEFAULT_STEPS):
+        unknown = [step for step in steps if isinstance(step, str) and step not in STEPS]
+        if unknown:
+            raise ValueError(f"unknown step(s): {', '.join(unknown)}")
+        self.steps = [STEPS[step] if isinstance(step, str) else step for step in steps]
+        self.passes = []
+        for step in self.steps:
+            if self.passes and type(self.passes[-1]) is type(step):
+                self.passes[-1] = self.passes[-1].then(step)
+            else:
+                self.passes.append(step)
+
+    def __call__(self, text):
+        for step in self.passes:
+            text = step.apply(text)
+        return text
+
+    def map(self, blocks, workers=None):
+        """
+        Normalize blocks of whole lines, yielding results in input order.
+
+        With workers set, blocks are normalized in a process pool with at
+        most two blocks per worker in flight, so input of any size is
+        streamed rather than loaded into memory.
+        """
+        if not workers:
+            for block in blocks:
+                yield self(block)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for block in blocks:
+                pending.append(pool.submit(self, block))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def normalize_lines(self, lines, block_size=BLOCK_SIZE):
+        """Normalize an iterable of lines (e.g. a file), yielding blocks of output."""
+        block = []
+        size = 0
+        for line in lines:
+            block.append(line)
+            size += len(line)
+            if size >= block_size:
+                yield self(''.join(block))
+                block = []
+                size = 0
+        if block:
+            yield self(''.join(block))
+
+    def normalize_file(self, input_file, output=None, workers=None, block_size=BLOCK_SIZE):
+        """
+        Normalize input_file into output (a path, or stdout when None).
+
+        Returns (characters read, characters written).
+        """
+        read = written = 0
+
+        def blocks():
+            nonlocal read
+            for block in read_blocks(input_file, block_size):
+                read += len(block)
+                yield block
+
+        out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+        try:
+            for result in self.map(blocks(), workers):
+                written += len(result)
+                out.write(result)
+        finally:
+            if output:
+                out.close()
+        return read, written
+
+    def __repr__(self):
+        return f"Pipeline({' -> '.join(map(repr, self.passes))})"
+
+
+def read_blocks(filename, block_size=BLOCK_SIZE):
+    """Stream a text file as blocks of whole lines of about block_size characters."""
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        pending = ''
+        while True:
+            chunk = f.read(block_size)
+            if not chunk:
+                break
+            pending += chunk
+            cut = pending.rfind('\n') + 1
+            if cut:
+                yield pending[:cut]
+                pending = pending[cut:]
+        if pending:
+            yield pending
+
+
+REFERENCE_STEPS = [
+    (r'[\x00-\x08\x0b-\x1f\x7f-\x9f]', ''),
+    (r'[‘’‚‛′]', "'"),
+    (r'[“”„‟″]', '"'),
+    (r'[\s\t]+', ' '),
+    (r'^\s+|\s+$', ''),
+]
+
+
+def reference(text):
+    """The default pipeline as chained re.sub calls per line, as in the lessons."""
+    lines = []
+    for line in text.split('\n'):
+        for pattern, replacement in REFERENCE_STEPS:
+            line = re.sub(pattern, replacement, line)
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def benchmark(text):
+    """Time the default pipeline against reference(); returns a result dict."""
+    pipeline = Pipeline()
+    start = time.perf_counter()
+    expected = reference(text)
+    regex_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = pipeline(text)
+    pipeline_time = time.perf_counter() - start
+    return {
+        'passes': repr(pipeline),
+        'chars': len(text),
+        'same_output': result == expected,
+        'regex_mb_s': len(text) / regex_time / 1e6,
+        'pipeline_mb_s': len(text) / pipeline_time / 1e6
+    }
+
+
+def main():
+    """Normalize a text file, or benchmark the pipeline on it."""
+    parser = argparse.ArgumentParser(description="Normalize whitespace, controls and quotes in text files.")
+    parser.add_argument('file', help="text file to normalize")
+    parser.add_argument('-o', '--output', help="output file (default stdout)")
+    parser.add_argument('--steps', default=','.join(DEFAULT_STEPS),
+                        help=f"comma-separated steps from {', '.join(STEPS)} (default all)")
+    parser.add_argument('--workers', type=int, help="normalize in this many processes")
+    parser.add_argument('--benchmark', action='store_true', help="compare with chained re.sub calls")
+    args = parser.parse_args()
+
+    try:
+        if args.benchmark:
+            with open(args.file, 'r', encoding='utf-8', errors='ignore') as f:
+                r = benchmark(f.read())
+            print(f"Passes: {r['passes']}")
+            print(f"{'Chars':>10} {'re.sub MB/s':>12} {'Pipeline MB/s':>14} {'Speedup':>8}")
+            print("-" * 47)
+            note = '' if r['same_output'] else '  (MISMATCH)'
+            print(f"{r['chars']:>10} {r['regex_mb_s']:>12.1f} {r['pipeline_mb_s']:>14.1f} "
+                  f"{r['pipeline_mb_s'] / r['regex_mb_s']:>7.1f}x{note}")
+            return
+
+        try:
+            pipeline = Pipeline([step.strip() for step in args.steps.split(',') if step.strip()])
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        start = time.perf_counter()
+        read, written = pipeline.normalize_file(args.file, args.output, args.workers)
+        elapsed = time.perf_counter() - start
+        if args.output:
+            print(f"✓ {read} -> {written} characters in {elapsed:.2f}s "
+                  f"({read / elapsed / 1e6 if elapsed else 0:.1f} MB/s) saved to {args.output}")
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()